@@ -0,0 +1,153 @@
+import json
+import logging
+import time
+
+from httpx import Response, ConnectError
+
+from grafana_api.api import Api
+from grafana_api.codec import JSONCodec, get_default_codec
+from grafana_api.model import APIModel, ERROR_MESSAGES
+
+
+def legacy_check_the_api_call_response(response: any = None) -> any:
+    """The function includes the previous response check that decodes the response body up to five times
+
+    Args:
+        response (any): Specify the inserted response
+
+    Returns:
+        api_call (any): Returns the value of the api call
+    """
+
+    try:
+        json.loads(response.text)
+        valid_json: bool = True
+    except (TypeError, ValueError):
+        valid_json: bool = False
+
+    if valid_json:
+        if (
+            len(json.loads(response.text)) != 0
+            and type(json.loads(response.text)) == dict
+        ):
+            if (
+                "message" in json.loads(response.text).keys()
+                and json.loads(response.text)["message"] in ERROR_MESSAGES
+            ):
+                logging.error(json.loads(response.text)["message"])
+                raise ConnectError(str(json.loads(response.text)["message"]))
+
+        return json.loads(response.text)
+    else:
+        return response
+
+
+def create_the_dashboard_response(panels: int) -> Response:
+    """The function includes a functionality to create a large dashboard response
+
+    Args:
+        panels (int): Specify the number of the dashboard panels
+
+    Returns:
+        response (Response): Returns the response
+    """
+
+    dashboard: dict = {
+        "meta": {"slug": "benchmark", "version": 1},
+        "dashboard": {
+            "uid": "benchmark",
+            "title": "Benchmark",
+            "panels": [
+                {
+                    "id": i,
+                    "type": "timeseries",
+                    "title": f"Panel {i}",
+                    "gridPos": {"h": 8, "w": 12, "x": 0, "y": i * 8},
+                    "targets": [{"refId": "A", "expr": f"rate(metric_{i}[5m])"}],
+                    "fieldConfig": {"defaults": {"unit": "short"}, "overrides": []},
+                }
+                for i in range(panels)
+            ],
+        },
+    }
+
+    return Response(200, json=dashboard)
+
+
+def create_the_search_response(hits: int) -> Response:
+    """The function includes a functionality to create a large search response
+
+    Args:
+        hits (int): Specify the number of the search hits
+
+    Returns:
+        response (Response): Returns the response
+    """
+
+    return Response(
+        200,
+        json=[
+            {
+                "id": i,
+                "uid": f"uid-{i}",
+                "title": f"Dashboard {i}",
+                "type": "dash-db",
+                "tags": ["benchmark"],
+                "folderId": 1,
+                "folderUid": "folder",
+                "folderTitle": "Folder",
+            }
+            for i in range(hits)
+        ],
+    )
+
+
+def measure(function: callable, response: Response, rounds: int) -> float:
+    """The function includes a functionality to measure the CPU time per call
+
+    Args:
+        function (callable): Specify the measured function
+        response (Response): Specify the inserted response
+        rounds (int): Specify the number of the rounds
+
+    Returns:
+        cpu_time (float): Returns the CPU time per call in milliseconds
+    """
+
+    start: float = time.process_time()
+
+    for _ in range(rounds):
+        function(response)
+
+    return (time.process_time() - start) / rounds * 1000
+
+
+if __name__ == "__main__":
+    responses: dict = {
+        "dashboard (2000 panels)": create_the_dashboard_response(2000),
+        "search (5000 hits)": create_the_search_response(5000),
+    }
+
+    apis: dict = {
+        "current (json)": Api(APIModel(host="benchmark", codec=JSONCodec())),
+        f"current ({get_default_codec().name})": Api(APIModel(host="benchmark")),
+    }
+
+    for name, benchmark_response in responses.items():
+        size: float = len(benchmark_response.content) / 1024 / 1024
+        legacy: float = measure(
+            legacy_check_the_api_call_response, benchmark_response, 20
+        )
+        print(f"{name}, {size:.2f} MiB: legacy {legacy:.2f} ms/call")
+
+        for api_name, api in apis.items():
+            decode: float = measure(
+                api._decode_the_api_call_response, benchmark_response, 20
+            )
+            current: float = measure(
+                api._check_the_api_call_response, benchmark_response, 20
+            )
+            print(
+                f"{name}, {size:.2f} MiB: {api_name} decode {decode:.2f} ms/call, "
+                f"check {current:.2f} ms/call, speedup {legacy / current:.1f}x"
+            )
@@ -0,0 +1,86 @@
+import copy
+import random
+import time
+
+from grafana_api.dashboard_diff import diff_dashboards, patch_dashboard
+
+
+def create_the_dashboard_pair(panels: int, generator: random.Random) -> tuple:
+    """The function includes a functionality to create a dashboard and a slightly changed copy of the dashboard
+
+    Args:
+        panels (int): Specify the number of the dashboard panels
+        generator (random.Random): Specify the random generator
+
+    Returns:
+        dashboards (tuple): Returns the base and the new dashboard
+    """
+
+    base: dict = {
+        "id": 1,
+        "uid": "benchmark",
+        "title": "Benchmark",
+        "version": 1,
+        "tags": ["benchmark"],
+        "templating": {"list": [{"name": "job", "query": "label_values(job)"}]},
+        "panels": [
+            {
+                "id": i,
+                "type": "timeseries",
+                "title": f"Panel {i}",
+                "gridPos": {"h": 8, "w": 12, "x": (i % 2) * 12, "y": i * 8},
+                "targets": [{"refId": "A", "expr": f"rate(metric_{i}[5m])"}],
+                "fieldConfig": {"defaults": {"unit": "short"}, "overrides": []},
+            }
+            for i in range(panels)
+        ],
+    }
+    new: dict = copy.deepcopy(base)
+    new["version"] = 2
+    new["panels"][generator.randrange(panels)]["title"] = "Changed"
+    new["panels"].pop(generator.randrange(panels))
+    new["panels"].append({"id": panels, "type": "stat", "gridPos": {"y": 999}})
+
+    return base, new
+
+
+def measure(function: callable, pairs: list) -> float:
+    """The function includes a functionality to measure the throughput
+
+    Args:
+        function (callable): Specify the measured function
+        pairs (list): Specify the dashboard pairs
+
+    Returns:
+        throughput (float): Returns the number of the pairs per second
+    """
+
+    start: float = time.perf_counter()
+
+    for base, new in pairs:
+        function(base, new)
+
+    return len(pairs) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    random_generator: random.Random = random.Random(1)
+
+    for panel_count in [10, 50, 200]:
+        dashboard_pairs: list = [
+            create_the_dashboard_pair(panel_count, random_generator)
+            for _ in range(1000)
+        ]
+        diff: float = measure(diff_dashboards, dashboard_pairs)
+        identical: float = measure(
+            diff_dashboards,
+            [(base, copy.deepcopy(base)) for base, _ in dashboard_pairs],
+        )
+        round_trip: float = measure(
+            lambda base, new: patch_dashboard(base, diff_dashboards(base, new)),
+            dashboard_pairs,
+        )
+        print(
+            f"{panel_count} panels: diff {diff:.0f} pairs/s, "
+            f"identical {identical:.0f} pairs/s, diff and patch {round_trip:.0f} pairs/s"
+        )
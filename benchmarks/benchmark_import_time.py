@@ -0,0 +1,61 @@
+import statistics
+import subprocess
+import sys
+
+
+def measure(statement: str, rounds: int) -> float:
+    """The function includes a functionality to measure the wall time of a statement inside fresh interpreter processes
+
+    Args:
+        statement (str): Specify the measured statement
+        rounds (int): Specify the number of the rounds
+
+    Returns:
+        wall_time (float): Returns the median wall time in milliseconds
+    """
+
+    code: str = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print((time.perf_counter() - start) * 1000)\n"
+    )
+
+    return statistics.median(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(rounds)
+    )
+
+
+if __name__ == "__main__":
+    rounds: int = 15
+
+    package_import: float = measure("import grafana_api", rounds)
+    dashboard_import: float = measure("from grafana_api import Dashboard", rounds)
+    httpx_import: float = measure("import httpx", rounds)
+    model_import: float = measure("import grafana_api.model", rounds)
+    ssl_context: float = measure(
+        "import httpx; start = time.perf_counter(); httpx.create_ssl_context()",
+        rounds,
+    )
+    eager_model_import: float = measure(
+        "import grafana_api.model; import httpx; httpx.create_ssl_context()",
+        rounds,
+    )
+
+    print(f"import grafana_api: {package_import:.1f} ms")
+    print(f"from grafana_api import Dashboard: {dashboard_import:.1f} ms")
+    print(f"import httpx: {httpx_import:.1f} ms")
+    print(f"import grafana_api.model (lazy httpx and ssl context): {model_import:.1f} ms")
+    print(f"httpx.create_ssl_context(): {ssl_context:.1f} ms")
+    print(
+        f"import grafana_api.model (eager httpx and ssl context): {eager_model_import:.1f} ms, "
+        f"saved {eager_model_import - model_import:.1f} ms per process"
+    )
@@ -0,0 +1,93 @@
+import json
+import tracemalloc
+
+import httpx
+
+from grafana_api.api import Api
+from grafana_api.model import APIModel
+
+
+def create_the_search_body(hits: int) -> iter:
+    """The function includes a functionality to create a large search response body in chunks
+
+    Args:
+        hits (int): Specify the number of the search hits
+
+    Returns:
+        body (iter): Returns an iterator over the chunks of the body
+    """
+
+    yield b"["
+
+    for i in range(hits):
+        hit: dict = {
+            "id": i,
+            "uid": f"uid-{i}",
+            "title": f"Dashboard {i}",
+            "type": "dash-db",
+            "tags": ["benchmark"],
+            "folderUid": "folder",
+            "folderTitle": "Folder",
+        }
+        yield (b"," if i else b"") + json.dumps(hit).encode("utf-8")
+
+    yield b"]"
+
+
+def create_the_model(hits: int) -> APIModel:
+    """The function includes a functionality to create a model whose client responds with a large search response
+
+    Args:
+        hits (int): Specify the number of the search hits
+
+    Returns:
+        model (APIModel): Returns the model
+    """
+
+    model: APIModel = APIModel(host="https://benchmark")
+    model._http_client = httpx.Client(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=create_the_search_body(hits))
+        )
+    )
+
+    return model
+
+
+def measure(function: callable) -> tuple:
+    """The function includes a functionality to measure the peak memory of a function
+
+    Args:
+        function (callable): Specify the measured function
+
+    Returns:
+        result (tuple): Returns the result of the function and the peak memory in MiB
+    """
+
+    tracemalloc.start()
+    result: any = function()
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return result, peak / 1024 / 1024
+
+
+if __name__ == "__main__":
+    hits: int = 50000
+
+    with create_the_model(hits) as model:
+        count, materialized = measure(
+            lambda: len(Api(model).call_the_api("/api/search?limit=5000"))
+        )
+        print(f"call_the_api, {count} hits: peak {materialized:.1f} MiB")
+
+    with create_the_model(hits) as model:
+        count, streamed = measure(
+            lambda: sum(
+                1
+                for _ in Api(model).stream_the_api(
+                    "/api/search?limit=5000", json_array=True
+                )
+            )
+        )
+        print(f"stream_the_api, {count} hits: peak {streamed:.2f} MiB")
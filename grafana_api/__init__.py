@@ -0,0 +1,129 @@
+import importlib
+
+# The constant maps the public classes of the package to the corresponding submodules. The submodules and their
+# dependencies e.g. httpx are imported on the first attribute access to keep the import of the package cheap.
+_LAZY_ATTRIBUTES: dict = {
+    "APIModel": "model",
+    "APIEndpoints": "model",
+    "RequestsMethods": "model",
+    "SortDirection": "model",
+    "RetryPolicy": "model",
+    "RateLimit": "model",
+    "CachePolicy": "model",
+    "SearchHit": "model",
+    "SearchIndex": "search",
+    "FolderNode": "model",
+    "FolderTree": "folder",
+    "diff_dashboards": "dashboard_diff",
+    "patch_dashboard": "dashboard_diff",
+    "PermissionDiff": "model",
+    "PermissionReconciler": "permission_reconciler",
+    "APIStatistics": "model",
+    "BatchOperation": "model",
+    "BatchResult": "model",
+    "Api": "api",
+    "AsyncApi": "api",
+    "JSONCodec": "codec",
+    "OrjsonCodec": "codec",
+    "UjsonCodec": "codec",
+    "Admin": "admin",
+    "Alerting": "alerting",
+    "AlertingNotifications": "alerting_notifications",
+    "AlertingProvisioning": "alerting_provisioning",
+    "Annotations": "annotations",
+    "Authentication": "authentication",
+    "Correlations": "correlations",
+    "Dashboard": "dashboard",
+    "Datasource": "datasource",
+    "DatasourceQueryResourceCaching": "datasource",
+    "DatasourceRegistry": "datasource",
+    "ExternalGroup": "external_group",
+    "Folder": "folder",
+    "LegacyPlaylist": "legacy_playlist",
+    "Library": "library",
+    "Licensing": "licensing",
+    "Organisation": "organisation",
+    "OrganisationAdmin": "organisation",
+    "OtherHTTP": "other_http",
+    "Playlist": "playlist",
+    "Preferences": "preferences",
+    "QueryHistory": "query_history",
+    "RBAC": "rbac",
+    "Reporting": "reporting",
+    "Search": "search",
+    "ServiceAccount": "service_account",
+    "ShortUrl": "short_url",
+    "Snapshot": "snapshot",
+    "Team": "team",
+    "User": "user",
+    "CurrentUser": "user",
+    "AsyncAdmin": "asynchronous",
+    "AsyncAlerting": "asynchronous",
+    "AsyncAlertingNotifications": "asynchronous",
+    "AsyncAlertingProvisioning": "asynchronous",
+    "AsyncAnnotations": "asynchronous",
+    "AsyncAuthentication": "asynchronous",
+    "AsyncCorrelations": "asynchronous",
+    "AsyncDashboard": "asynchronous",
+    "AsyncDatasource": "asynchronous",
+    "AsyncDatasourceQueryResourceCaching": "asynchronous",
+    "AsyncExternalGroup": "asynchronous",
+    "AsyncFolder": "asynchronous",
+    "AsyncLegacyAlerting": "asynchronous",
+    "AsyncLegacyPlaylist": "asynchronous",
+    "AsyncLibrary": "asynchronous",
+    "AsyncLicensing": "asynchronous",
+    "AsyncOrganisation": "asynchronous",
+    "AsyncOrganisationAdmin": "asynchronous",
+    "AsyncOtherHTTP": "asynchronous",
+    "AsyncPermissionReconciler": "asynchronous",
+    "AsyncPlaylist": "asynchronous",
+    "AsyncPreferences": "asynchronous",
+    "AsyncQueryHistory": "asynchronous",
+    "AsyncRBAC": "asynchronous",
+    "AsyncReporting": "asynchronous",
+    "AsyncSearch": "asynchronous",
+    "AsyncServiceAccount": "asynchronous",
+    "AsyncShortUrl": "asynchronous",
+    "AsyncSnapshot": "asynchronous",
+    "AsyncTeam": "asynchronous",
+    "AsyncUser": "asynchronous",
+    "AsyncCurrentUser": "asynchronous",
+}
+
+# The legacy alerting class shares the name with the current alerting class and is exposed under an alias
+_LAZY_ALIASES: dict = {"LegacyAlerting": ("legacy_alerting", "Alerting")}
+
+__all__: list = sorted([*_LAZY_ATTRIBUTES, *_LAZY_ALIASES])
+
+
+def __getattr__(name: str) -> any:
+    """The function includes a functionality to import the corresponding submodule of a public class on the first access
+
+    Args:
+        name (str): Specify the name of the attribute
+
+    Raises:
+        AttributeError: The package has no attribute with the name
+
+    Returns:
+        attribute (any): Returns the public class
+    """
+
+    if name in _LAZY_ATTRIBUTES:
+        module_name, attribute_name = _LAZY_ATTRIBUTES[name], name
+    elif name in _LAZY_ALIASES:
+        module_name, attribute_name = _LAZY_ALIASES[name]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    attribute: any = getattr(
+        importlib.import_module(f".{module_name}", __name__), attribute_name
+    )
+    globals()[name] = attribute
+
+    return attribute
+
+
+def __dir__() -> list:
+    return sorted([*globals(), *__all__])
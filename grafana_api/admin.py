@@ -1,6 +1,5 @@
-import json
 import logging
-from httpx import Response
+from typing import TYPE_CHECKING
 
 from .model import (
     APIModel,
@@ -10,6 +9,9 @@ from .model import (
 )
 from .api import Api
 
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
+
 
 class Admin:
     """The class includes all necessary methods to access the Grafana admin API endpoints. Be aware that all functionalities inside the class only working with basic authentication (username and password) and that the authenticated user is a Grafana Admin.
@@ -72,7 +74,7 @@ class Admin:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ADMIN.value}/settings",
                 RequestsMethods.PUT,
-                json.dumps(settings_update),
+                settings_update,
             )
 
             if api_call.get("message") != "Settings updated":
@@ -160,7 +162,7 @@ class Admin:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ADMIN.value}/users",
                 RequestsMethods.POST,
-                json.dumps(user_object),
+                user_object,
             )
 
             if api_call.get("message") != "User created":
@@ -191,7 +193,7 @@ class Admin:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ADMIN.value}/users/{id}/password",
                 RequestsMethods.PUT,
-                json.dumps(dict({"password": password})),
+                dict({"password": password}),
             )
 
             if api_call.get("message") != "User password updated":
@@ -224,7 +226,7 @@ class Admin:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ADMIN.value}/users/{id}/permissions",
                 RequestsMethods.PUT,
-                json.dumps(dict({"isGrafanaAdmin": is_grafana_admin})),
+                dict({"isGrafanaAdmin": is_grafana_admin}),
             )
 
             if api_call.get("message") != "User permissions updated":
@@ -281,7 +283,7 @@ class Admin:
         api_call: dict = Api(self.grafana_api_model).call_the_api(
             f"{APIEndpoints.ADMIN.value}/pause-all-alerts",
             RequestsMethods.POST,
-            json.dumps(dict({"paused": True})),
+            dict({"paused": True}),
         )
 
         if api_call.get("state") != "Paused":
@@ -304,7 +306,7 @@ class Admin:
         api_call: dict = Api(self.grafana_api_model).call_the_api(
             f"{APIEndpoints.ADMIN.value}/pause-all-alerts",
             RequestsMethods.POST,
-            json.dumps(dict({"paused": False})),
+            dict({"paused": False}),
         )
 
         if api_call.get("state") != "Unpaused":
@@ -360,7 +362,7 @@ class Admin:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ADMIN.value}/users/{id}/revoke-auth-token",
                 RequestsMethods.POST,
-                json.dumps(dict({"authTokenId": auth_token_id})),
+                dict({"authTokenId": auth_token_id}),
             )
 
             if api_call.get("message") != "User auth token revoked":
@@ -390,7 +392,7 @@ class Admin:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ADMIN.value}/users/{id}/logout",
                 RequestsMethods.POST,
-                json.dumps(dict()),
+                dict(),
             )
 
             if api_call.get("message") != "User auth token revoked":
@@ -415,7 +417,7 @@ class Admin:
         api_call: dict = Api(self.grafana_api_model).call_the_api(
             f"{APIEndpoints.ADMIN.value}/provisioning/dashboards/reload",
             RequestsMethods.POST,
-            json.dumps(dict()),
+            dict(),
         )
 
         if api_call.get("message") != "Dashboards config reloaded":
@@ -437,7 +439,7 @@ class Admin:
         api_call: dict = Api(self.grafana_api_model).call_the_api(
             f"{APIEndpoints.ADMIN.value}/provisioning/datasources/reload",
             RequestsMethods.POST,
-            json.dumps(dict()),
+            dict(),
         )
 
         if api_call.get("message") != "Datasources config reloaded":
@@ -459,7 +461,7 @@ class Admin:
         api_call: dict = Api(self.grafana_api_model).call_the_api(
             f"{APIEndpoints.ADMIN.value}/provisioning/plugins/reload",
             RequestsMethods.POST,
-            json.dumps(dict()),
+            dict(),
         )
 
         if api_call.get("message") != "Plugins config reloaded":
@@ -481,7 +483,7 @@ class Admin:
         api_call: dict = Api(self.grafana_api_model).call_the_api(
             f"{APIEndpoints.ADMIN.value}/provisioning/notifications/reload",
             RequestsMethods.POST,
-            json.dumps(dict()),
+            dict(),
         )
 
         if api_call.get("message") != "Notifications config reloaded":
@@ -503,7 +505,7 @@ class Admin:
         api_call: dict = Api(self.grafana_api_model).call_the_api(
             f"{APIEndpoints.ADMIN.value}/provisioning/access-control/reload",
             RequestsMethods.POST,
-            json.dumps(dict()),
+            dict(),
         )
 
         if api_call.get("message") != "Accesscontrol config reloaded":
@@ -525,7 +527,7 @@ class Admin:
         api_call: dict = Api(self.grafana_api_model).call_the_api(
             f"{APIEndpoints.ADMIN.value}/ldap/reload",
             RequestsMethods.POST,
-            json.dumps(dict()),
+            dict(),
         )
 
         if api_call.get("message") != "LDAP config reloaded":
@@ -544,10 +546,10 @@ class Admin:
             None
         """
 
-        api_call: Response = Api(self.grafana_api_model).call_the_api(
+        api_call: "httpx.Response" = Api(self.grafana_api_model).call_the_api(
             f"{APIEndpoints.ADMIN.value}/encryption/rotate-data-keys",
             RequestsMethods.POST,
-            json.dumps(dict()),
+            dict(),
         )
 
         if api_call.status_code != 204:
@@ -1,5 +1,4 @@
 import datetime
-import json
 import logging
 
 from .model import (
@@ -93,7 +92,7 @@ class Alerting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTS_ALERTMANAGER.value}/{recipient}/api/v2/alerts/groups",
                 RequestsMethods.POST,
-                json.dumps(alerts_json_list),
+                alerts_json_list,
             )
 
             if api_call != dict():
@@ -269,7 +268,7 @@ class Alerting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTS_ALERTMANAGER.value}/{recipient}/api/v2/silences",
                 RequestsMethods.POST,
-                json.dumps(silence_json_dict),
+                silence_json_dict,
             )
 
             if api_call == dict() or api_call.get("id") is None:
@@ -419,7 +418,7 @@ class Alerting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTS_ALERTMANAGER.value}/{recipient}/config/api/v1/alerts",
                 RequestsMethods.POST,
-                json.dumps(alertmanager_configuration_json_dict),
+                alertmanager_configuration_json_dict,
             )
 
             if (
@@ -490,7 +489,7 @@ class Alerting:
             api_call: any = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTS_ALERTMANAGER.value}/{recipient}/config/api/v1/receivers/test",
                 RequestsMethods.POST,
-                json.dumps(alertmanager_receivers_json_dict),
+                alertmanager_receivers_json_dict,
                 response_status_code=True,
             )
 
@@ -731,13 +730,11 @@ class Alerting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTS_RULER.value}/{recipient}/api/v1/rules/{namespace}",
                 RequestsMethods.POST,
-                json.dumps(
-                    {
-                        "interval": interval,
-                        "name": group_name,
-                        "rules": rules_json_list,
-                    }
-                ),
+                {
+                    "interval": interval,
+                    "name": group_name,
+                    "rules": rules_json_list,
+                },
             )
 
             if api_call != dict():
@@ -869,12 +866,10 @@ class Alerting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 "/api/v1/eval",
                 RequestsMethods.POST,
-                json.dumps(
-                    {
-                        "data": datasource_rule_query_objects_json,
-                        "now": str(datetime.datetime.now()),
-                    }
-                ),
+                {
+                    "data": datasource_rule_query_objects_json,
+                    "now": str(datetime.datetime.now()),
+                },
             )
 
             if api_call == dict() or api_call.get("message") is not None:
@@ -940,16 +935,14 @@ class Alerting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"/api/v1/rule/test/{recipient}",
                 RequestsMethods.POST,
-                json.dumps(
-                    {
-                        "expr": expr,
-                        "grafana_condition": {
-                            "condition": condition,
-                            "data": datasource_rule_query_objects_json,
-                            "now": str(datetime.datetime.now()),
-                        },
-                    }
-                ),
+                {
+                    "expr": expr,
+                    "grafana_condition": {
+                        "condition": condition,
+                        "data": datasource_rule_query_objects_json,
+                        "now": str(datetime.datetime.now()),
+                    },
+                },
             )
 
             if api_call == dict() or api_call.get("message") is not None:
@@ -1040,12 +1033,10 @@ class Alerting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERTS_NGALERT.value}/admin_config",
                 RequestsMethods.POST,
-                json.dumps(
-                    {
-                        "Alertmanagers": alert_managers,
-                        "alertmanagersChoice": alertmanagers_choice,
-                    }
-                ),
+                {
+                    "Alertmanagers": alert_managers,
+                    "alertmanagersChoice": alertmanagers_choice,
+                },
             )
 
             if api_call != dict():
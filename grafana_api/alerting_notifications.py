@@ -1,4 +1,3 @@
-import json
 import logging
 
 from .model import APIModel, APIEndpoints, RequestsMethods
@@ -136,7 +135,7 @@ class AlertingNotifications:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.ALERT_NOTIFICATIONS.value,
                 RequestsMethods.POST,
-                json.dumps(notification_channel),
+                notification_channel,
             )
 
             if api_call == dict() or api_call.get("id") is None:
@@ -169,7 +168,7 @@ class AlertingNotifications:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERT_NOTIFICATIONS.value}/uid/{uid}",
                 RequestsMethods.PUT,
-                json.dumps(notification_channel),
+                notification_channel,
             )
 
             if api_call == dict() or api_call.get("id") is None:
@@ -202,7 +201,7 @@ class AlertingNotifications:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERT_NOTIFICATIONS.value}/{id}",
                 RequestsMethods.PUT,
-                json.dumps(notification_channel),
+                notification_channel,
             )
 
             if api_call == dict() or api_call.get("id") is None:
@@ -290,7 +289,7 @@ class AlertingNotifications:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.ALERT_NOTIFICATIONS.value}/test",
                 RequestsMethods.POST,
-                json.dumps(notification_channel),
+                notification_channel,
             )
 
             if api_call.get("message") != "Test notification sent":
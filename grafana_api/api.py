@@ -1,13 +1,57 @@
 import logging
-import json
 import base64
-from typing import Union
+import collections
+import contextlib
+import contextvars
+import datetime
+import email.utils
+import random
+import threading
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Union, Iterator, AsyncIterator, TYPE_CHECKING
 
-import httpx
-from httpx import ConnectError
-import asyncio
+from .model import (
+    RequestsMethods,
+    ERROR_MESSAGES,
+    APIModel,
+    BatchOperation,
+    BatchResult,
+    RetryPolicy,
+)
+from .cache import ResponseCache, ValidatorCache, LookupCache
+from .codec import JSONArrayDecoder
+from .rate_limiter import RateLimiter
 
-from .model import RequestsMethods, ERROR_MESSAGES, APIModel
+# The asyncio, httpx and ssl modules are imported on the first use to keep the import of the API and the domain classes cheap
+if TYPE_CHECKING:  # pragma: no cover
+    import asyncio
+    import ssl
+
+    import httpx
+
+# The context variable includes the event loop of the AsyncApi, if the API calls of the current context should be forwarded to the asynchronous HTTP client.
+_event_loop: contextvars.ContextVar = contextvars.ContextVar(
+    "grafana_api_event_loop", default=None
+)
+
+# The thread local storage marks the worker threads of the shared thread pools.
+_worker_thread: threading.local = threading.local()
+
+
+class _CoalescedRequestCancelled(Exception):
+    """The class includes the exception that is set on the shared future of a coalesced request, if the caller that sends the request is cancelled. The waiting callers catch the exception and one of them sends the request again"""
+
+
+def _mark_the_worker_thread():
+    """The function includes a functionality to mark the current thread as worker thread of a shared thread pool
+
+    Returns:
+        None
+    """
+
+    _worker_thread.active = True
 
 
 class Api:
@@ -27,7 +71,7 @@ class Api:
         self,
         api_call: str,
         method: RequestsMethods = RequestsMethods.GET,
-        json_complete: str = None,
+        json_complete: any = None,
         org_id_header: int = None,
         disable_provenance_header: bool = False,
         response_status_code: bool = False,
@@ -37,7 +81,7 @@ class Api:
         Args:
             api_call (str): Specify the API call endpoint
             method (RequestsMethods): Specify the used method (default GET)
-            json_complete (str): Specify the inserted JSON as string
+            json_complete (any): Specify the inserted JSON as string, as bytes or as JSON serializable object that is encoded by the codec of the model
             org_id_header (int): Specify the optional organization id as header for the corresponding API call
             disable_provenance_header (bool): Specify the optional disable provenance as header for the corresponding API call (default False)
             response_status_code (bool): Specify if the response should include the original status code (default False)
@@ -49,7 +93,151 @@ class Api:
             api_call (any): Returns the value of the api call
         """
 
+        event_loop: asyncio.AbstractEventLoop = _event_loop.get()
+
+        if event_loop is not None:
+            import asyncio
+
+            return asyncio.run_coroutine_threadsafe(
+                AsyncApi(self.grafana_api_model).call_the_api(
+                    api_call,
+                    method,
+                    json_complete,
+                    org_id_header,
+                    disable_provenance_header,
+                    response_status_code,
+                ),
+                event_loop,
+            ).result()
+
+        return self._execute_the_api_call(
+            self.get_the_http_api_client(),
+            method,
+            f"{self.grafana_api_model.host}{api_call}",
+            response_status_code,
+            self._encode_the_json_complete(json_complete),
+            self._create_the_headers(org_id_header, disable_provenance_header),
+        )
+
+    def stream_the_api(
+        self,
+        api_call: str,
+        json_array: bool = False,
+        org_id_header: int = None,
+        chunk_size: int = None,
+    ) -> Iterator[any]:
+        """The method includes a functionality to stream the body of a GET API call instead of loading the complete body into memory. The response cache, the conditional requests and the retries are not used for the streamed API calls
+
+        Args:
+            api_call (str): Specify the API call endpoint
+            json_array (bool): Specify if the elements of the top-level JSON array of the body should be decoded incrementally instead of yielding the raw chunks of the body (default False)
+            org_id_header (int): Specify the optional organization id as header for the corresponding API call
+            chunk_size (int): Specify the optional size of the read chunks in bytes (default None)
+
+        Raises:
+            ValueError: The body is not a valid JSON array
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (Iterator[any]): Returns an iterator over the chunks of the body or over the elements of the JSON array
+        """
+
         api_url: str = f"{self.grafana_api_model.host}{api_call}"
+        http: httpx.Client = self.get_the_http_api_client()
+
+        with self._limit_the_request(api_url):
+            self.grafana_api_model.statistics.increment("requests")
+
+            with http.stream(
+                "GET", api_url, headers=self._create_the_headers(org_id_header)
+            ) as response:
+                if response.is_error:
+                    response.read()
+                    self._check_the_stream_response(response)
+
+                if json_array:
+                    json_array_decoder: JSONArrayDecoder = JSONArrayDecoder()
+
+                    for chunk in response.iter_bytes(chunk_size):
+                        yield from json_array_decoder.feed(chunk)
+
+                    yield from json_array_decoder.feed(b"", final=True)
+                else:
+                    yield from response.iter_bytes(chunk_size)
+
+    def _check_the_stream_response(self, response: "httpx.Response"):
+        """The method includes a functionality to check the error response of a streamed API call
+
+        Args:
+            response (httpx.Response): Specify the read error response
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        self._check_the_api_call_response(response)
+        logging.error(f"Check the error: {response.text}.")
+        raise Exception
+
+    def _encode_the_json_complete(self, json_complete: any) -> Union[str, bytes]:
+        """The method includes a functionality to encode the inserted JSON with the codec of the model. Strings and bytes are forwarded unchanged
+
+        Args:
+            json_complete (any): Specify the inserted JSON as string, as bytes or as JSON serializable object
+
+        Returns:
+            json_complete (Union[str, bytes]): Returns the encoded JSON
+        """
+
+        if json_complete is None or isinstance(json_complete, (str, bytes)):
+            return json_complete
+
+        return self.grafana_api_model.codec.dumps(json_complete)
+
+    def _create_the_headers(
+        self, org_id_header: int = None, disable_provenance_header: bool = False
+    ) -> Union[dict, None]:
+        """The method includes a functionality to create the per-call headers of an API call. The authentication and the static headers are applied as default headers of the shared clients
+
+        Args:
+            org_id_header (int): Specify the optional organization id as header for the corresponding API call
+            disable_provenance_header (bool): Specify the optional disable provenance as header for the corresponding API call (default False)
+
+        Returns:
+            headers (Union[dict, None]): Returns the per-call headers or None, if there are no per-call headers
+        """
+
+        headers: dict = None
+
+        if org_id_header is not None and isinstance(org_id_header, int):
+            headers = {"X-Grafana-Org-Id": f"{org_id_header}"}
+
+        if isinstance(disable_provenance_header, bool) and disable_provenance_header:
+            headers = headers or dict()
+            headers["X-Disable-Provenance"] = f"{disable_provenance_header}"
+
+        return headers
+
+    def get_the_default_headers(self) -> dict:
+        """The method includes a functionality to get the authentication and the static headers of the Grafana API model. The headers are created once and only rebuilt if the credentials of the model change. In this case, the default headers of the existing shared clients are updated as well
+
+        Returns:
+            headers (dict): Returns the default headers
+        """
+
+        credentials: tuple = (
+            self.grafana_api_model.token,
+            self.grafana_api_model.username,
+            self.grafana_api_model.password,
+        )
+        default_headers: tuple = self.grafana_api_model._default_headers
+
+        if default_headers is not None and default_headers[0] == credentials:
+            return default_headers[1]
+
         headers: dict = dict(
             {"Authorization": f"Bearer {self.grafana_api_model.token}"},
         )
@@ -58,47 +246,36 @@ class Api:
             self.grafana_api_model.username is not None
             and self.grafana_api_model.password is not None
         ):
-            credentials: str = base64.b64encode(
+            basic_credentials: str = base64.b64encode(
                 str.encode(
                     f"{self.grafana_api_model.username}:{self.grafana_api_model.password}"
                 )
             ).decode("utf-8")
-            headers.update({"Authorization": f"Basic {credentials}"})
+            headers.update({"Authorization": f"Basic {basic_credentials}"})
 
         headers["Content-Type"] = "application/json"
         headers["Accept"] = "application/json"
 
-        if org_id_header is not None and isinstance(org_id_header, int):
-            headers["X-Grafana-Org-Id"] = org_id_header
-
-        if isinstance(disable_provenance_header, bool) and disable_provenance_header:
-            headers["X-Disable-Provenance"] = f"{disable_provenance_header}"
-
-        http: Union[httpx.Client, httpx.AsyncClient] = self.create_the_http_api_client(
-            headers
-        )
+        with self.grafana_api_model._lock:
+            self.grafana_api_model._default_headers = (credentials, headers)
 
-        if self.grafana_api_model.http2_support:
-
-            async def _execute_async_api_call():
-                async with http:
-                    return await self._execute_the_async_api_call(
-                        http, method, api_url, response_status_code, json_complete
-                    )
-
-            return asyncio.run(_execute_async_api_call())
+            for http in (
+                self.grafana_api_model._http_client,
+                *self.grafana_api_model._async_http_clients.values(),
+            ):
+                if http is not None:
+                    http.headers.update(headers)
 
-        return self._execute_the_api_call(
-            http, method, api_url, response_status_code, json_complete
-        )
+        return headers
 
     def _execute_the_api_call(
         self,
-        http: httpx.Client,
+        http: "httpx.Client",
         method: RequestsMethods,
         api_url: str,
         response_status_code: bool,
-        json_complete: str,
+        json_complete: Union[str, bytes],
+        headers: dict = None,
     ) -> any:
         """The method includes a functionality to execute a synchronous api call
 
@@ -107,7 +284,8 @@ class Api:
             method (RequestsMethods): Specify the used method
             api_url (str): Specify the used api url
             response_status_code (bool): Specify if the response code should be returned
-            json_complete (str): Specify the forwarded json in case of patch, post or put calls
+            json_complete (Union[str, bytes]): Specify the forwarded json in case of patch, post or put calls
+            headers (dict): Specify the optional headers of the api call (default None)
 
         Raises:
             Exception: Unspecified error by executing the API call
@@ -119,13 +297,15 @@ class Api:
         try:
             if method.value == RequestsMethods.GET.value:
                 return self._check_the_api_call_response(
-                    http.request("GET", api_url),
+                    self._request_the_api(http, "GET", api_url, headers=headers),
                     response_status_code,
                 )
             elif method.value == RequestsMethods.PUT.value:
                 if json_complete is not None:
                     return self._check_the_api_call_response(
-                        http.request("PUT", api_url, content=json_complete),
+                        self._request_the_api(
+                            http, "PUT", api_url, content=json_complete, headers=headers
+                        ),
                         response_status_code,
                     )
                 else:
@@ -134,7 +314,13 @@ class Api:
             elif method.value == RequestsMethods.POST.value:
                 if json_complete is not None:
                     return self._check_the_api_call_response(
-                        http.request("POST", api_url, content=json_complete),
+                        self._request_the_api(
+                            http,
+                            "POST",
+                            api_url,
+                            content=json_complete,
+                            headers=headers,
+                        ),
                         response_status_code,
                     )
                 else:
@@ -143,7 +329,13 @@ class Api:
             elif method.value == RequestsMethods.PATCH.value:
                 if json_complete is not None:
                     return self._check_the_api_call_response(
-                        http.request("PATCH", api_url, content=json_complete),
+                        self._request_the_api(
+                            http,
+                            "PATCH",
+                            api_url,
+                            content=json_complete,
+                            headers=headers,
+                        ),
                         response_status_code,
                     )
                 else:
@@ -151,7 +343,8 @@ class Api:
                     raise Exception
             elif method.value == RequestsMethods.DELETE.value:
                 return self._check_the_api_call_response(
-                    http.request("DELETE", api_url), response_status_code
+                    self._request_the_api(http, "DELETE", api_url, headers=headers),
+                    response_status_code,
                 )
             else:
                 logging.error("Please define a valid method.")
@@ -161,11 +354,12 @@ class Api:
 
     async def _execute_the_async_api_call(
         self,
-        http: httpx.AsyncClient,
+        http: "httpx.AsyncClient",
         method: RequestsMethods,
         api_url: str,
         response_status_code: bool,
-        json_complete: str,
+        json_complete: Union[str, bytes],
+        headers: dict = None,
     ):
         """The method includes a functionality to execute an asynchronous api call
 
@@ -174,7 +368,8 @@ class Api:
             method (RequestsMethods): Specify the used method
             api_url (str): Specify the used api url
             response_status_code (bool): Specify if the response code should be returned
-            json_complete (str): Specify the forwarded json in case of patch, post or put calls
+            json_complete (Union[str, bytes]): Specify the forwarded json in case of patch, post or put calls
+            headers (dict): Specify the optional headers of the api call (default None)
 
         Raises:
             Exception: Unspecified error by executing the API call
@@ -186,13 +381,17 @@ class Api:
         try:
             if method.value == RequestsMethods.GET.value:
                 return self._check_the_api_call_response(
-                    await http.request("GET", api_url),
+                    await self._request_the_async_api(
+                        http, "GET", api_url, headers=headers
+                    ),
                     response_status_code,
                 )
             elif method.value == RequestsMethods.PUT.value:
                 if json_complete is not None:
                     return self._check_the_api_call_response(
-                        await http.request("PUT", api_url, content=json_complete),
+                        await self._request_the_async_api(
+                            http, "PUT", api_url, content=json_complete, headers=headers
+                        ),
                         response_status_code,
                     )
                 else:
@@ -201,7 +400,13 @@ class Api:
             elif method.value == RequestsMethods.POST.value:
                 if json_complete is not None:
                     return self._check_the_api_call_response(
-                        await http.request("POST", api_url, content=json_complete),
+                        await self._request_the_async_api(
+                            http,
+                            "POST",
+                            api_url,
+                            content=json_complete,
+                            headers=headers,
+                        ),
                         response_status_code,
                     )
                 else:
@@ -210,7 +415,13 @@ class Api:
             elif method.value == RequestsMethods.PATCH.value:
                 if json_complete is not None:
                     return self._check_the_api_call_response(
-                        await http.request("PATCH", api_url, content=json_complete),
+                        await self._request_the_async_api(
+                            http,
+                            "PATCH",
+                            api_url,
+                            content=json_complete,
+                            headers=headers,
+                        ),
                         response_status_code,
                     )
                 else:
@@ -218,7 +429,10 @@ class Api:
                     raise Exception
             elif method.value == RequestsMethods.DELETE.value:
                 return self._check_the_api_call_response(
-                    await http.request("DELETE", api_url), response_status_code
+                    await self._request_the_async_api(
+                        http, "DELETE", api_url, headers=headers
+                    ),
+                    response_status_code,
                 )
             else:
                 logging.error("Please define a valid method.")
@@ -226,118 +440,1254 @@ class Api:
         except Exception as e:
             raise e
 
-    @staticmethod
-    def _check_the_api_call_response(
-        response: any = None, response_status_code: bool = False
-    ) -> any:
-        """The method includes a functionality to check the output of API call method for errors
+    def _request_the_api(
+        self,
+        http: "httpx.Client",
+        method: str,
+        api_url: str,
+        content: Union[str, bytes] = None,
+        headers: dict = None,
+    ) -> "httpx.Response":
+        """The method includes a functionality to serve a synchronous request from the response caches of the model or to send the request and to update the response caches
 
         Args:
-            response (any): Specify the inserted response
-            response_status_code (bool): Specify if the original status code should be attached to the result (default False)
+            http (httpx.Client): Specify the used synchronous client
+            method (str): Specify the used method
+            api_url (str): Specify the used api url
+            content (Union[str, bytes]): Specify the optional request body (default None)
+            headers (dict): Specify the optional headers of the api call (default None)
 
         Raises:
             Exception: Unspecified error by executing the API call
 
         Returns:
-            api_call (any): Returns the value of the api call
+            response (httpx.Response): Returns the response
         """
 
-        if Api._check_if_valid_json(response.text):
-            if (
-                len(json.loads(response.text)) != 0
-                and type(json.loads(response.text)) == dict
-            ):
-                if (
-                    "message" in json.loads(response.text).keys()
-                    and json.loads(response.text)["message"] in ERROR_MESSAGES
-                ):
-                    logging.error(json.loads(response.text)["message"])
-                    raise ConnectError(str(json.loads(response.text)["message"]))
+        if not self._check_if_cached_request():
+            return self._send_the_request(http, method, api_url, content, headers)
 
-            json_response: Union[dict, list] = json.loads(response.text)
+        cache_key, response, headers = self._prepare_the_cached_request(
+            method, api_url, headers
+        )
 
-            if isinstance(json_response, dict) and response_status_code:
-                json_response.update({"status": response.status_code})
-            elif isinstance(json_response, list) and response_status_code:
-                json_response[0].update({"status": response.status_code})
-            return json_response
-        else:
-            if response_status_code:
-                return dict({"status": response.status_code, "data": response.text})
-            else:
-                return response
+        if response is None:
+            response = self._send_the_coalesced_request(
+                cache_key,
+                lambda: self._update_the_cached_response(
+                    cache_key,
+                    self._send_the_request(http, method, api_url, content, headers),
+                ),
+            )
 
-    @staticmethod
-    def _check_if_valid_json(response: any) -> bool:
-        """The method includes a functionality to check if the response json is valid
+        return response
+
+    async def _request_the_async_api(
+        self,
+        http: "httpx.AsyncClient",
+        method: str,
+        api_url: str,
+        content: Union[str, bytes] = None,
+        headers: dict = None,
+    ) -> "httpx.Response":
+        """The method includes a functionality to serve an asynchronous request from the response caches of the model or to send the request and to update the response caches
 
         Args:
-            response (any): Specify the inserted response json
+            http (httpx.AsyncClient): Specify the used asynchronous client
+            method (str): Specify the used method
+            api_url (str): Specify the used api url
+            content (Union[str, bytes]): Specify the optional request body (default None)
+            headers (dict): Specify the optional headers of the api call (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
 
         Returns:
-            result (bool): Returns if the json is valid or not
+            response (httpx.Response): Returns the response
         """
 
-        try:
-            json.loads(response)
-        except (TypeError, ValueError):
-            return False
-        return True
+        if not self._check_if_cached_request():
+            return await self._send_the_async_request(
+                http, method, api_url, content, headers
+            )
 
-    @staticmethod
-    def prepare_api_string(query_string: str) -> str:
-        """The method includes a functionality to prepare the api string for the queries
+        cache_key, response, headers = self._prepare_the_cached_request(
+            method, api_url, headers
+        )
+
+        if response is None:
+
+            async def _send_the_cached_request() -> "httpx.Response":
+                return self._update_the_cached_response(
+                    cache_key,
+                    await self._send_the_async_request(
+                        http, method, api_url, content, headers
+                    ),
+                )
+
+            response = await self._send_the_coalesced_async_request(
+                cache_key, _send_the_cached_request
+            )
+
+        return response
+
+    def _check_if_cached_request(self) -> bool:
+        """The method includes a functionality to check if the requests pass the response cache, the conditional requests or the request coalescing of the model
+
+        Returns:
+            cached_request (bool): Returns True if one of the features is enabled
+        """
+
+        return (
+            self.grafana_api_model.cache_policy is not None
+            or self.grafana_api_model.conditional_requests
+            or self.grafana_api_model.coalesce_requests
+        )
+
+    def _send_the_coalesced_request(
+        self, cache_key: tuple, send: callable
+    ) -> "httpx.Response":
+        """The method includes a functionality to coalesce identical concurrent synchronous GET requests. The first caller sends the request and all other callers wait for the shared response
 
         Args:
-            query_string (str): Specify the corresponding query string
+            cache_key (tuple): Specify the cache key of the request
+            send (callable): Specify the function that sends the request
+
+        Raises:
+            Exception: Unspecified error by executing the API call
 
         Returns:
-            query_string (str): Returns the adjusted query string
+            response (httpx.Response): Returns the response
         """
 
-        if len(query_string) >= 1:
-            return f"{query_string}&"
+        if (
+            not self.grafana_api_model.coalesce_requests
+            or cache_key[1] != RequestsMethods.GET.value
+        ):
+            return send()
+
+        in_flight_requests: dict = self.grafana_api_model._in_flight_requests
+
+        with self.grafana_api_model._lock:
+            future: Future = in_flight_requests.get(cache_key)
+            leader: bool = future is None
+
+            if leader:
+                future = Future()
+                in_flight_requests[cache_key] = future
+
+        if not leader:
+            self.grafana_api_model.statistics.increment("coalesced")
+            return future.result()
+
+        try:
+            response: httpx.Response = send()
+        except BaseException as e:
+            future.set_exception(e)
+            raise e
         else:
-            return query_string
+            future.set_result(response)
+            return response
+        finally:
+            with self.grafana_api_model._lock:
+                in_flight_requests.pop(cache_key, None)
 
-    def create_the_http_api_client(
-        self, headers: dict = None
-    ) -> Union[httpx.Client, httpx.AsyncClient]:
-        """The method includes a functionality to create the corresponding HTTP client
+    async def _send_the_coalesced_async_request(
+        self, cache_key: tuple, send: callable
+    ) -> "httpx.Response":
+        """The method includes a functionality to coalesce identical concurrent asynchronous GET requests of the running event loop. The first caller sends the request and all other callers wait for the shared response. If the sending caller is cancelled, one of the waiting callers sends the request again
 
         Args:
-            headers (dict): Specify the optional inserted headers (Default None)
+            cache_key (tuple): Specify the cache key of the request
+            send (callable): Specify the coroutine function that sends the request
+
+        Raises:
+            Exception: Unspecified error by executing the API call
 
         Returns:
-            client (Union[httpx.Client, httpx.AsyncClient]): Returns the corresponding client
+            response (httpx.Response): Returns the response
         """
 
-        transport: httpx.HTTPTransport = httpx.HTTPTransport(
-            retries=self.grafana_api_model.retries
-        )
-        limits: httpx.Limits = httpx.Limits(
-            max_connections=self.grafana_api_model.num_pools
-        )
-        http2: bool = self.grafana_api_model.http2_support
+        import asyncio
 
-        if http2:
-            async_transport: httpx.AsyncHTTPTransport = httpx.AsyncHTTPTransport(
-                retries=self.grafana_api_model.retries, http2=http2
-            )
-            return httpx.AsyncClient(
-                http2=True,
-                limits=limits,
-                timeout=self.grafana_api_model.timeout,
-                headers=headers,
-                transport=async_transport,
-                verify=self.grafana_api_model.ssl_context,
+        if (
+            not self.grafana_api_model.coalesce_requests
+            or cache_key[1] != RequestsMethods.GET.value
+        ):
+            return await send()
+
+        event_loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        with self.grafana_api_model._lock:
+            in_flight_requests: dict = (
+                self.grafana_api_model._async_in_flight_requests.setdefault(
+                    event_loop, dict()
+                )
             )
+
+        future: asyncio.Future = in_flight_requests.get(cache_key)
+
+        if future is not None:
+            self.grafana_api_model.statistics.increment("coalesced")
+
+        while future is not None:
+            try:
+                return await asyncio.shield(future)
+            except _CoalescedRequestCancelled:
+                future = in_flight_requests.get(cache_key)
+
+        future = event_loop.create_future()
+        future.add_done_callback(
+            lambda done_future: done_future.cancelled() or done_future.exception()
+        )
+        in_flight_requests[cache_key] = future
+
+        try:
+            response: httpx.Response = await send()
+        except asyncio.CancelledError as e:
+            in_flight_requests.pop(cache_key, None)
+            future.set_exception(_CoalescedRequestCancelled())
+            raise e
+        except Exception as e:
+            future.set_exception(e)
+            raise e
         else:
-            return httpx.Client(
-                limits=limits,
-                timeout=self.grafana_api_model.timeout,
-                headers=headers,
-                transport=transport,
-                verify=self.grafana_api_model.ssl_context,
+            future.set_result(response)
+            return response
+        finally:
+            if in_flight_requests.get(cache_key) is future:
+                in_flight_requests.pop(cache_key)
+
+    def _prepare_the_cached_request(
+        self, method: str, api_url: str, headers: dict = None
+    ) -> tuple:
+        """The method includes a functionality to look up a GET request inside the response cache and to add the conditional headers of the stored validators. The cache hits and misses of the cacheable API calls are counted
+
+        Args:
+            method (str): Specify the used method
+            api_url (str): Specify the used api url
+            headers (dict): Specify the optional headers of the api call (default None)
+
+        Returns:
+            cache_key (tuple): Returns the cache key of the request
+            response (Union[httpx.Response, None]): Returns the cached response or None, if the response is not cached
+            headers (dict): Returns the headers of the request including the conditional headers
+        """
+
+        cache_key: tuple = ResponseCache.get_the_key(
+            method, self._get_the_api_call(api_url), headers
+        )
+
+        if method != RequestsMethods.GET.value:
+            return cache_key, None, headers
+
+        response_cache: ResponseCache = self.get_the_response_cache()
+
+        if response_cache is not None and response_cache.get_the_ttl(cache_key[2]) > 0:
+            response: httpx.Response = response_cache.get(cache_key)
+
+            if response is not None:
+                self.grafana_api_model.statistics.increment("cache_hits")
+                return cache_key, response, headers
+
+            self.grafana_api_model.statistics.increment("cache_misses")
+
+        validator_cache: ValidatorCache = self.get_the_validator_cache()
+
+        if validator_cache is not None:
+            conditional_headers: dict = validator_cache.get_the_conditional_headers(
+                cache_key
             )
+
+            if len(conditional_headers) != 0:
+                headers = {**(headers or dict()), **conditional_headers}
+
+        return cache_key, None, headers
+
+    def _update_the_cached_response(
+        self, cache_key: tuple, response: "httpx.Response"
+    ) -> "httpx.Response":
+        """The method includes a functionality to update the response caches with the response of a request. A 304 Not Modified response is replaced by the stored response and the saved bytes are counted
+
+        Args:
+            cache_key (tuple): Specify the cache key of the request
+            response (httpx.Response): Specify the response
+
+        Returns:
+            response (httpx.Response): Returns the response
+        """
+
+        validator_cache: ValidatorCache = self.get_the_validator_cache()
+
+        if validator_cache is not None and cache_key[1] == RequestsMethods.GET.value:
+            not_modified: bool = response.status_code == 304
+            response = validator_cache.update(cache_key, response)
+
+            if not_modified and response.status_code != 304:
+                self.grafana_api_model.statistics.increment("not_modified")
+                self.grafana_api_model.statistics.increment(
+                    "bytes_saved", len(response.content)
+                )
+
+        response_cache: ResponseCache = self.get_the_response_cache()
+
+        if response_cache is not None:
+            response_cache.update(cache_key, response)
+
+        return response
+
+    def get_the_validator_cache(self) -> Union[ValidatorCache, None]:
+        """The method includes a functionality to get the shared validator store of the conditional requests of the Grafana API model
+
+        Returns:
+            validator_cache (Union[ValidatorCache, None]): Returns the shared validator store or None, if the conditional requests are disabled
+        """
+
+        if not self.grafana_api_model.conditional_requests:
+            return None
+
+        with self.grafana_api_model._lock:
+            if self.grafana_api_model._validator_cache is None:
+                self.grafana_api_model._validator_cache = ValidatorCache()
+
+            return self.grafana_api_model._validator_cache
+
+    def get_the_response_cache(self) -> Union[ResponseCache, None]:
+        """The method includes a functionality to get the shared response cache of the Grafana API model
+
+        Returns:
+            response_cache (Union[ResponseCache, None]): Returns the shared response cache or None, if there is no cache policy defined
+        """
+
+        if self.grafana_api_model.cache_policy is None:
+            return None
+
+        with self.grafana_api_model._lock:
+            if (
+                self.grafana_api_model._response_cache is None
+                or self.grafana_api_model._response_cache.cache_policy
+                is not self.grafana_api_model.cache_policy
+            ):
+                self.grafana_api_model._response_cache = ResponseCache(
+                    self.grafana_api_model.cache_policy
+                )
+
+            return self.grafana_api_model._response_cache
+
+    def get_the_lookup_cache(self, name: str) -> Union[LookupCache, None]:
+        """The method includes a functionality to get a shared lookup cache of the Grafana API model
+
+        Args:
+            name (str): Specify the name of the lookup table e.g. folders
+
+        Returns:
+            lookup_cache (Union[LookupCache, None]): Returns the shared lookup cache or None, if there is no lookup cache TTL defined
+        """
+
+        if self.grafana_api_model.lookup_cache_ttl is None:
+            return None
+
+        with self.grafana_api_model._lock:
+            lookup_cache: LookupCache = self.grafana_api_model._lookup_caches.get(name)
+
+            if (
+                lookup_cache is None
+                or lookup_cache.ttl != self.grafana_api_model.lookup_cache_ttl
+            ):
+                lookup_cache = LookupCache(self.grafana_api_model.lookup_cache_ttl)
+                self.grafana_api_model._lookup_caches[name] = lookup_cache
+
+            return lookup_cache
+
+    def _send_the_request(
+        self,
+        http: "httpx.Client",
+        method: str,
+        api_url: str,
+        content: Union[str, bytes] = None,
+        headers: dict = None,
+    ) -> "httpx.Response":
+        """The method includes a functionality to send a synchronous request and to retry the request based on the retry policy of the model
+
+        Args:
+            http (httpx.Client): Specify the used synchronous client
+            method (str): Specify the used method
+            api_url (str): Specify the used api url
+            content (Union[str, bytes]): Specify the optional request body (default None)
+            headers (dict): Specify the optional headers of the api call (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            response (httpx.Response): Returns the response
+        """
+
+        import httpx
+
+        retry: int = 0
+
+        while True:
+            self.grafana_api_model.statistics.increment("requests")
+
+            try:
+                with self._limit_the_request(api_url):
+                    response: httpx.Response = http.request(
+                        method, api_url, content=content, headers=headers
+                    )
+            except httpx.TransportError as e:
+                backoff: float = self._get_the_retry_backoff(method, retry, error=e)
+
+                if backoff is None:
+                    raise e
+            else:
+                backoff: float = self._get_the_retry_backoff(
+                    method, retry, response=response
+                )
+
+                if backoff is None:
+                    return response
+
+            retry += 1
+            time.sleep(backoff)
+
+    async def _send_the_async_request(
+        self,
+        http: "httpx.AsyncClient",
+        method: str,
+        api_url: str,
+        content: Union[str, bytes] = None,
+        headers: dict = None,
+    ) -> "httpx.Response":
+        """The method includes a functionality to send an asynchronous request and to retry the request based on the retry policy of the model
+
+        Args:
+            http (httpx.AsyncClient): Specify the used asynchronous client
+            method (str): Specify the used method
+            api_url (str): Specify the used api url
+            content (Union[str, bytes]): Specify the optional request body (default None)
+            headers (dict): Specify the optional headers of the api call (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            response (httpx.Response): Returns the response
+        """
+
+        import asyncio
+
+        import httpx
+
+        retry: int = 0
+
+        while True:
+            self.grafana_api_model.statistics.increment("requests")
+
+            try:
+                async with self._limit_the_async_request(api_url):
+                    response: httpx.Response = await http.request(
+                        method, api_url, content=content, headers=headers
+                    )
+            except httpx.TransportError as e:
+                backoff: float = self._get_the_retry_backoff(method, retry, error=e)
+
+                if backoff is None:
+                    raise e
+            else:
+                backoff: float = self._get_the_retry_backoff(
+                    method, retry, response=response
+                )
+
+                if backoff is None:
+                    return response
+
+            retry += 1
+            await asyncio.sleep(backoff)
+
+    @contextlib.contextmanager
+    def _limit_the_request(self, api_url: str):
+        """The method includes a functionality to enforce the rate limit of the model for a synchronous request
+
+        Args:
+            api_url (str): Specify the used api url
+
+        Returns:
+            None
+        """
+
+        rate_limiter: RateLimiter = self.get_the_rate_limiter()
+
+        if rate_limiter is None:
+            yield
+        else:
+            with rate_limiter.limit(self._get_the_api_call(api_url)) as wait:
+                if wait > 0:
+                    self.grafana_api_model.statistics.increment("throttled")
+                yield
+
+    @contextlib.asynccontextmanager
+    async def _limit_the_async_request(self, api_url: str):
+        """The method includes a functionality to enforce the rate limit of the model for an asynchronous request
+
+        Args:
+            api_url (str): Specify the used api url
+
+        Returns:
+            None
+        """
+
+        rate_limiter: RateLimiter = self.get_the_rate_limiter()
+
+        if rate_limiter is None:
+            yield
+        else:
+            async with rate_limiter.async_limit(
+                self._get_the_api_call(api_url)
+            ) as wait:
+                if wait > 0:
+                    self.grafana_api_model.statistics.increment("throttled")
+                yield
+
+    def get_the_rate_limiter(self) -> Union[RateLimiter, None]:
+        """The method includes a functionality to get the shared rate limiter of the Grafana API model
+
+        Returns:
+            rate_limiter (Union[RateLimiter, None]): Returns the shared rate limiter or None, if there is no rate limit defined
+        """
+
+        if self.grafana_api_model.rate_limit is None:
+            return None
+
+        with self.grafana_api_model._lock:
+            if (
+                self.grafana_api_model._rate_limiter is None
+                or self.grafana_api_model._rate_limiter.rate_limit
+                is not self.grafana_api_model.rate_limit
+            ):
+                self.grafana_api_model._rate_limiter = RateLimiter(
+                    self.grafana_api_model.rate_limit
+                )
+
+            return self.grafana_api_model._rate_limiter
+
+    def _get_the_api_call(self, api_url: str) -> str:
+        """The method includes a functionality to extract the API call endpoint of an api url
+
+        Args:
+            api_url (str): Specify the used api url
+
+        Returns:
+            api_call (str): Returns the API call endpoint
+        """
+
+        host: str = f"{self.grafana_api_model.host}"
+
+        if api_url.startswith(host):
+            return api_url[len(host) :]
+
+        return api_url
+
+    def _get_the_retry_backoff(
+        self,
+        method: str,
+        retry: int,
+        response: "httpx.Response" = None,
+        error: Exception = None,
+    ) -> Union[float, None]:
+        """The method includes a functionality to check if a request should be retried and to calculate the corresponding backoff
+
+        Args:
+            method (str): Specify the used method
+            retry (int): Specify the number of the already executed retries
+            response (httpx.Response): Specify the optional response of the request (default None)
+            error (Exception): Specify the optional transport error of the request (default None)
+
+        Returns:
+            backoff (Union[float, None]): Returns the backoff in seconds or None, if the request should not be retried
+        """
+
+        retry_policy: RetryPolicy = self.grafana_api_model.retry_policy
+
+        if retry_policy is None or retry >= retry_policy.max_retries:
+            return None
+
+        idempotent: bool = method in [
+            retry_method.value for retry_method in retry_policy.methods
+        ]
+
+        if error is not None:
+            from httpx import ConnectError, ConnectTimeout
+
+            # The connection errors are retried for all methods, because the request was not sent
+            if not idempotent and not isinstance(error, (ConnectError, ConnectTimeout)):
+                return None
+        elif response.status_code not in retry_policy.status_codes or (
+            not idempotent and response.status_code != 429
+        ):
+            return None
+
+        backoff: float = min(
+            retry_policy.backoff_factor * 2**retry, retry_policy.max_backoff
+        )
+
+        if retry_policy.jitter:
+            backoff = random.uniform(0, backoff)
+
+        if retry_policy.respect_retry_after and response is not None:
+            retry_after: float = self._get_the_retry_after(response)
+
+            if retry_after is not None:
+                backoff = min(retry_after, retry_policy.max_backoff)
+
+        self.grafana_api_model.statistics.increment("retries")
+        logging.info(
+            f"Retry the {method} request in {backoff:.2f} seconds ({retry + 1}/{retry_policy.max_retries}): "
+            f"{error if error is not None else response.status_code}."
+        )
+        return backoff
+
+    @staticmethod
+    def _get_the_retry_after(response: "httpx.Response") -> Union[float, None]:
+        """The method includes a functionality to extract the Retry-After header of a response as seconds or as HTTP date
+
+        Args:
+            response (httpx.Response): Specify the inserted response
+
+        Returns:
+            retry_after (Union[float, None]): Returns the seconds until the retry or None, if the header is not available or not valid
+        """
+
+        retry_after: str = response.headers.get("Retry-After")
+
+        if retry_after is None:
+            return None
+
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+
+        try:
+            return max(
+                (
+                    email.utils.parsedate_to_datetime(retry_after)
+                    - datetime.datetime.now(datetime.timezone.utc)
+                ).total_seconds(),
+                0.0,
+            )
+        except (TypeError, ValueError):
+            return None
+
+    def _check_the_api_call_response(
+        self, response: any = None, response_status_code: bool = False
+    ) -> any:
+        """The method includes a functionality to check the output of API call method for errors. The response body is decoded only once
+
+        Args:
+            response (any): Specify the inserted response
+            response_status_code (bool): Specify if the original status code should be attached to the result (default False)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (any): Returns the value of the api call
+        """
+
+        valid_json, json_response = self._decode_the_api_call_response(response)
+
+        if valid_json:
+            if (
+                isinstance(json_response, dict)
+                and len(json_response) != 0
+                and json_response.get("message") in ERROR_MESSAGES
+            ):
+                from httpx import ConnectError
+
+                logging.error(json_response["message"])
+                raise ConnectError(str(json_response["message"]))
+
+            if isinstance(json_response, dict) and response_status_code:
+                json_response.update({"status": response.status_code})
+            elif isinstance(json_response, list) and response_status_code:
+                json_response[0].update({"status": response.status_code})
+            return json_response
+        else:
+            if response_status_code:
+                return dict({"status": response.status_code, "data": response.text})
+            else:
+                return response
+
+    def _decode_the_api_call_response(self, response: any) -> tuple:
+        """The method includes a functionality to decode the JSON body of a response in a single pass with the codec of the model. Responses with a non JSON content type are not decoded
+
+        Args:
+            response (any): Specify the inserted response
+
+        Returns:
+            result (tuple): Returns if the body is valid JSON and the decoded body
+        """
+
+        if not Api._check_if_json_content_type(response):
+            return False, None
+
+        content: any = getattr(response, "content", None)
+
+        if not isinstance(content, (bytes, bytearray)):
+            content = response.text
+
+        try:
+            return True, self.grafana_api_model.codec.loads(content)
+        except (TypeError, ValueError):
+            return False, None
+
+    @staticmethod
+    def _check_if_json_content_type(response: any) -> bool:
+        """The method includes a functionality to check if the content type of the response can include JSON. Grafana answers a few JSON endpoints with the text/plain content type and responses without a content type are checked as well
+
+        Args:
+            response (any): Specify the inserted response
+
+        Returns:
+            result (bool): Returns if the content type can include JSON
+        """
+
+        headers: any = getattr(response, "headers", None)
+
+        if not isinstance(headers, Mapping):
+            return True
+
+        content_type: str = headers.get("content-type")
+
+        if not isinstance(content_type, str) or len(content_type) == 0:
+            return True
+
+        media_type: str = content_type.split(";", 1)[0].strip().lower()
+        return "json" in media_type or media_type == "text/plain"
+
+    @staticmethod
+    def prepare_api_string(query_string: str) -> str:
+        """The method includes a functionality to prepare the api string for the queries
+
+        Args:
+            query_string (str): Specify the corresponding query string
+
+        Returns:
+            query_string (str): Returns the adjusted query string
+        """
+
+        if len(query_string) >= 1:
+            return f"{query_string}&"
+        else:
+            return query_string
+
+    def get_the_http_api_client(self) -> "httpx.Client":
+        """The method includes a functionality to get the persistent HTTP client of the Grafana API model. The client and the corresponding connection pool are created once with the default headers and shared by all API calls of the model
+
+        Returns:
+            client (httpx.Client): Returns the shared client
+        """
+
+        headers: dict = self.get_the_default_headers()
+        http: httpx.Client = self.grafana_api_model._http_client
+
+        if http is None or http.is_closed:
+            with self.grafana_api_model._lock:
+                http = self.grafana_api_model._http_client
+
+                if http is None or http.is_closed:
+                    http = self.create_the_http_api_client(headers)
+                    self.grafana_api_model._http_client = http
+
+        return http
+
+    def batch(self, operations: list, max_workers: int = None) -> list:
+        """The method includes a functionality to execute multiple API calls or domain method invocations concurrently inside the shared thread pool. The results are returned in the order of the operations and a failed operation does not cancel the other operations
+
+        Args:
+            operations (list): Specify the list of BatchOperation objects or callables without arguments e.g. functools.partial(dashboard.get_dashboard_by_uid, "uid")
+            max_workers (int): Specify the optional maximum number of the concurrently executed operations. The default value is the max_workers value of the model (default None)
+
+        Returns:
+            results (list): Returns the list of BatchResult objects
+        """
+
+        if max_workers is None and not getattr(_worker_thread, "active", False):
+            return self._collect_the_batch_results(
+                [
+                    self._submit(self.get_the_executor(), operation)
+                    for operation in operations
+                ]
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers or self.grafana_api_model.max_workers,
+            thread_name_prefix="grafana_api_batch",
+            initializer=_mark_the_worker_thread,
+        ) as executor:
+            return self._collect_the_batch_results(
+                [self._submit(executor, operation) for operation in operations]
+            )
+
+    def _submit(self, executor: ThreadPoolExecutor, operation: any) -> Future:
+        """The method includes a functionality to submit a batch operation to a thread pool. The operation is executed inside a copy of the current context
+
+        Args:
+            executor (ThreadPoolExecutor): Specify the used thread pool
+            operation (any): Specify the BatchOperation object or the callable
+
+        Returns:
+            future (Future): Returns the future of the operation
+        """
+
+        return executor.submit(
+            contextvars.copy_context().run,
+            self._execute_the_batch_operation,
+            operation,
+        )
+
+    def _execute_the_batch_operation(self, operation: any) -> any:
+        """The method includes a functionality to execute a batch operation
+
+        Args:
+            operation (any): Specify the BatchOperation object or the callable
+
+        Raises:
+            Exception: Unspecified error by executing the operation
+
+        Returns:
+            result (any): Returns the result of the operation
+        """
+
+        if isinstance(operation, BatchOperation):
+            return self.call_the_api(
+                operation.api_call,
+                operation.method,
+                operation.json_complete,
+                operation.org_id_header,
+                operation.disable_provenance_header,
+                operation.response_status_code,
+            )
+        elif callable(operation):
+            return operation()
+        else:
+            logging.error("Please define a BatchOperation or a callable.")
+            raise ValueError
+
+    @staticmethod
+    def _collect_the_batch_results(futures: list) -> list:
+        """The method includes a functionality to collect the results of the batch operations
+
+        Args:
+            futures (list): Specify the futures of the batch operations
+
+        Returns:
+            results (list): Returns the list of BatchResult objects
+        """
+
+        results: list = list()
+
+        for future in futures:
+            try:
+                results.append(BatchResult(result=future.result()))
+            except Exception as e:
+                results.append(BatchResult(error=e))
+
+        return results
+
+    def paginate(
+        self,
+        fetch_the_page: callable,
+        page_size: int,
+        prefetch: int = 2,
+        first_page: int = 1,
+    ) -> Iterator[list]:
+        """The method includes a functionality to iterate over the pages of a paginated API endpoint. The next pages are prefetched concurrently inside the thread pool, the pages are yielded in order and the iteration stops at the first page that is shorter than the page size
+
+        Args:
+            fetch_the_page (callable): Specify the function that fetches the page with the inserted page number and returns the list of the page items
+            page_size (int): Specify the number of the items per page
+            prefetch (int): Specify the number of the pages that are fetched ahead of the consumer (default 2)
+            first_page (int): Specify the number of the first page (default 1)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            pages (Iterator[list]): Returns an iterator over the pages
+        """
+
+        if page_size <= 0 or prefetch < 0:
+            logging.error("Please define a valid page_size and prefetch value.")
+            raise ValueError
+
+        temporary_executor: bool = getattr(_worker_thread, "active", False)
+        executor: ThreadPoolExecutor = (
+            ThreadPoolExecutor(
+                max_workers=prefetch + 1,
+                thread_name_prefix="grafana_api_pagination",
+                initializer=_mark_the_worker_thread,
+            )
+            if temporary_executor
+            else self.get_the_executor()
+        )
+        futures: collections.deque = collections.deque()
+        page: int = first_page
+
+        try:
+            while True:
+                while len(futures) <= prefetch:
+                    futures.append(
+                        executor.submit(
+                            contextvars.copy_context().run, fetch_the_page, page
+                        )
+                    )
+                    page += 1
+
+                items: list = futures.popleft().result()
+
+                yield items
+
+                if len(items) < page_size:
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
+
+            if temporary_executor:
+                executor.shutdown(wait=False)
+
+    def batch_iter(
+        self, operations: any, max_workers: int = None
+    ) -> Iterator[BatchResult]:
+        """The method includes a functionality to execute multiple API calls or domain method invocations concurrently inside the shared thread pool and to iterate over the results. The operations are consumed lazily and at most max_workers operations are in flight, so the memory is bounded for large or generated lists of operations. A dedicated thread pool is used, if max_workers differs from the max_workers value of the model. The results are yielded in the order of the operations and a failed operation does not cancel the other operations
+
+        Args:
+            operations (any): Specify the iterable of BatchOperation objects or callables without arguments e.g. functools.partial(dashboard.get_dashboard_by_uid, "uid")
+            max_workers (int): Specify the optional maximum number of the concurrently executed operations. The default value is the max_workers value of the model (default None)
+
+        Returns:
+            results (Iterator[BatchResult]): Returns an iterator over the BatchResult objects
+        """
+
+        max_workers = max_workers or self.grafana_api_model.max_workers
+        temporary_executor: bool = (
+            getattr(_worker_thread, "active", False)
+            or max_workers != self.grafana_api_model.max_workers
+        )
+        executor: ThreadPoolExecutor = (
+            ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="grafana_api_batch",
+                initializer=_mark_the_worker_thread,
+            )
+            if temporary_executor
+            else self.get_the_executor()
+        )
+        futures: collections.deque = collections.deque()
+
+        try:
+            for operation in operations:
+                futures.append(self._submit(executor, operation))
+
+                if len(futures) >= max_workers:
+                    yield self._collect_the_batch_results([futures.popleft()])[0]
+
+            while len(futures) != 0:
+                yield self._collect_the_batch_results([futures.popleft()])[0]
+        finally:
+            for future in futures:
+                future.cancel()
+
+            if temporary_executor:
+                executor.shutdown(wait=False)
+
+    def get_the_executor(self) -> ThreadPoolExecutor:
+        """The method includes a functionality to get the shared thread pool of the Grafana API model that executes concurrent API calls
+
+        Returns:
+            executor (ThreadPoolExecutor): Returns the shared thread pool
+        """
+
+        with self.grafana_api_model._lock:
+            if self.grafana_api_model._executor is None:
+                self.grafana_api_model._executor = ThreadPoolExecutor(
+                    max_workers=self.grafana_api_model.max_workers,
+                    thread_name_prefix="grafana_api",
+                    initializer=_mark_the_worker_thread,
+                )
+
+            return self.grafana_api_model._executor
+
+    def _get_the_transport_retries(self) -> any:
+        """The method includes a functionality to get the number of the connection retries of the HTTP transport. The retries are disabled if a retry policy is defined, because the retry policy retries the connection errors with a backoff and the retries would be multiplied otherwise
+
+        Returns:
+            retries (any): Returns the number of the connection retries of the HTTP transport
+        """
+
+        if self.grafana_api_model.retry_policy is not None:
+            return 0
+
+        return self.grafana_api_model.retries
+
+    def create_the_http_api_client(self, headers: dict = None) -> "httpx.Client":
+        """The method includes a functionality to create the corresponding HTTP client. In case of the enabled HTTP/2 support, the client multiplexes the requests over the connections of the pool
+
+        Args:
+            headers (dict): Specify the optional inserted headers (Default None)
+
+        Returns:
+            client (httpx.Client): Returns the corresponding client
+        """
+
+        import httpx
+
+        ssl_context: ssl.SSLContext = self.grafana_api_model.get_the_ssl_context()
+        limits: httpx.Limits = httpx.Limits(
+            max_connections=self.grafana_api_model.num_pools
+        )
+        transport: httpx.HTTPTransport = httpx.HTTPTransport(
+            verify=ssl_context,
+            http2=self.grafana_api_model.http2_support,
+            limits=limits,
+            retries=self._get_the_transport_retries(),
+        )
+
+        return httpx.Client(
+            http2=self.grafana_api_model.http2_support,
+            limits=limits,
+            timeout=self.grafana_api_model.timeout,
+            headers=headers,
+            transport=transport,
+            verify=ssl_context,
+        )
+
+    def create_the_async_http_api_client(
+        self, headers: dict = None
+    ) -> "httpx.AsyncClient":
+        """The method includes a functionality to create the corresponding asynchronous HTTP client. In case of the enabled HTTP/2 support, the client multiplexes the requests over the connections of the pool
+
+        Args:
+            headers (dict): Specify the optional inserted headers (Default None)
+
+        Returns:
+            client (httpx.AsyncClient): Returns the corresponding client
+        """
+
+        import httpx
+
+        ssl_context: ssl.SSLContext = self.grafana_api_model.get_the_ssl_context()
+        limits: httpx.Limits = httpx.Limits(
+            max_connections=self.grafana_api_model.num_pools
+        )
+        transport: httpx.AsyncHTTPTransport = httpx.AsyncHTTPTransport(
+            verify=ssl_context,
+            http2=self.grafana_api_model.http2_support,
+            limits=limits,
+            retries=self._get_the_transport_retries(),
+        )
+
+        return httpx.AsyncClient(
+            http2=self.grafana_api_model.http2_support,
+            limits=limits,
+            timeout=self.grafana_api_model.timeout,
+            headers=headers,
+            transport=transport,
+            verify=ssl_context,
+        )
+
+
+class AsyncApi(Api):
+    """The class includes all necessary methods to make asynchronous API calls to the Grafana API endpoints. All API calls of an event loop share one asynchronous HTTP client of the Grafana API model
+
+    Args:
+        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+
+    Attributes:
+        grafana_api_model (APIModel): This is where we store the grafana_api_model
+    """
+
+    async def call_the_api(
+        self,
+        api_call: str,
+        method: RequestsMethods = RequestsMethods.GET,
+        json_complete: any = None,
+        org_id_header: int = None,
+        disable_provenance_header: bool = False,
+        response_status_code: bool = False,
+    ) -> any:
+        """The method execute a defined asynchronous API call against the Grafana endpoints
+
+        Args:
+            api_call (str): Specify the API call endpoint
+            method (RequestsMethods): Specify the used method (default GET)
+            json_complete (any): Specify the inserted JSON as string, as bytes or as JSON serializable object that is encoded by the codec of the model
+            org_id_header (int): Specify the optional organization id as header for the corresponding API call
+            disable_provenance_header (bool): Specify the optional disable provenance as header for the corresponding API call (default False)
+            response_status_code (bool): Specify if the response should include the original status code (default False)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (any): Returns the value of the api call
+        """
+
+        return await self._execute_the_async_api_call(
+            self.get_the_async_http_api_client(),
+            method,
+            f"{self.grafana_api_model.host}{api_call}",
+            response_status_code,
+            self._encode_the_json_complete(json_complete),
+            self._create_the_headers(org_id_header, disable_provenance_header),
+        )
+
+    async def stream_the_api(
+        self,
+        api_call: str,
+        json_array: bool = False,
+        org_id_header: int = None,
+        chunk_size: int = None,
+    ) -> AsyncIterator[any]:
+        """The method includes a functionality to stream the body of an asynchronous GET API call instead of loading the complete body into memory. The response cache, the conditional requests and the retries are not used for the streamed API calls
+
+        Args:
+            api_call (str): Specify the API call endpoint
+            json_array (bool): Specify if the elements of the top-level JSON array of the body should be decoded incrementally instead of yielding the raw chunks of the body (default False)
+            org_id_header (int): Specify the optional organization id as header for the corresponding API call
+            chunk_size (int): Specify the optional size of the read chunks in bytes (default None)
+
+        Raises:
+            ValueError: The body is not a valid JSON array
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (AsyncIterator[any]): Returns an asynchronous iterator over the chunks of the body or over the elements of the JSON array
+        """
+
+        api_url: str = f"{self.grafana_api_model.host}{api_call}"
+        http: httpx.AsyncClient = self.get_the_async_http_api_client()
+
+        async with self._limit_the_async_request(api_url):
+            self.grafana_api_model.statistics.increment("requests")
+
+            async with http.stream(
+                "GET", api_url, headers=self._create_the_headers(org_id_header)
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                    self._check_the_stream_response(response)
+
+                json_array_decoder: JSONArrayDecoder = JSONArrayDecoder()
+
+                async for chunk in response.aiter_bytes(chunk_size):
+                    if json_array:
+                        for element in json_array_decoder.feed(chunk):
+                            yield element
+                    else:
+                        yield chunk
+
+                if json_array:
+                    for element in json_array_decoder.feed(b"", final=True):
+                        yield element
+
+    async def batch(self, operations: list, max_workers: int = None) -> list:
+        """The method includes a functionality to execute multiple API calls or domain method invocations concurrently on the event loop. The API calls share the asynchronous HTTP client, the results are returned in the order of the operations and a failed operation does not cancel the other operations
+
+        Args:
+            operations (list): Specify the list of BatchOperation objects, coroutine functions or callables without arguments e.g. functools.partial(dashboard.get_dashboard_by_uid, "uid")
+            max_workers (int): Specify the optional maximum number of the concurrently executed operations. The default value is the max_workers value of the model (default None)
+
+        Returns:
+            results (list): Returns the list of BatchResult objects
+        """
+
+        import asyncio
+
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(
+            max_workers or self.grafana_api_model.max_workers
+        )
+
+        async def _execute_the_async_batch_operation(operation: any) -> BatchResult:
+            async with semaphore:
+                try:
+                    if isinstance(operation, BatchOperation):
+                        result: any = await self.call_the_api(
+                            operation.api_call,
+                            operation.method,
+                            operation.json_complete,
+                            operation.org_id_header,
+                            operation.disable_provenance_header,
+                            operation.response_status_code,
+                        )
+                    elif asyncio.iscoroutinefunction(operation):
+                        result: any = await operation()
+                    elif callable(operation):
+                        result: any = await self.run_in_executor(operation)
+                    else:
+                        logging.error("Please define a BatchOperation or a callable.")
+                        raise ValueError
+                    return BatchResult(result=result)
+                except Exception as e:
+                    return BatchResult(error=e)
+
+        return list(
+            await asyncio.gather(
+                *[
+                    _execute_the_async_batch_operation(operation)
+                    for operation in operations
+                ]
+            )
+        )
+
+    async def run_in_executor(self, function: callable, *args, **kwargs) -> any:
+        """The method includes a functionality to execute a synchronous function inside the shared thread pool. All API calls of the function are forwarded to the asynchronous HTTP client of the running event loop
+
+        Args:
+            function (callable): Specify the executed function
+            *args: Specify the positional arguments of the function
+            **kwargs: Specify the keyword arguments of the function
+
+        Raises:
+            Exception: Unspecified error by executing the function
+
+        Returns:
+            result (any): Returns the result of the function
+        """
+
+        import asyncio
+
+        event_loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        context: contextvars.Context = contextvars.copy_context()
+        context.run(_event_loop.set, event_loop)
+
+        return await event_loop.run_in_executor(
+            self.get_the_executor(),
+            lambda: context.run(function, *args, **kwargs),
+        )
+
+    def get_the_async_http_api_client(self) -> "httpx.AsyncClient":
+        """The method includes a functionality to get the persistent asynchronous HTTP client of the Grafana API model for the running event loop
+
+        Returns:
+            client (httpx.AsyncClient): Returns the shared client
+        """
+
+        import asyncio
+
+        event_loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        headers: dict = self.get_the_default_headers()
+
+        with self.grafana_api_model._lock:
+            http: httpx.AsyncClient = self.grafana_api_model._async_http_clients.get(
+                event_loop
+            )
+
+            if http is None or http.is_closed:
+                http = self.create_the_async_http_api_client(headers)
+                self.grafana_api_model._async_http_clients[event_loop] = http
+
+            return http
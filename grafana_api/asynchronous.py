@@ -0,0 +1,1131 @@
+import functools
+import inspect
+import logging
+from typing import Iterator
+
+from .model import (
+    APIModel,
+    APIEndpoints,
+    RequestsMethods,
+    SearchHit,
+    UserObject,
+    TeamObject,
+)
+from .api import AsyncApi
+from .cache import LookupCache
+from .admin import Admin
+from .alerting import Alerting
+from .alerting_notifications import AlertingNotifications
+from .alerting_provisioning import AlertingProvisioning
+from .annotations import Annotations
+from .authentication import Authentication
+from .correlations import Correlations
+from .dashboard import Dashboard
+from .datasource import Datasource, DatasourceQueryResourceCaching
+from .external_group import ExternalGroup
+from .folder import Folder, FOLDER_PAGE_SIZE
+from .legacy_alerting import Alerting as LegacyAlerting
+from .legacy_playlist import LegacyPlaylist
+from .library import Library
+from .licensing import Licensing
+from .organisation import Organisation, OrganisationAdmin
+from .other_http import OtherHTTP
+from .permission_reconciler import PermissionReconciler
+from .playlist import Playlist
+from .preferences import Preferences
+from .query_history import QueryHistory
+from .rbac import RBAC
+from .reporting import Reporting
+from .search import Search, SearchIndex
+from .service_account import ServiceAccount
+from .short_url import ShortUrl
+from .snapshot import Snapshot
+from .team import Team
+from .user import User, CurrentUser
+
+
+class AsyncDomain:
+    """The class includes the functionality to create the awaitable counterpart of a synchronous Grafana API class. Every public method of the domain class is available as coroutine function. The methods that are defined by the subclass are native coroutines that call the shared asynchronous HTTP client of the running event loop directly, so any number of them can be in flight at once. All other methods are executed inside the shared thread pool of the Grafana API model and their API calls are forwarded to the same client, so at most max_workers of these methods are executed concurrently
+
+    Args:
+        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+
+    Attributes:
+        grafana_api_model (APIModel): This is where we store the grafana_api_model
+        domain (object): This is where we store the synchronous domain object
+    """
+
+    domain_class: type = None
+
+    def __init__(self, grafana_api_model: APIModel):
+        self.grafana_api_model = grafana_api_model
+        self.domain = self.domain_class(grafana_api_model)
+
+    def __init_subclass__(cls, domain_class: type = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        if domain_class is not None:
+            cls.domain_class = domain_class
+
+            for name, function in inspect.getmembers(domain_class, inspect.isfunction):
+                if name.startswith("_"):
+                    continue
+                elif name in cls.__dict__:
+                    cls.__dict__[name].__doc__ = (
+                        cls.__dict__[name].__doc__ or function.__doc__
+                    )
+                elif inspect.isgeneratorfunction(function):
+                    setattr(
+                        cls,
+                        name,
+                        cls._create_the_async_generator_method(name, function),
+                    )
+                else:
+                    setattr(cls, name, cls._create_the_async_method(name, function))
+
+    @staticmethod
+    def _create_the_async_method(name: str, function: callable) -> callable:
+        """The method includes a functionality to create the coroutine function of a synchronous method
+
+        Args:
+            name (str): Specify the name of the synchronous method
+            function (callable): Specify the synchronous method
+
+        Returns:
+            method (callable): Returns the coroutine function
+        """
+
+        @functools.wraps(function)
+        async def _async_method(self, *args, **kwargs):
+            return await AsyncApi(self.grafana_api_model).run_in_executor(
+                getattr(self.domain, name), *args, **kwargs
+            )
+
+        return _async_method
+
+    @staticmethod
+    def _create_the_async_generator_method(name: str, function: callable) -> callable:
+        """The method includes a functionality to create the asynchronous generator function of a synchronous generator method. Every item is fetched inside the shared thread pool, so the event loop is not blocked
+
+        Args:
+            name (str): Specify the name of the synchronous generator method
+            function (callable): Specify the synchronous generator method
+
+        Returns:
+            method (callable): Returns the asynchronous generator function
+        """
+
+        @functools.wraps(function)
+        async def _async_generator_method(self, *args, **kwargs):
+            api: AsyncApi = AsyncApi(self.grafana_api_model)
+            generator: Iterator = getattr(self.domain, name)(*args, **kwargs)
+            exhausted: object = object()
+
+            try:
+                while True:
+                    item: any = await api.run_in_executor(next, generator, exhausted)
+
+                    if item is exhausted:
+                        break
+
+                    yield item
+            finally:
+                await api.run_in_executor(generator.close)
+
+        return _async_generator_method
+
+    async def _get_the_api_call(self, api_call: str, valid: callable) -> any:
+        """The method includes a functionality to execute a native asynchronous GET API call and to check the result
+
+        Args:
+            api_call (str): Specify the API call endpoint
+            valid (callable): Specify the function that receives the result and returns if the result is valid
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (any): Returns the value of the api call
+        """
+
+        result: any = await AsyncApi(self.grafana_api_model).call_the_api(api_call)
+
+        if not valid(result):
+            logging.error(f"Please, check the error: {result}.")
+            raise Exception
+
+        return result
+
+    async def _send_the_api_call(
+        self,
+        api_call: str,
+        method: RequestsMethods,
+        valid: callable,
+        json_complete: any = None,
+        success_message: str = None,
+    ) -> any:
+        """The method includes a functionality to execute a native asynchronous API call with the inserted method and to check the result
+
+        Args:
+            api_call (str): Specify the API call endpoint
+            method (RequestsMethods): Specify the used method
+            valid (callable): Specify the function that receives the result and returns if the result is valid
+            json_complete (any): Specify the optional JSON body of the API call (default None)
+            success_message (str): Specify the optional message that is logged, if the result is valid (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (any): Returns the value of the api call
+        """
+
+        result: any = await AsyncApi(self.grafana_api_model).call_the_api(
+            api_call, method, json_complete
+        )
+
+        if not valid(result):
+            logging.error(f"Check the error: {result}.")
+            raise Exception
+
+        if success_message is not None:
+            logging.info(success_message)
+
+        return result
+
+    @staticmethod
+    def _is_valid_list(key: str) -> callable:
+        """The method includes a functionality to create the check of a list result that is valid, if it is not empty and the first element includes the key
+
+        Args:
+            key (str): Specify the key
+
+        Returns:
+            valid (callable): Returns the check
+        """
+
+        return lambda result: (
+            isinstance(result, list)
+            and len(result) != 0
+            and result[0].get(key) is not None
+        )
+
+    @staticmethod
+    def _is_valid_dict(key: str) -> callable:
+        """The method includes a functionality to create the check of a dict result that is valid, if it includes the key
+
+        Args:
+            key (str): Specify the key
+
+        Returns:
+            valid (callable): Returns the check
+        """
+
+        return lambda result: isinstance(result, dict) and result.get(key) is not None
+
+    @staticmethod
+    def _is_message(message: str) -> callable:
+        """The method includes a functionality to create the check of a dict result that is valid, if it includes the message
+
+        Args:
+            message (str): Specify the message
+
+        Returns:
+            valid (callable): Returns the check
+        """
+
+        return (
+            lambda result: isinstance(result, dict) and result.get("message") == message
+        )
+
+
+class AsyncAdmin(AsyncDomain, domain_class=Admin):
+    """The class includes all necessary methods to access the Grafana admin API endpoints asynchronously"""
+
+
+class AsyncAlerting(AsyncDomain, domain_class=Alerting):
+    """The class includes all necessary methods to access the Grafana alerting API endpoints asynchronously"""
+
+
+class AsyncAlertingNotifications(AsyncDomain, domain_class=AlertingNotifications):
+    """The class includes all necessary methods to access the Grafana alerting notifications API endpoints asynchronously"""
+
+
+class AsyncAlertingProvisioning(AsyncDomain, domain_class=AlertingProvisioning):
+    """The class includes all necessary methods to access the Grafana alerting provisioning API endpoints asynchronously. All methods are executed inside the shared thread pool"""
+
+
+class AsyncAnnotations(AsyncDomain, domain_class=Annotations):
+    """The class includes all necessary methods to access the Grafana annotations API endpoints asynchronously"""
+
+
+class AsyncAuthentication(AsyncDomain, domain_class=Authentication):
+    """The class includes all necessary methods to access the Grafana authentication API endpoints asynchronously"""
+
+
+class AsyncCorrelations(AsyncDomain, domain_class=Correlations):
+    """The class includes all necessary methods to access the Grafana correlations API endpoints asynchronously"""
+
+
+class AsyncDashboard(AsyncDomain, domain_class=Dashboard):
+    """The class includes all necessary methods to access the Grafana dashboard API endpoints asynchronously. The iter_dashboard_versions, export_all, import_dashboards, get_dashboard_hash and dashboard diff methods are executed inside the shared thread pool"""
+
+    async def get_dashboard_by_uid(self, uid: str) -> dict:
+        if len(uid) == 0:
+            logging.error("There is no dashboard uid defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.DASHBOARDS.value}/uid/{uid}",
+            self._is_valid_dict("dashboard"),
+        )
+
+    async def get_dashboard_home(self) -> dict:
+        return await self._get_the_api_call(
+            f"{APIEndpoints.DASHBOARDS.value}/home", self._is_valid_dict("dashboard")
+        )
+
+    async def get_dashboard_tags(self) -> list:
+        return await self._get_the_api_call(
+            f"{APIEndpoints.DASHBOARDS.value}/tags", self._is_valid_list("term")
+        )
+
+    async def get_dashboard_permissions(self, id: int) -> list:
+        if id == 0:
+            logging.error("There is no dashboard id defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.DASHBOARDS.value}/id/{id}/permissions",
+            self._is_valid_list("role"),
+        )
+
+    async def get_dashboard_versions(self, id: int) -> list:
+        if id == 0:
+            logging.error("There is no dashboard id defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.DASHBOARDS.value}/id/{id}/versions",
+            self._is_valid_list("id"),
+        )
+
+    async def get_dashboard_version(self, id: int, version_id: int) -> dict:
+        if id == 0 or version_id == 0:
+            logging.error("There is no dashboard id or version_id defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.DASHBOARDS.value}/id/{id}/versions/{version_id}",
+            self._is_valid_dict("id"),
+        )
+
+    async def get_dashboard_permissions_by_uid(self, uid: str) -> list:
+        if len(uid) == 0:
+            logging.error("There is no dashboard uid defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.DASHBOARDS.value}/uid/{uid}/permissions",
+            self._is_valid_list("role"),
+        )
+
+    async def get_dashboard_versions_by_uid(self, uid: str) -> list:
+        if len(uid) == 0:
+            logging.error("There is no dashboard uid defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.DASHBOARDS.value}/uid/{uid}/versions",
+            self._is_valid_list("uid"),
+        )
+
+    async def get_dashboard_version_by_uid(self, uid: str, version_id: int) -> dict:
+        if len(uid) == 0 or version_id == 0:
+            logging.error("There is no dashboard uid or version_id defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.DASHBOARDS.value}/uid/{uid}/versions/{version_id}",
+            self._is_valid_dict("uid"),
+        )
+
+    async def create_or_update_dashboard(
+        self,
+        dashboard_path: str,
+        dashboard_json: dict,
+        message: str,
+        overwrite: bool = False,
+    ):
+        if len(dashboard_path) == 0 or dashboard_json == dict() or len(message) == 0:
+            logging.error(
+                "There is no dashboard_path or dashboard_json or message defined."
+            )
+            raise ValueError
+
+        folder_id: int = await AsyncFolder(
+            self.grafana_api_model
+        ).get_folder_id_by_dashboard_path(dashboard_path)
+
+        api_call: dict = await self._send_the_api_call(
+            f"{APIEndpoints.DASHBOARDS.value}/db",
+            RequestsMethods.POST,
+            lambda result: isinstance(result, dict)
+            and result.get("status") == "success",
+            dict(
+                {
+                    "dashboard": dashboard_json,
+                    "folderId": folder_id,
+                    "message": message,
+                    "overwrite": overwrite,
+                }
+            ),
+            "You successfully deployed the dashboard.",
+        )
+
+        self.domain._update_the_dashboard_index(
+            api_call.get("uid"),
+            SearchHit(
+                id=api_call.get("id"),
+                uid=api_call.get("uid"),
+                title=dashboard_json.get("title"),
+                type="dash-db",
+                url=api_call.get("url"),
+                slug=api_call.get("slug"),
+                tags=dashboard_json.get("tags", list()),
+                folder_id=folder_id or None,
+            ),
+        )
+
+    async def delete_dashboard_by_name_and_path(
+        self, dashboard_name: str, dashboard_path: str
+    ):
+        if len(dashboard_name) == 0 or len(dashboard_path) == 0:
+            logging.error("There is no dashboard_name or dashboard_path defined.")
+            raise ValueError
+
+        dashboard_uid: dict = await self.get_dashboard_uid_and_id_by_name_and_folder(
+            dashboard_name, dashboard_path
+        )
+
+        if dashboard_uid is None or len(dashboard_uid) == 0:
+            logging.error("Nothing to delete. There is no dashboard available.")
+            raise ValueError
+
+        await self._send_the_api_call(
+            f"{APIEndpoints.DASHBOARDS.value}/uid/{dashboard_uid.get('uid')}",
+            RequestsMethods.DELETE,
+            self._is_message(f"Dashboard {dashboard_name} deleted"),
+            success_message="You successfully destroyed the dashboard.",
+        )
+
+        self.domain._update_the_dashboard_index(dashboard_uid.get("uid"))
+
+    async def get_dashboard_uid_and_id_by_name_and_folder(
+        self, dashboard_name: str, dashboard_path: str
+    ) -> dict:
+        if len(dashboard_name) == 0 or len(dashboard_path) == 0:
+            logging.error("There is no dashboard_name or dashboard_path defined.")
+            raise ValueError
+
+        folder_id: int = await AsyncFolder(
+            self.grafana_api_model
+        ).get_folder_id_by_dashboard_path(dashboard_path)
+        lookup_cache: LookupCache = AsyncApi(
+            self.grafana_api_model
+        ).get_the_lookup_cache("dashboards")
+        search_index: SearchIndex = (
+            None if lookup_cache is None else lookup_cache.peek("search_index")
+        )
+
+        if search_index is not None:
+            hit: SearchHit = self.domain._find_the_dashboard(
+                search_index, folder_id, dashboard_name
+            )
+
+            if hit is not None:
+                return dict({"uid": hit.uid, "id": hit.id})
+
+        dashboard_meta: list = await AsyncApi(self.grafana_api_model).call_the_api(
+            f"{APIEndpoints.SEARCH.value}?folderIds={folder_id}&query={dashboard_name}"
+        )
+
+        for dashboard_meta_object in dashboard_meta:
+            if dashboard_meta_object.get("title") is None:
+                logging.error("There is no title defined.")
+                raise ValueError
+            elif dashboard_meta_object.get("title") == dashboard_name:
+                if (
+                    dashboard_meta_object.get("uid") is None
+                    or dashboard_meta_object.get("id") is None
+                ):
+                    logging.error("There is no uid or id defined.")
+                    raise ValueError
+
+                return dict(
+                    {
+                        "uid": dashboard_meta_object.get("uid"),
+                        "id": dashboard_meta_object.get("id"),
+                    }
+                )
+
+        return None
+
+    async def update_dashboard_permissions(self, id: int, permission_json: dict):
+        if id == 0 or len(permission_json) == 0:
+            logging.error("There is no dashboard id or permission json defined.")
+            raise ValueError
+
+        await self._send_the_api_call(
+            f"{APIEndpoints.DASHBOARDS.value}/id/{id}/permissions",
+            RequestsMethods.POST,
+            self._is_message("Dashboard permissions updated"),
+            permission_json,
+            "You successfully modified the dashboard permissions.",
+        )
+
+    async def update_dashboard_permissions_by_uid(
+        self, uid: str, permission_json: dict
+    ):
+        if len(uid) == 0 or len(permission_json) == 0:
+            logging.error("There is no dashboard uid or permission json defined.")
+            raise ValueError
+
+        await self._send_the_api_call(
+            f"{APIEndpoints.DASHBOARDS.value}/uid/{uid}/permissions",
+            RequestsMethods.POST,
+            self._is_message("Dashboard permissions updated"),
+            permission_json,
+            "You successfully modified the dashboard permissions.",
+        )
+
+    async def restore_dashboard_version(self, id: int, version: dict):
+        if id == 0 or version == dict():
+            logging.error("There is no dashboard id or version_id defined.")
+            raise ValueError
+
+        api_call: dict = await self._send_the_api_call(
+            f"{APIEndpoints.DASHBOARDS.value}/id/{id}/restore",
+            RequestsMethods.POST,
+            self._is_restored,
+            version,
+            "You successfully restored the dashboard.",
+        )
+
+        self.domain._update_the_restored_dashboard_index(api_call.get("uid"))
+
+    async def restore_dashboard_version_by_uid(self, uid: str, version: dict):
+        if len(uid) == 0 or version == dict():
+            logging.error("There is no dashboard uid or version_id defined.")
+            raise ValueError
+
+        await self._send_the_api_call(
+            f"{APIEndpoints.DASHBOARDS.value}/uid/{uid}/restore",
+            RequestsMethods.POST,
+            self._is_restored,
+            version,
+            "You successfully restored the dashboard.",
+        )
+
+        self.domain._update_the_restored_dashboard_index(uid)
+
+    @staticmethod
+    def _is_restored(result: any) -> bool:
+        """The method includes a functionality to check the result of a dashboard restore
+
+        Args:
+            result (any): Specify the result of the API call
+
+        Returns:
+            valid (bool): Returns if the dashboard was restored
+        """
+
+        return (
+            isinstance(result, dict)
+            and result.get("status") == "success"
+            and result.get("message") is None
+        )
+
+
+class AsyncDatasource(AsyncDomain, domain_class=Datasource):
+    """The class includes all necessary methods to access the Grafana datasource API endpoints asynchronously. The query_datasource_by_id and datasource permission methods are executed inside the shared thread pool"""
+
+    async def get_all_datasources(self) -> list:
+        return await self._get_the_api_call(
+            APIEndpoints.DATASOURCES.value, self._is_valid_list("id")
+        )
+
+    async def get_datasource_by_id(self, datasource_id: int) -> dict:
+        if datasource_id == 0:
+            logging.error("There is no datasource_id defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.DATASOURCES.value}/{datasource_id}",
+            self._is_valid_dict("id"),
+        )
+
+    async def get_datasource_by_uid(self, uid: str) -> dict:
+        if len(uid) == 0:
+            logging.error("There is no uid defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.DATASOURCES.value}/uid/{uid}", self._is_valid_dict("id")
+        )
+
+    async def get_datasource_by_name(self, name: str) -> dict:
+        if len(name) == 0:
+            logging.error("There is no name defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.DATASOURCES.value}/name/{name}", self._is_valid_dict("id")
+        )
+
+    async def get_datasource_id_by_name(self, name: str) -> int:
+        if len(name) == 0:
+            logging.error("There is no name defined.")
+            raise ValueError
+
+        api_call: dict = await self._get_the_api_call(
+            f"{APIEndpoints.DATASOURCES.value}/id/{name}", self._is_valid_dict("id")
+        )
+
+        return api_call.get("id")
+
+    async def create_datasource(self, data_source: dict):
+        if data_source == dict():
+            logging.error("There is no data_source defined.")
+            raise ValueError
+
+        try:
+            await self._send_the_api_call(
+                APIEndpoints.DATASOURCES.value,
+                RequestsMethods.POST,
+                self._is_message("Datasource added"),
+                data_source,
+                "You successfully created a datasource.",
+            )
+        finally:
+            self.domain._invalidate_the_datasource_index()
+
+    async def update_datasource(self, datasource_id: int, data_source: dict):
+        if datasource_id == 0 or data_source == dict():
+            logging.error("There is no datasource_id or data_source defined.")
+            raise ValueError
+
+        try:
+            await self._send_the_api_call(
+                f"{APIEndpoints.DATASOURCES.value}/{datasource_id}",
+                RequestsMethods.PUT,
+                self._is_message("Datasource updated"),
+                data_source,
+                "You successfully updated a datasource.",
+            )
+        finally:
+            self.domain._invalidate_the_datasource_index()
+
+    async def delete_datasource_by_id(self, datasource_id: int):
+        if datasource_id == 0:
+            logging.error("There is no datasource_id defined.")
+            raise ValueError
+
+        await self._delete_the_datasource(
+            f"{APIEndpoints.DATASOURCES.value}/{datasource_id}"
+        )
+
+    async def delete_datasource_by_uid(self, uid: str):
+        if len(uid) == 0:
+            logging.error("There is no uid defined.")
+            raise ValueError
+
+        await self._delete_the_datasource(f"{APIEndpoints.DATASOURCES.value}/uid/{uid}")
+
+    async def delete_datasource_by_name(self, name: str):
+        if len(name) == 0:
+            logging.error("There is no name defined.")
+            raise ValueError
+
+        await self._delete_the_datasource(
+            f"{APIEndpoints.DATASOURCES.value}/name/{name}"
+        )
+
+    async def _delete_the_datasource(self, api_call: str):
+        """The method includes a functionality to delete a datasource and to invalidate the datasource registries of the model
+
+        Args:
+            api_call (str): Specify the API call endpoint of the datasource
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            None
+        """
+
+        try:
+            await self._send_the_api_call(
+                api_call,
+                RequestsMethods.DELETE,
+                self._is_message("Data source deleted"),
+                success_message="You successfully deleted a datasource.",
+            )
+        finally:
+            self.domain._invalidate_the_datasource_index()
+
+
+class AsyncDatasourceQueryResourceCaching(
+    AsyncDomain, domain_class=DatasourceQueryResourceCaching
+):
+    """The class includes all necessary methods to access the Grafana datasource query and resource caching API endpoints asynchronously"""
+
+
+class AsyncExternalGroup(AsyncDomain, domain_class=ExternalGroup):
+    """The class includes all necessary methods to access the Grafana external group API endpoints asynchronously"""
+
+
+class AsyncFolder(AsyncDomain, domain_class=Folder):
+    """The class includes all necessary methods to access the Grafana folder API endpoints asynchronously. The get_all_folder_ids_and_names and update_folder_permissions methods are executed inside the shared thread pool"""
+
+    async def get_folders(self) -> list:
+        return await self._get_the_api_call(
+            APIEndpoints.FOLDERS.value, self._is_valid_list("id")
+        )
+
+    async def get_folder_by_uid(self, uid: str) -> dict:
+        if len(uid) == 0:
+            logging.error("There is no dashboard uid defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.FOLDERS.value}/{uid}", self._is_valid_dict("id")
+        )
+
+    async def get_folder_by_id(self, id: int) -> dict:
+        if id == 0:
+            logging.error("There is no folder id defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.FOLDERS.value}/id/{id}", self._is_valid_dict("id")
+        )
+
+    async def get_folder_permissions(self, uid: str) -> list:
+        if len(uid) == 0:
+            logging.error("There is no folder uid defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.FOLDERS.value}/{uid}/permissions",
+            self._is_valid_list("folderId"),
+        )
+
+    async def create_folder(self, title: str, uid: str = None) -> dict:
+        if len(title) == 0:
+            logging.error("There is no folder uid or title defined.")
+            raise ValueError
+
+        folder_information: dict = dict({"title": title})
+
+        if uid is not None and len(uid) != 0:
+            folder_information.update({"uid": uid})
+
+        try:
+            return await self._send_the_api_call(
+                APIEndpoints.FOLDERS.value,
+                RequestsMethods.POST,
+                self._is_valid_dict("id"),
+                folder_information,
+            )
+        finally:
+            self.domain._invalidate_the_folder_index()
+
+    async def update_folder(
+        self, title: str, uid: str, version: int = 0, overwrite: bool = False
+    ) -> dict:
+        if overwrite is True:
+            version = None
+
+        if len(title) == 0 or version == 0 or len(uid) == 0:
+            logging.error("There is no folder title, version or uid defined.")
+            raise ValueError
+
+        folder_information: dict = dict(
+            {"title": title, "overwrite": overwrite, "uid": uid}
+        )
+
+        if version is not None:
+            folder_information.update({"version": version})
+
+        try:
+            return await self._send_the_api_call(
+                f"{APIEndpoints.FOLDERS.value}/{uid}",
+                RequestsMethods.PUT,
+                self._is_valid_dict("id"),
+                folder_information,
+            )
+        finally:
+            self.domain._invalidate_the_folder_index()
+
+    async def delete_folder(self, uid: str):
+        if len(uid) == 0:
+            logging.error("There is no folder uid defined.")
+            raise ValueError
+
+        try:
+            await self._send_the_api_call(
+                f"{APIEndpoints.FOLDERS.value}/{uid}",
+                RequestsMethods.DELETE,
+                lambda result: getattr(result, "status_code", None) == 200,
+                success_message="You successfully destroyed the folder.",
+            )
+        finally:
+            self.domain._invalidate_the_folder_index()
+
+    async def get_folder_id_by_dashboard_path(self, dashboard_path: str) -> int:
+        if dashboard_path.lower() == "general":
+            return 0
+
+        if len(dashboard_path) == 0:
+            logging.error("There is no dashboard_path defined.")
+            raise ValueError
+
+        folder: dict = await self._get_the_folder_by_title(dashboard_path)
+
+        if folder is None or folder.get("id") in (None, 0):
+            logging.error(
+                f"There's no folder_id for the dashboard named {dashboard_path} available."
+            )
+            raise Exception
+
+        return folder.get("id")
+
+    async def get_folder_uid_by_dashboard_path(self, dashboard_path: str) -> str:
+        if dashboard_path.lower() == "general":
+            return None
+
+        if len(dashboard_path) == 0:
+            logging.error("There is no dashboard_path defined.")
+            raise ValueError
+
+        folder: dict = await self._get_the_folder_by_title(dashboard_path)
+
+        if folder is None or folder.get("uid") is None:
+            logging.error(
+                f"There's no folder_uid for the dashboard named {dashboard_path} available."
+            )
+            raise Exception
+
+        return folder.get("uid")
+
+    async def get_folder_index(self) -> dict:
+        api: AsyncApi = AsyncApi(self.grafana_api_model)
+        folders: dict = dict()
+        page: int = 1
+
+        while True:
+            result: list = await api.call_the_api(
+                f"{APIEndpoints.SEARCH.value}?folderIds=0&type=dash-folder"
+                f"&limit={FOLDER_PAGE_SIZE}&page={page}"
+            )
+
+            if not isinstance(result, list):
+                logging.error(f"Please, check the error: {result}.")
+                raise Exception
+
+            for folder in result:
+                folders[folder.get("title")] = dict(
+                    {"id": folder.get("id"), "uid": folder.get("uid")}
+                )
+
+            if len(result) < FOLDER_PAGE_SIZE:
+                return folders
+
+            page += 1
+
+    async def _get_the_folder_by_title(self, title: str) -> dict:
+        """The method includes a functionality to get the id and uid of a top level folder specified by the title. The shared folder lookup cache of the model is used, if the table is loaded, otherwise the folder index is loaded natively and stored inside the cache
+
+        Args:
+            title (str): Specify the title of the folder
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            folder (dict): Returns the id and uid of the folder or None, if there is no folder with the title
+        """
+
+        lookup_cache: LookupCache = AsyncApi(
+            self.grafana_api_model
+        ).get_the_lookup_cache("folders")
+        folder: dict = None if lookup_cache is None else lookup_cache.peek(title)
+
+        if folder is not None:
+            return folder
+
+        folders: dict = await self.get_folder_index()
+
+        if lookup_cache is not None:
+            lookup_cache.put(folders)
+
+        return folders.get(title)
+
+
+class AsyncLegacyAlerting(AsyncDomain, domain_class=LegacyAlerting):
+    """The class includes all necessary methods to access the Grafana legacy alerting API endpoints asynchronously"""
+
+
+class AsyncLegacyPlaylist(AsyncDomain, domain_class=LegacyPlaylist):
+    """The class includes all necessary methods to access the Grafana legacy playlist API endpoints asynchronously"""
+
+
+class AsyncLibrary(AsyncDomain, domain_class=Library):
+    """The class includes all necessary methods to access the Grafana library API endpoints asynchronously"""
+
+
+class AsyncLicensing(AsyncDomain, domain_class=Licensing):
+    """The class includes all necessary methods to access the Grafana licensing API endpoints asynchronously"""
+
+
+class AsyncOrganisation(AsyncDomain, domain_class=Organisation):
+    """The class includes all necessary methods to access the Grafana organisation API endpoints asynchronously"""
+
+
+class AsyncOrganisationAdmin(AsyncDomain, domain_class=OrganisationAdmin):
+    """The class includes all necessary methods to access the Grafana organisation admin API endpoints asynchronously"""
+
+
+class AsyncOtherHTTP(AsyncDomain, domain_class=OtherHTTP):
+    """The class includes all necessary methods to access other Grafana API endpoints asynchronously"""
+
+
+class AsyncPermissionReconciler(AsyncDomain, domain_class=PermissionReconciler):
+    """The class includes all necessary methods to reconcile the dashboard and folder permissions asynchronously"""
+
+
+class AsyncPlaylist(AsyncDomain, domain_class=Playlist):
+    """The class includes all necessary methods to access the Grafana playlist API endpoints asynchronously"""
+
+
+class AsyncPreferences(AsyncDomain, domain_class=Preferences):
+    """The class includes all necessary methods to access the Grafana preferences API endpoints asynchronously"""
+
+
+class AsyncQueryHistory(AsyncDomain, domain_class=QueryHistory):
+    """The class includes all necessary methods to access the Grafana query history API endpoints asynchronously"""
+
+
+class AsyncRBAC(AsyncDomain, domain_class=RBAC):
+    """The class includes all necessary methods to access the Grafana RBAC API endpoints asynchronously"""
+
+
+class AsyncReporting(AsyncDomain, domain_class=Reporting):
+    """The class includes all necessary methods to access the Grafana reporting API endpoints asynchronously"""
+
+
+class AsyncSearch(AsyncDomain, domain_class=Search):
+    """The class includes all necessary methods to access the Grafana search API endpoints asynchronously"""
+
+    async def search(self, search_query: str) -> list:
+        if len(search_query) == 0:
+            logging.error("There is no search_query defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.SEARCH.value}?{search_query}",
+            lambda result: result != list(),
+        )
+
+
+class AsyncServiceAccount(AsyncDomain, domain_class=ServiceAccount):
+    """The class includes all necessary methods to access the Grafana service account API endpoints asynchronously"""
+
+
+class AsyncShortUrl(AsyncDomain, domain_class=ShortUrl):
+    """The class includes all necessary methods to access the Grafana short url API endpoints asynchronously"""
+
+
+class AsyncSnapshot(AsyncDomain, domain_class=Snapshot):
+    """The class includes all necessary methods to access the Grafana snapshot API endpoints asynchronously"""
+
+
+class AsyncTeam(AsyncDomain, domain_class=Team):
+    """The class includes all necessary methods to access the Grafana team API endpoints asynchronously. The team preferences methods are executed inside the shared thread pool"""
+
+    async def search_team(
+        self, results_per_page: int = 1000, pages: int = 1, query: str = None
+    ) -> dict:
+        api_request_url: str = (
+            f"{APIEndpoints.TEAMS.value}/search?perpage={results_per_page}&page={pages}"
+        )
+
+        if query is not None and len(query) != 0:
+            api_request_url = f"{api_request_url}&query={query}"
+
+        return await self._get_the_api_call(
+            api_request_url, self._is_valid_dict("totalCount")
+        )
+
+    async def get_team_by_id(self, id: int) -> dict:
+        if id == 0:
+            logging.error("There is no id defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.TEAMS.value}/{id}", self._is_valid_dict("id")
+        )
+
+    async def add_team(self, team: TeamObject) -> int:
+        if team is None:
+            logging.error("There is no team defined.")
+            raise ValueError
+
+        api_call: dict = await self._send_the_api_call(
+            APIEndpoints.TEAMS.value,
+            RequestsMethods.POST,
+            self._is_message("Team created"),
+            dict({"name": team.name, "email": team.name}),
+        )
+
+        return int(api_call.get("teamId"))
+
+    async def update_team(self, id: int, name: str, email: str):
+        if id == 0 or len(name) == 0 or len(email) == 0:
+            logging.error("There is no id, name or email defined.")
+            raise ValueError
+
+        await self._send_the_api_call(
+            f"{APIEndpoints.TEAMS.value}/{id}",
+            RequestsMethods.PUT,
+            self._is_message("Team updated"),
+            dict({"name": name, "email": email}),
+            "You successfully updated the team.",
+        )
+
+    async def delete_team_by_id(self, id: int):
+        if id == 0:
+            logging.error("There is no id defined.")
+            raise ValueError
+
+        await self._send_the_api_call(
+            f"{APIEndpoints.TEAMS.value}/{id}",
+            RequestsMethods.DELETE,
+            self._is_message("Team deleted"),
+            success_message="You successfully deleted the team.",
+        )
+
+    async def get_team_members(self, id: int) -> list:
+        if id == 0:
+            logging.error("There is no id defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.TEAMS.value}/{id}/members", self._is_valid_list("userId")
+        )
+
+    async def add_team_member(self, id: int, user_id: int):
+        if id == 0 or user_id == 0:
+            logging.error("There is no id or user_id defined.")
+            raise ValueError
+
+        await self._send_the_api_call(
+            f"{APIEndpoints.TEAMS.value}/{id}/members",
+            RequestsMethods.POST,
+            self._is_message("Member added to Team"),
+            dict({"userId": user_id}),
+            "You successfully added a team member.",
+        )
+
+    async def delete_team_member(self, id: int, user_id: int):
+        if id == 0 or user_id == 0:
+            logging.error("There is no id or user_id defined.")
+            raise ValueError
+
+        await self._send_the_api_call(
+            f"{APIEndpoints.TEAMS.value}/{id}/members/{user_id}",
+            RequestsMethods.DELETE,
+            self._is_message("Team Member removed"),
+            success_message="You successfully removed a team member.",
+        )
+
+
+class AsyncUser(AsyncDomain, domain_class=User):
+    """The class includes all necessary methods to access the Grafana user API endpoints asynchronously. The switch_specific_user_context method is executed inside the shared thread pool"""
+
+    async def search_users(
+        self,
+        results_per_page: int = 1000,
+        pages: int = 1,
+        query: str = None,
+    ) -> list:
+        api_request_url: str = (
+            f"{APIEndpoints.USERS.value}/search?perpage={results_per_page}&page={pages}"
+        )
+
+        if query is not None and len(query) != 0:
+            api_request_url = f"{api_request_url}&query={query}"
+
+        return await self._get_the_api_call(api_request_url, self._is_valid_list("id"))
+
+    async def get_user_by_id(self, id: int) -> dict:
+        if id == 0:
+            logging.error("There is no id defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.USERS.value}/{id}", self._is_valid_dict("id")
+        )
+
+    async def get_user_by_username_or_email(self, username_or_email: str) -> dict:
+        if len(username_or_email) == 0:
+            logging.error("There is no username_or_email defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.USERS.value}/lookup?loginOrEmail={username_or_email}",
+            self._is_valid_dict("id"),
+        )
+
+    async def update_user(self, id: int, user: UserObject):
+        if id == 0 or user is None:
+            logging.error("There is no id or user defined.")
+            raise ValueError
+
+        await self._send_the_api_call(
+            f"{APIEndpoints.USERS.value}/{id}",
+            RequestsMethods.PUT,
+            self._is_message("User updated"),
+            dict(
+                {
+                    "email": user.email,
+                    "name": user.name,
+                    "login": user.login,
+                    "theme": user.theme,
+                }
+            ),
+            "You successfully modified the user.",
+        )
+
+    async def get_user_organizations(self, id: int) -> list:
+        if id == 0:
+            logging.error("There is no id defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.USERS.value}/{id}/orgs", self._is_valid_list("orgId")
+        )
+
+    async def get_user_teams(self, id: int) -> list:
+        if id == 0:
+            logging.error("There is no id defined.")
+            raise ValueError
+
+        return await self._get_the_api_call(
+            f"{APIEndpoints.USERS.value}/{id}/teams", self._is_valid_list("id")
+        )
+
+
+class AsyncCurrentUser(AsyncDomain, domain_class=CurrentUser):
+    """The class includes all necessary methods to access the Grafana current user API endpoints asynchronously"""
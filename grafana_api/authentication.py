@@ -1,4 +1,3 @@
-import json
 import logging
 
 from .model import APIModel, APIEndpoints, RequestsMethods
@@ -72,14 +71,12 @@ class Authentication:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.AUTHENTICATION.value,
                 RequestsMethods.POST,
-                json.dumps(
-                    dict(
-                        {
-                            "name": name,
-                            "role": role,
-                            "secondsToLive": seconds_to_live,
-                        }
-                    )
+                dict(
+                    {
+                        "name": name,
+                        "role": role,
+                        "secondsToLive": seconds_to_live,
+                    }
                 ),
                 org_id_header=org_id_header,
             )
@@ -0,0 +1,409 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from .model import APIEndpoints, CachePolicy, RequestsMethods
+
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
+
+# The search results include the dashboards and folders, the corresponding
+# mutations invalidate the cached search results as well
+_DEPENDENT_ENDPOINTS: dict = {
+    APIEndpoints.DASHBOARDS.value: (APIEndpoints.SEARCH.value,),
+    APIEndpoints.FOLDERS.value: (APIEndpoints.SEARCH.value,),
+}
+
+# Switching the organisation of the user changes the responses of all
+# endpoints that are cached without an explicit organisation id
+_CONTEXT_SWITCH_ENDPOINTS: tuple = (f"{APIEndpoints.USER.value}/using",)
+
+
+class ResponseCache:
+    """The class includes the functionality of a thread-safe in-memory cache for the responses of the GET requests. The entries expire after the TTL of the corresponding endpoint, the least recently used entries are evicted if the cache is full and all entries of a resource prefix are invalidated by PUT, POST, PATCH or DELETE requests
+
+    Args:
+        cache_policy (CachePolicy): Specify the cache policy
+
+    Attributes:
+        cache_policy (CachePolicy): This is where we store the cache_policy
+    """
+
+    def __init__(self, cache_policy: CachePolicy):
+        self.cache_policy = cache_policy
+        self._entries: OrderedDict = OrderedDict()
+        self._lock: threading.RLock = threading.RLock()
+        self._endpoint_ttls: list = sorted(
+            [
+                (getattr(prefix, "value", prefix), ttl)
+                for prefix, ttl in (cache_policy.endpoint_ttls or dict()).items()
+            ],
+            key=lambda endpoint_ttl: len(endpoint_ttl[0]),
+            reverse=True,
+        )
+        self._resource_prefixes: list = sorted(
+            {endpoint.value for endpoint in APIEndpoints if endpoint.value != "v1"}
+            | {prefix for prefix, _ in self._endpoint_ttls},
+            key=len,
+            reverse=True,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def get_the_key(method: str, api_call: str, headers: dict = None) -> tuple:
+        """The method includes a functionality to create the cache key of a request
+
+        Args:
+            method (str): Specify the used method
+            api_call (str): Specify the API call endpoint including the query string
+            headers (dict): Specify the optional headers of the request (default None)
+
+        Returns:
+            key (tuple): Returns the cache key that consists of the organization header, the method and the API call
+        """
+
+        return (headers or dict()).get("X-Grafana-Org-Id"), method, api_call
+
+    def get_the_ttl(self, api_call: str) -> float:
+        """The method includes a functionality to get the TTL of an API call. The TTL of the longest matching endpoint prefix is used and the default TTL is the fallback
+
+        Args:
+            api_call (str): Specify the API call endpoint
+
+        Returns:
+            ttl (float): Returns the TTL in seconds
+        """
+
+        for prefix, ttl in self._endpoint_ttls:
+            if api_call.startswith(prefix):
+                return ttl
+
+        return self.cache_policy.ttl
+
+    def get(self, key: tuple) -> "httpx.Response":
+        """The method includes a functionality to get a cached response
+
+        Args:
+            key (tuple): Specify the cache key
+
+        Returns:
+            response (httpx.Response): Returns the cached response or None, if there is no valid entry
+        """
+
+        with self._lock:
+            entry: tuple = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: tuple, response: "httpx.Response", ttl: float):
+        """The method includes a functionality to cache a response and to evict the least recently used entries
+
+        Args:
+            key (tuple): Specify the cache key
+            response (httpx.Response): Specify the response
+            ttl (float): Specify the TTL in seconds
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.cache_policy.max_size:
+                self._entries.popitem(last=False)
+
+    def update(self, key: tuple, response: "httpx.Response"):
+        """The method includes a functionality to update the cache with the response of a request. Successful GET responses are cached and all other methods invalidate the resource prefix of the API call
+
+        Args:
+            key (tuple): Specify the cache key
+            response (httpx.Response): Specify the response
+
+        Returns:
+            None
+        """
+
+        if key[1] == RequestsMethods.GET.value:
+            ttl: float = self.get_the_ttl(key[2])
+
+            if ttl > 0 and 200 <= response.status_code < 300:
+                self.set(key, response, ttl)
+        else:
+            self.invalidate(key[2])
+
+    def invalidate(self, api_call: str):
+        """The method includes a functionality to invalidate all cached responses of the resource prefix of an API call. The resource prefix is the longest matching endpoint and the search results are invalidated by the dashboard and folder mutations. Switching the organisation of the user clears the whole cache
+
+        Args:
+            api_call (str): Specify the API call endpoint
+
+        Returns:
+            None
+        """
+
+        path: str = api_call.split("?", 1)[0]
+
+        for endpoint in _CONTEXT_SWITCH_ENDPOINTS:
+            if path.rstrip("/") == endpoint or path.startswith(f"{endpoint}/"):
+                self.clear()
+                return None
+
+        prefixes: tuple = (path,)
+
+        for prefix in self._resource_prefixes:
+            if path.startswith(prefix):
+                prefixes = (prefix,) + _DEPENDENT_ENDPOINTS.get(prefix, tuple())
+                break
+
+        with self._lock:
+            for key in [
+                key for key in self._entries.keys() if key[2].startswith(prefixes)
+            ]:
+                del self._entries[key]
+
+    def clear(self):
+        """The method includes a functionality to remove all cached responses
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self._entries.clear()
+
+
+class ValidatorCache:
+    """The class includes the functionality of a thread-safe in-memory store for the GET responses that include an ETag or a Last-Modified validator. The validators are used to send conditional requests and the stored response is served if the server responds with 304 Not Modified. The least recently used responses are evicted if the store is full
+
+    Args:
+        max_size (int): Specify the maximum number of the stored responses (default 1024)
+
+    Attributes:
+        max_size (int): This is where we store the max_size
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple) -> "httpx.Response":
+        """The method includes a functionality to get a stored response
+
+        Args:
+            key (tuple): Specify the cache key
+
+        Returns:
+            response (httpx.Response): Returns the stored response or None, if there is no response stored
+        """
+
+        with self._lock:
+            response: httpx.Response = self._entries.get(key)
+
+            if response is not None:
+                self._entries.move_to_end(key)
+
+            return response
+
+    def get_the_conditional_headers(self, key: tuple) -> dict:
+        """The method includes a functionality to get the conditional headers based on the validators of a stored response
+
+        Args:
+            key (tuple): Specify the cache key
+
+        Returns:
+            headers (dict): Returns the If-None-Match and If-Modified-Since headers or an empty dict, if there is no response stored
+        """
+
+        response: httpx.Response = self.get(key)
+        headers: dict = dict()
+
+        if response is not None:
+            if "ETag" in response.headers:
+                headers["If-None-Match"] = response.headers["ETag"]
+            if "Last-Modified" in response.headers:
+                headers["If-Modified-Since"] = response.headers["Last-Modified"]
+
+        return headers
+
+    def update(self, key: tuple, response: "httpx.Response") -> "httpx.Response":
+        """The method includes a functionality to update the store with the response of a conditional request. Successful responses with validators are stored and a 304 Not Modified response is replaced by the stored response
+
+        Args:
+            key (tuple): Specify the cache key
+            response (httpx.Response): Specify the response
+
+        Returns:
+            response (httpx.Response): Returns the stored response in case of a 304 Not Modified response, otherwise the inserted response
+        """
+
+        if response.status_code == 304:
+            return self.get(key) or response
+
+        if 200 <= response.status_code < 300 and (
+            "ETag" in response.headers or "Last-Modified" in response.headers
+        ):
+            with self._lock:
+                self._entries[key] = response
+                self._entries.move_to_end(key)
+
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+        return response
+
+
+class LookupCache:
+    """The class includes the functionality of a thread-safe cache for a lookup table e.g. the folder titles and the corresponding ids. The table is loaded by the inserted function, expires after the TTL and is loaded again once if a key is missing, because the key could be created by another client. Concurrent callers wait for a single load
+
+    Args:
+        ttl (float): Specify the TTL of the lookup table in seconds
+
+    Attributes:
+        ttl (float): This is where we store the ttl
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._table: dict = None
+        self._expires: float = 0.0
+        self._lock: threading.RLock = threading.RLock()
+
+    def get(self, load: callable) -> dict:
+        """The method includes a functionality to get the lookup table and to load the table if it is missing or expired
+
+        Args:
+            load (callable): Specify the function that loads the lookup table
+
+        Returns:
+            table (dict): Returns the lookup table
+        """
+
+        with self._lock:
+            if self._table is None or self._expires <= time.monotonic():
+                self._table = load()
+                self._expires = time.monotonic() + self.ttl
+
+            return self._table
+
+    def lookup(self, load: callable, key: any) -> any:
+        """The method includes a functionality to get the value of a key of the lookup table. The table is loaded again once, if the key is missing inside a table that was not loaded by the call
+
+        Args:
+            load (callable): Specify the function that loads the lookup table
+            key (any): Specify the key
+
+        Returns:
+            value (any): Returns the value or None, if the key is missing
+        """
+
+        return self.find(load, lambda table: table.get(key))
+
+    def find(self, load: callable, find: callable) -> any:
+        """The method includes a functionality to find a value inside the lookup table. The table is loaded again once, if the value is missing inside a table that was not loaded by the call
+
+        Args:
+            load (callable): Specify the function that loads the lookup table
+            find (callable): Specify the function that receives the lookup table and returns the value or None
+
+        Returns:
+            value (any): Returns the value or None, if the value is missing
+        """
+
+        with self._lock:
+            table: dict = self._table
+            value: any = find(self.get(load))
+
+            if value is None and table is not None and table is self._table:
+                self.invalidate()
+                value = find(self.get(load))
+
+            return value
+
+    def peek(self, key: any) -> any:
+        """The method includes a functionality to get the value of a key of the loaded lookup table. The table is not loaded by the method
+
+        Args:
+            key (any): Specify the key
+
+        Returns:
+            value (any): Returns the value or None, if the table is not loaded, expired or the key is missing
+        """
+
+        with self._lock:
+            if self._table is None or self._expires <= time.monotonic():
+                return None
+
+            return self._table.get(key)
+
+    def put(self, table: dict):
+        """The method includes a functionality to replace the lookup table by a table that was loaded outside the cache e.g. by a native coroutine. The TTL starts again
+
+        Args:
+            table (dict): Specify the lookup table
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self._table = table
+            self._expires = time.monotonic() + self.ttl
+
+    def set(self, key: any, value: any):
+        """The method includes a functionality to insert or replace a value of the loaded lookup table e.g. after a mutation. The table is not loaded by the method
+
+        Args:
+            key (any): Specify the key
+            value (any): Specify the value
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            if self._table is not None:
+                self._table[key] = value
+
+    def discard(self, predicate: callable):
+        """The method includes a functionality to remove all entries of the loaded lookup table that match the inserted predicate e.g. after a deletion. The table is not loaded by the method
+
+        Args:
+            predicate (callable): Specify the function that receives the key and the value of an entry and returns if the entry should be removed
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            if self._table is not None:
+                for key in [
+                    key for key, value in self._table.items() if predicate(key, value)
+                ]:
+                    del self._table[key]
+
+    def invalidate(self):
+        """The method includes a functionality to invalidate the lookup table. The table is loaded again on the next access
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self._table = None
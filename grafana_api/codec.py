@@ -0,0 +1,233 @@
+import codecs
+import json
+import re
+
+
+class JSONCodec:
+    """The class includes the functionality to encode the request bodies and to decode the response bodies based on the Python standard library json module"""
+
+    name: str = "json"
+
+    def dumps(self, obj: any) -> bytes:
+        """The method includes a functionality to encode a JSON serializable object
+
+        Args:
+            obj (any): Specify the JSON serializable object
+
+        Raises:
+            TypeError: The object is not JSON serializable
+
+        Returns:
+            content (bytes): Returns the encoded object
+        """
+
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, content: any) -> any:
+        """The method includes a functionality to decode a JSON document
+
+        Args:
+            content (any): Specify the JSON document as bytes or string
+
+        Raises:
+            ValueError: The content is not a valid JSON document
+            TypeError: The content is not a bytes or string object
+
+        Returns:
+            obj (any): Returns the decoded object
+        """
+
+        return json.loads(content)
+
+
+class OrjsonCodec(JSONCodec):
+    """The class includes the functionality to encode the request bodies and to decode the response bodies based on the orjson library"""
+
+    name: str = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, obj: any) -> bytes:
+        """The method includes a functionality to encode a JSON serializable object
+
+        Args:
+            obj (any): Specify the JSON serializable object
+
+        Raises:
+            TypeError: The object is not JSON serializable
+
+        Returns:
+            content (bytes): Returns the encoded object
+        """
+
+        return self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, content: any) -> any:
+        """The method includes a functionality to decode a JSON document
+
+        Args:
+            content (any): Specify the JSON document as bytes or string
+
+        Raises:
+            ValueError: The content is not a valid JSON document
+
+        Returns:
+            obj (any): Returns the decoded object
+        """
+
+        return self._orjson.loads(content)
+
+
+class UjsonCodec(JSONCodec):
+    """The class includes the functionality to encode the request bodies and to decode the response bodies based on the ujson library"""
+
+    name: str = "ujson"
+
+    def __init__(self):
+        import ujson
+
+        self._ujson = ujson
+
+    def dumps(self, obj: any) -> bytes:
+        """The method includes a functionality to encode a JSON serializable object
+
+        Args:
+            obj (any): Specify the JSON serializable object
+
+        Raises:
+            TypeError: The object is not JSON serializable
+
+        Returns:
+            content (bytes): Returns the encoded object
+        """
+
+        return self._ujson.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def loads(self, content: any) -> any:
+        """The method includes a functionality to decode a JSON document
+
+        Args:
+            content (any): Specify the JSON document as bytes or string
+
+        Raises:
+            ValueError: The content is not a valid JSON document
+            TypeError: The content is not a bytes or string object
+
+        Returns:
+            obj (any): Returns the decoded object
+        """
+
+        return self._ujson.loads(content)
+
+
+# The regular expression matches the optional whitespace between the JSON tokens
+_WHITESPACE: re.Pattern = re.compile(r"[ \t\n\r]*")
+
+
+class JSONArrayDecoder:
+    """The class includes the functionality to decode the elements of a top-level JSON array incrementally. The body is inserted in chunks and only the not yet decoded rest of the body is buffered, so the memory usage is bounded by the size of the largest element
+
+    Attributes:
+        elements (int): This is where we store the number of the decoded elements
+    """
+
+    _START, _FIRST_ELEMENT, _ELEMENT, _SEPARATOR, _END = range(5)
+
+    def __init__(self):
+        self.elements: int = 0
+        self._decoder: json.JSONDecoder = json.JSONDecoder()
+        self._text_decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder(
+            "utf-8"
+        )()
+        self._buffer: str = ""
+        self._state: int = self._START
+
+    def feed(self, chunk: bytes, final: bool = False) -> list:
+        """The method includes a functionality to insert the next chunk of the body and to decode all completed elements
+
+        Args:
+            chunk (bytes): Specify the next chunk of the body
+            final (bool): Specify if the chunk is the last chunk of the body (default False)
+
+        Raises:
+            ValueError: The body is not a valid JSON array
+
+        Returns:
+            elements (list): Returns the completed elements
+        """
+
+        buffer: str = self._buffer + self._text_decoder.decode(chunk, final)
+        elements: list = list()
+        position: int = 0
+
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+
+            if position >= len(buffer):
+                break
+
+            character: str = buffer[position]
+
+            if self._state == self._START:
+                if character != "[":
+                    raise ValueError("The JSON document is not an array.")
+                position += 1
+                self._state = self._FIRST_ELEMENT
+            elif self._state == self._END:
+                raise ValueError("Extra data after the JSON array.")
+            elif self._state == self._SEPARATOR or (
+                self._state == self._FIRST_ELEMENT and character == "]"
+            ):
+                if character == "]":
+                    self._state = self._END
+                elif character == "," and self._state == self._SEPARATOR:
+                    self._state = self._ELEMENT
+                else:
+                    raise ValueError(f"Unexpected character {character!r}.")
+                position += 1
+            else:
+                try:
+                    element, end = self._decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError as e:
+                    if final:
+                        raise ValueError(f"The JSON array is not valid: {e}.")
+                    break
+
+                # Numbers can be continued by the next chunk, so an element is only complete if it is followed by a separator
+                separator: int = _WHITESPACE.match(buffer, end).end()
+
+                if not final and (
+                    separator >= len(buffer) or buffer[separator] not in ",]"
+                ):
+                    break
+
+                elements.append(element)
+                position = end
+                self._state = self._SEPARATOR
+
+        self._buffer = buffer[position:]
+        self.elements += len(elements)
+
+        if final and self._state != self._END:
+            raise ValueError("The JSON array is not complete.")
+
+        return elements
+
+
+def get_default_codec() -> JSONCodec:
+    """The function includes a functionality to get the fastest available JSON codec. The orjson and the ujson libraries are optional and the standard library codec is used as fallback
+
+    Returns:
+        codec (JSONCodec): Returns the JSON codec
+    """
+
+    for codec in (OrjsonCodec, UjsonCodec):
+        try:
+            return codec()
+        except ImportError:
+            continue
+
+    return JSONCodec()
@@ -1,9 +1,18 @@
+import collections
+import contextlib
+import functools
 import json
 import logging
+import os
+from typing import Iterator, TYPE_CHECKING
 
-from .model import APIModel, APIEndpoints, RequestsMethods
+from .model import APIModel, APIEndpoints, RequestsMethods, SearchHit
 from .folder import Folder
 from .api import Api
+from .cache import LookupCache
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .search import SearchIndex
 
 
 class Dashboard:
@@ -57,13 +66,26 @@ class Dashboard:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.DASHBOARDS.value}/db",
                 RequestsMethods.POST,
-                json.dumps(dashboard_json_complete),
+                dashboard_json_complete,
             )
 
             if api_call.get("status") != "success":
                 logging.error(f"Check the error: {api_call}.")
                 raise Exception
             else:
+                self._update_the_dashboard_index(
+                    api_call.get("uid"),
+                    SearchHit(
+                        id=api_call.get("id"),
+                        uid=api_call.get("uid"),
+                        title=dashboard_json.get("title"),
+                        type="dash-db",
+                        url=api_call.get("url"),
+                        slug=api_call.get("slug"),
+                        tags=dashboard_json.get("tags", list()),
+                        folder_id=folder_id or None,
+                    ),
+                )
                 logging.info("You successfully deployed the dashboard.")
         else:
             logging.error(
@@ -103,6 +125,7 @@ class Dashboard:
                     logging.error(f"Please, check the error: {api_call}.")
                     raise Exception
                 else:
+                    self._update_the_dashboard_index(dashboard_uid.get("uid"))
                     logging.info("You successfully destroyed the dashboard.")
             else:
                 logging.error("Nothing to delete. There is no dashboard available.")
@@ -200,6 +223,19 @@ class Dashboard:
             folder_id: int = Folder(
                 self.grafana_api_model
             ).get_folder_id_by_dashboard_path(dashboard_path)
+            lookup_cache: LookupCache = Api(
+                self.grafana_api_model
+            ).get_the_lookup_cache("dashboards")
+
+            if lookup_cache is not None:
+                hit: SearchHit = lookup_cache.find(
+                    self._load_the_search_index,
+                    lambda table: self._find_the_dashboard(
+                        table["search_index"], folder_id, dashboard_name
+                    ),
+                )
+
+                return None if hit is None else dict({"uid": hit.uid, "id": hit.id})
 
             search_query: str = f"{APIEndpoints.SEARCH.value}?folderIds={folder_id}&query={dashboard_name}"
             dashboard_meta: list = Api(self.grafana_api_model).call_the_api(
@@ -304,7 +340,7 @@ class Dashboard:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.DASHBOARDS.value}/id/{id}/permissions",
                 RequestsMethods.POST,
-                json.dumps(permission_json),
+                permission_json,
             )
 
             if api_call.get("message") != "Dashboard permissions updated":
@@ -335,7 +371,7 @@ class Dashboard:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.DASHBOARDS.value}/uid/{uid}/permissions",
                 RequestsMethods.POST,
-                json.dumps(permission_json),
+                permission_json,
             )
 
             if api_call.get("message") != "Dashboard permissions updated":
@@ -461,6 +497,121 @@ class Dashboard:
             logging.error("There is no dashboard uid or version_id defined.")
             raise ValueError
 
+    def iter_dashboard_versions(
+        self,
+        uids: list,
+        page_size: int = 100,
+        concurrency: int = None,
+        deduplicate: bool = True,
+        target: str = None,
+    ) -> Iterator[dict]:
+        """The method includes a functionality to iterate over the version history of multiple dashboards. The versions of every dashboard are paged by the limit and start parameters and the version bodies are requested concurrently inside the shared thread pool, so at most concurrency version bodies are kept in memory. Consecutive versions of a dashboard with an identical dashboard model are skipped and the versions are optionally written as {uid}/{version}.json to a directory, a tar archive or a zip archive
+
+        Args:
+            uids (list): Specify the list of the dashboard uids
+            page_size (int): Specify the number of the versions per page (default 100)
+            concurrency (int): Specify the optional maximum number of the concurrently requested version bodies. The default value is the max_workers value of the model (default None)
+            deduplicate (bool): Specify if consecutive versions with an identical dashboard model should be skipped (default True)
+            target (str): Specify the optional path of the target directory or archive (default None)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            versions (Iterator[dict]): Returns an iterator over the dashboard versions including the dashboard model as data, starting with the newest version of every dashboard
+        """
+
+        if len(uids) == 0 or page_size <= 0:
+            logging.error("There is no dashboard uid or valid page_size defined.")
+            raise ValueError
+
+        version_uids: collections.deque = collections.deque()
+
+        def _get_the_operations():
+            for uid in uids:
+                for version in self._iter_the_dashboard_version_entries(uid, page_size):
+                    version_uids.append(uid)
+                    yield functools.partial(
+                        self.get_dashboard_version_by_uid, uid, version.get("version")
+                    )
+
+        previous: dict = dict()
+
+        with contextlib.ExitStack() as stack:
+            writer: _DashboardWriter = (
+                None
+                if target is None
+                else stack.enter_context(_DashboardWriter(target))
+            )
+
+            for result in Api(self.grafana_api_model).batch_iter(
+                _get_the_operations(), concurrency
+            ):
+                uid: str = version_uids.popleft()
+
+                if not result.successful:
+                    raise result.error
+
+                version: dict = result.result
+
+                if deduplicate:
+                    version_hash: str = self.get_dashboard_hash(
+                        version.get("data") or dict()
+                    )
+
+                    if previous.get(uid) == version_hash:
+                        continue
+
+                    previous = dict({uid: version_hash})
+
+                if writer is not None:
+                    writer.write(
+                        f"{uid}/{version.get('version')}.json",
+                        self.grafana_api_model.codec.dumps(version),
+                    )
+
+                yield version
+
+    def _iter_the_dashboard_version_entries(
+        self, uid: str, page_size: int
+    ) -> Iterator[dict]:
+        """The method includes a functionality to iterate over the version entries of a dashboard. All pages of the versions API are requested
+
+        Args:
+            uid (str): Specify the uid of the dashboard
+            page_size (int): Specify the number of the versions per page
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            versions (Iterator[dict]): Returns an iterator over the version entries without the dashboard model
+        """
+
+        api: Api = Api(self.grafana_api_model)
+
+        def _get_the_page(page: int) -> list:
+            api_call: any = api.call_the_api(
+                f"{APIEndpoints.DASHBOARDS.value}/uid/{uid}/versions"
+                f"?limit={page_size}&start={page * page_size}"
+            )
+
+            # Newer Grafana versions wrap the version entries inside an object
+            if isinstance(api_call, dict) and isinstance(
+                api_call.get("versions"), list
+            ):
+                api_call = api_call.get("versions")
+
+            if not isinstance(api_call, list):
+                logging.error(f"Please, check the error: {api_call}.")
+                raise Exception
+
+            return api_call
+
+        for page in api.paginate(_get_the_page, page_size, prefetch=0, first_page=0):
+            yield from page
+
     def restore_dashboard_version(self, id: int, version: dict):
         """The method includes a functionality to restore a specified version of a dashboard based on the specified dashboard id and a version as dict of the dashboard
 
@@ -480,7 +631,7 @@ class Dashboard:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.DASHBOARDS.value}/id/{id}/restore",
                 RequestsMethods.POST,
-                json.dumps(version),
+                version,
             )
 
             if (
@@ -490,6 +641,7 @@ class Dashboard:
                 logging.error(f"Check the error: {api_call}.")
                 raise Exception
             else:
+                self._update_the_restored_dashboard_index(api_call.get("uid"))
                 logging.info("You successfully restored the dashboard.")
         else:
             logging.error("There is no dashboard id or version_id defined.")
@@ -514,7 +666,7 @@ class Dashboard:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.DASHBOARDS.value}/uid/{uid}/restore",
                 RequestsMethods.POST,
-                json.dumps(version),
+                version,
             )
 
             if (
@@ -524,6 +676,7 @@ class Dashboard:
                 logging.error(f"Check the error: {api_call}.")
                 raise Exception
             else:
+                self._update_the_restored_dashboard_index(uid)
                 logging.info("You successfully restored the dashboard.")
         else:
             logging.error("There is no dashboard uid or version_id defined.")
@@ -564,7 +717,7 @@ class Dashboard:
                 api_call: any = Api(self.grafana_api_model).call_the_api(
                     f"{APIEndpoints.DASHBOARDS.value}/calculate-diff",
                     RequestsMethods.POST,
-                    json.dumps(diff_object),
+                    diff_object,
                 )
 
                 if api_call.status_code != 200:
@@ -582,3 +735,466 @@ class Dashboard:
                 f"The diff_type: {diff_type.lower()} is not valid. Please specify a valid value."
             )
             raise ValueError
+
+    def export_all(self, target: str, concurrency: int = None) -> list:
+        """The method includes a functionality to export all dashboards of the organization to a directory, a tar archive (.tar, .tar.gz or .tgz) or a zip archive (.zip). The dashboards are enumerated by the paginated search API and requested concurrently inside the shared thread pool. Every dashboard is written as {folder_uid}/{uid}.json directly after the download, so at most concurrency dashboards are kept in memory. A manifest.json with the uid, title, version and folder of every exported dashboard is written at the end
+
+        Args:
+            target (str): Specify the path of the target directory or archive
+            concurrency (int): Specify the optional maximum number of the concurrently requested dashboards. The default value is the max_workers value of the model (default None)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call. The error is raised after the export of all other dashboards
+
+        Returns:
+            manifest (list): Returns the manifest of the exported dashboards
+        """
+
+        if len(target) == 0:
+            logging.error("There is no target defined.")
+            raise ValueError
+
+        from .search import Search
+
+        hits: collections.deque = collections.deque()
+        manifest: list = list()
+        failed_uids: list = list()
+
+        def _get_the_operations():
+            for hit in Search(self.grafana_api_model).iter_search(type="dash-db"):
+                hits.append(hit)
+                yield functools.partial(self.get_dashboard_by_uid, hit.uid)
+
+        with _DashboardWriter(target) as writer:
+            for result in Api(self.grafana_api_model).batch_iter(
+                _get_the_operations(), concurrency
+            ):
+                hit: SearchHit = hits.popleft()
+
+                if not result.successful:
+                    logging.error(f"Check the error: {result.error}.")
+                    failed_uids.append(hit.uid)
+                    continue
+
+                path: str = f"{hit.folder_uid or 'general'}/{hit.uid}.json"
+                writer.write(
+                    path,
+                    self.grafana_api_model.codec.dumps(result.result.get("dashboard")),
+                )
+                manifest.append(
+                    dict(
+                        {
+                            "uid": hit.uid,
+                            "title": hit.title,
+                            "version": result.result.get("dashboard").get("version"),
+                            "folder_uid": hit.folder_uid,
+                            "folder_title": hit.folder_title,
+                            "path": path,
+                        }
+                    )
+                )
+
+            writer.write("manifest.json", self.grafana_api_model.codec.dumps(manifest))
+
+        if len(failed_uids) != 0:
+            logging.error(f"The export of the dashboards {failed_uids} failed.")
+            raise Exception
+
+        return manifest
+
+    def import_dashboards(
+        self,
+        source: str,
+        concurrency: int = None,
+        message: str = "Dashboard import",
+    ) -> dict:
+        """The method includes a functionality to import all dashboards of a directory, a tar archive (.tar, .tar.gz or .tgz) or a zip archive (.zip) e.g. an export of the export_all method. The first directory level specifies the folder uid and the dashboards on the top level or inside the general directory are imported into the General folder. Every dashboard is canonicalized and hashed without the volatile fields and only dashboards with a different remote hash are uploaded. The remote hashes are requested concurrently inside the shared thread pool and are cached, if a lookup cache TTL is defined
+
+        Args:
+            source (str): Specify the path of the source directory or archive
+            concurrency (int): Specify the optional maximum number of the concurrently imported dashboards. The default value is the max_workers value of the model (default None)
+            message (str): Specify the message that should be injected as commit message inside the updated dashboards (default Dashboard import)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call. The error is raised after the import of all other dashboards
+
+        Returns:
+            result (dict): Returns the number of the created, updated and unchanged dashboards
+        """
+
+        if len(source) == 0 or len(message) == 0:
+            logging.error("There is no source or message defined.")
+            raise ValueError
+
+        result: dict = dict({"created": 0, "updated": 0, "unchanged": 0})
+        failed_paths: list = list()
+        paths: collections.deque = collections.deque()
+
+        def _get_the_operations():
+            for path, folder_uid, content in _read_the_dashboards(source):
+                paths.append(path)
+                yield functools.partial(
+                    self._import_the_dashboard, folder_uid, content, message
+                )
+
+        for batch_result in Api(self.grafana_api_model).batch_iter(
+            _get_the_operations(), concurrency
+        ):
+            path: str = paths.popleft()
+
+            if batch_result.successful:
+                result[batch_result.result] += 1
+            else:
+                logging.error(f"Check the error: {batch_result.error}.")
+                failed_paths.append(path)
+
+        if result["created"] != 0 or result["updated"] != 0:
+            self._update_the_dashboard_index(None)
+
+        if len(failed_paths) != 0:
+            logging.error(f"The import of the dashboards {failed_paths} failed.")
+            raise Exception
+
+        return result
+
+    @staticmethod
+    def get_dashboard_hash(dashboard_json: dict, folder_uid: str = None) -> str:
+        """The method includes a functionality to calculate the hash of the canonical JSON representation of a dashboard. The volatile fields are ignored and the keys are sorted, so the hash only changes with the content of the dashboard
+
+        Args:
+            dashboard_json (dict): Specify the dashboard as dict
+            folder_uid (str): Specify the optional uid of the folder of the dashboard. None specifies the General folder (default None)
+
+        Returns:
+            hash (str): Returns the SHA-256 hash of the dashboard
+        """
+
+        import hashlib
+
+        from .dashboard_diff import VOLATILE_DASHBOARD_FIELDS
+
+        canonical_json: str = json.dumps(
+            [
+                folder_uid,
+                {
+                    key: value
+                    for key, value in dashboard_json.items()
+                    if key not in VOLATILE_DASHBOARD_FIELDS
+                },
+            ],
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+
+        return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+
+    def _import_the_dashboard(
+        self, folder_uid: str, content: bytes, message: str
+    ) -> str:
+        """The method includes a functionality to import a dashboard, if the remote dashboard differs from the inserted dashboard
+
+        Args:
+            folder_uid (str): Specify the uid of the folder of the dashboard. None specifies the General folder
+            content (bytes): Specify the JSON content of the dashboard
+            message (str): Specify the message that should be injected as commit message inside the dashboard
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            status (str): Returns created, updated or unchanged
+        """
+
+        dashboard_json: dict = self.grafana_api_model.codec.loads(content)
+
+        if not isinstance(dashboard_json, dict) or not dashboard_json.get("uid"):
+            logging.error("There is no dashboard uid defined.")
+            raise ValueError
+
+        uid: str = dashboard_json.get("uid")
+        local_hash: str = self.get_dashboard_hash(dashboard_json, folder_uid)
+        hashes: LookupCache = Api(self.grafana_api_model).get_the_lookup_cache(
+            "dashboard_hashes"
+        )
+        remote_hash: str = None if hashes is None else hashes.get(dict).get(uid)
+        status: str = "updated"
+
+        if remote_hash is None:
+            api_call: dict = Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.DASHBOARDS.value}/uid/{uid}",
+                response_status_code=True,
+            )
+
+            if api_call.get("status") == 404:
+                status = "created"
+            elif api_call.get("dashboard") is None:
+                logging.error(f"Please, check the error: {api_call}.")
+                raise Exception
+            else:
+                remote_hash = self.get_dashboard_hash(
+                    api_call.get("dashboard"),
+                    api_call.get("meta", dict()).get("folderUid") or None,
+                )
+
+        if remote_hash == local_hash:
+            if hashes is not None:
+                hashes.set(uid, remote_hash)
+
+            return "unchanged"
+
+        dashboard_json_complete: dict = {
+            "dashboard": dict(dashboard_json, id=None),
+            "message": message,
+            "overwrite": True,
+        }
+
+        if folder_uid is not None:
+            dashboard_json_complete.update({"folderUid": folder_uid})
+
+        api_call: dict = Api(self.grafana_api_model).call_the_api(
+            f"{APIEndpoints.DASHBOARDS.value}/db",
+            RequestsMethods.POST,
+            dashboard_json_complete,
+        )
+
+        if api_call.get("status") != "success":
+            logging.error(f"Check the error: {api_call}.")
+            raise Exception
+
+        if hashes is not None:
+            hashes.set(uid, local_hash)
+
+        return status
+
+    @staticmethod
+    def calculate_local_dashboard_diff(
+        dashboard_base: dict, dashboard_new: dict
+    ) -> list:
+        """The method includes a functionality to calculate the difference of two dashboard models locally without an API call. The volatile fields id, version and iteration are ignored and the panels are matched by the id or the gridPos
+
+        Args:
+            dashboard_base (dict): Specify the base dashboard model
+            dashboard_new (dict): Specify the new dashboard model
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            patch (list): Returns the difference as list of JSON Patch operations
+        """
+
+        from .dashboard_diff import diff_dashboards
+
+        return diff_dashboards(dashboard_base, dashboard_new)
+
+    def _update_the_dashboard_index(self, uid: str, hit: SearchHit = None):
+        """The method includes a functionality to update the shared dashboard lookup cache of the model after a mutation. The search hit of the dashboard uid is removed or replaced by the optional new search hit. Without a uid, the complete lookup cache is invalidated
+
+        Args:
+            uid (str): Specify the uid of the dashboard
+            hit (SearchHit): Specify the optional search hit of the created or updated dashboard (default None)
+
+        Returns:
+            None
+        """
+
+        hashes: LookupCache = Api(self.grafana_api_model).get_the_lookup_cache(
+            "dashboard_hashes"
+        )
+        lookup_cache: LookupCache = Api(self.grafana_api_model).get_the_lookup_cache(
+            "dashboards"
+        )
+
+        if lookup_cache is None:
+            return
+
+        if uid is None:
+            lookup_cache.invalidate()
+            return
+
+        hashes.set(uid, None)
+        search_index: "SearchIndex" = lookup_cache.peek("search_index")
+
+        if search_index is None:
+            return
+
+        if hit is None or hit.uid is None or hit.id is None or hit.title is None:
+            search_index.remove(uid)
+            return
+
+        folder: SearchHit = (
+            None if hit.folder_id is None else search_index.get_by_id(hit.folder_id)
+        )
+
+        if folder is not None:
+            hit.folder_uid, hit.folder_title = folder.uid, folder.title
+
+        search_index.update(hit)
+
+    def _update_the_restored_dashboard_index(self, uid: str):
+        """The method includes a functionality to update the shared dashboard lookup caches of the model after a restore of a dashboard version. The search hit and the hash of the dashboard are removed. Without a uid, the complete lookup caches are invalidated
+
+        Args:
+            uid (str): Specify the uid of the restored dashboard
+
+        Returns:
+            None
+        """
+
+        if uid is None:
+            hashes: LookupCache = Api(self.grafana_api_model).get_the_lookup_cache(
+                "dashboard_hashes"
+            )
+
+            if hashes is not None:
+                hashes.invalidate()
+
+        self._update_the_dashboard_index(uid)
+
+    def _load_the_search_index(self) -> dict:
+        """The method includes a functionality to load the search index of the shared dashboard lookup cache
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            table (dict): Returns the lookup table that includes the search index
+        """
+
+        from .search import SearchIndex
+
+        return dict({"search_index": SearchIndex(self.grafana_api_model).refresh()})
+
+    @staticmethod
+    def _find_the_dashboard(
+        search_index: "SearchIndex", folder_id: int, title: str
+    ) -> SearchHit:
+        """The method includes a functionality to find a dashboard of the search index specified by the folder id and the title
+
+        Args:
+            search_index (SearchIndex): Specify the search index
+            folder_id (int): Specify the folder id. 0 specifies the General folder
+            title (str): Specify the title of the dashboard
+
+        Returns:
+            hit (SearchHit): Returns the search hit of the dashboard or None, if the dashboard does not exist
+        """
+
+        for hit in search_index.find_by_title(title, type="dash-db"):
+            if (hit.folder_id or 0) == folder_id:
+                return hit
+
+        return None
+
+
+def _read_the_dashboards(source: str) -> Iterator[tuple]:
+    """The function includes a functionality to read the dashboards of a directory, a tar archive or a zip archive lazily. The first directory level specifies the folder uid and the manifest.json is skipped
+
+    Args:
+        source (str): Specify the path of the source directory or archive
+
+    Returns:
+        dashboards (Iterator[tuple]): Returns an iterator over the paths, the folder uids and the contents of the dashboards
+    """
+
+    def _get_the_folder_uid(path: str) -> str:
+        parts: list = path.strip("/").split("/")
+        return None if len(parts) == 1 or parts[0] == "general" else parts[0]
+
+    def _is_dashboard(path: str) -> bool:
+        return path.endswith(".json") and path.strip("/") != "manifest.json"
+
+    if source.endswith((".tar", ".tar.gz", ".tgz")):
+        import tarfile
+
+        with tarfile.open(source, "r:*") as archive:
+            for member in archive:
+                if member.isfile() and _is_dashboard(member.name):
+                    yield member.name, _get_the_folder_uid(
+                        member.name
+                    ), archive.extractfile(member).read()
+    elif source.endswith(".zip"):
+        import zipfile
+
+        with zipfile.ZipFile(source) as archive:
+            for name in archive.namelist():
+                if not name.endswith("/") and _is_dashboard(name):
+                    yield name, _get_the_folder_uid(name), archive.read(name)
+    else:
+        for directory, directories, files in os.walk(source):
+            directories.sort()
+
+            for file in sorted(files):
+                path: str = os.path.relpath(
+                    os.path.join(directory, file), source
+                ).replace(os.sep, "/")
+
+                if _is_dashboard(path):
+                    with open(os.path.join(directory, file), "rb") as content:
+                        yield path, _get_the_folder_uid(path), content.read()
+
+
+class _DashboardWriter:
+    """The class includes the functionality to write the exported dashboards to a directory, a tar archive or a zip archive
+
+    Args:
+        target (str): Specify the path of the target directory or archive
+
+    Attributes:
+        target (str): This is where we store the target
+    """
+
+    def __init__(self, target: str):
+        self.target = target
+        self._archive: any = None
+
+    def __enter__(self) -> "_DashboardWriter":
+        import tarfile
+        import zipfile
+
+        if self.target.endswith((".tar.gz", ".tgz")):
+            self._archive = tarfile.open(self.target, "w:gz")
+        elif self.target.endswith(".tar"):
+            self._archive = tarfile.open(self.target, "w")
+        elif self.target.endswith(".zip"):
+            self._archive = zipfile.ZipFile(self.target, "w", zipfile.ZIP_DEFLATED)
+        else:
+            os.makedirs(self.target, exist_ok=True)
+
+        return self
+
+    def __exit__(self, *exc):
+        if self._archive is not None:
+            self._archive.close()
+
+    def write(self, path: str, content: bytes):
+        """The method includes a functionality to write a file to the target
+
+        Args:
+            path (str): Specify the relative path of the file
+            content (bytes): Specify the content of the file
+
+        Returns:
+            None
+        """
+
+        import io
+        import tarfile
+        import zipfile
+
+        if isinstance(self._archive, tarfile.TarFile):
+            tar_info: tarfile.TarInfo = tarfile.TarInfo(path)
+            tar_info.size = len(content)
+            self._archive.addfile(tar_info, io.BytesIO(content))
+        elif isinstance(self._archive, zipfile.ZipFile):
+            self._archive.writestr(path, content)
+        else:
+            file_path: str = os.path.join(self.target, path)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+            with open(file_path, "wb") as file:
+                file.write(content)
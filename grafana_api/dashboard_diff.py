@@ -0,0 +1,444 @@
+import copy
+import logging
+
+# The fields of the dashboard model that are changed by Grafana with every save and that are ignored by the comparisons
+VOLATILE_DASHBOARD_FIELDS: tuple = ("id", "version", "iteration")
+
+
+def diff_dashboards(
+    dashboard_base: dict,
+    dashboard_new: dict,
+    ignored_fields: tuple = VOLATILE_DASHBOARD_FIELDS,
+) -> list:
+    """The function includes a functionality to calculate the structural difference of two dashboard models locally as JSON Patch (RFC 6902). The ignored top level fields are skipped, the panels are matched by the id or, if the id is missing, by the gridPos and only the changed subtrees are compared
+
+    Args:
+        dashboard_base (dict): Specify the base dashboard model
+        dashboard_new (dict): Specify the new dashboard model
+        ignored_fields (tuple): Specify the top level fields that are ignored (default id, version and iteration)
+
+    Raises:
+        ValueError: Missed specifying a necessary value
+
+    Returns:
+        patch (list): Returns the list of the JSON Patch operations that transform the base dashboard into the new dashboard
+    """
+
+    if not isinstance(dashboard_base, dict) or not isinstance(dashboard_new, dict):
+        logging.error("Please define the dashboards as dict.")
+        raise ValueError
+
+    patch: list = list()
+    _diff_the_dicts(
+        {
+            key: value
+            for key, value in dashboard_base.items()
+            if key not in ignored_fields
+        },
+        {
+            key: value
+            for key, value in dashboard_new.items()
+            if key not in ignored_fields
+        },
+        "",
+        patch,
+    )
+
+    return patch
+
+
+def patch_dashboard(dashboard: dict, patch: list) -> dict:
+    """The function includes a functionality to apply a JSON Patch (RFC 6902) to a dashboard model. The inserted dashboard is not modified
+
+    Args:
+        dashboard (dict): Specify the dashboard model
+        patch (list): Specify the list of the JSON Patch operations
+
+    Raises:
+        ValueError: The patch includes an invalid operation or path
+
+    Returns:
+        dashboard (dict): Returns the patched dashboard model
+    """
+
+    document: any = copy.deepcopy(dashboard)
+
+    for operation in patch:
+        op: str = operation.get("op")
+
+        if op == "add":
+            document = _add_the_value(
+                document, operation["path"], copy.deepcopy(operation["value"])
+            )
+        elif op == "remove":
+            _remove_the_value(document, operation["path"])
+        elif op == "replace":
+            document = _add_the_value(
+                _remove_the_value(document, operation["path"])[0],
+                operation["path"],
+                copy.deepcopy(operation["value"]),
+            )
+        elif op in ("move", "copy"):
+            value: any = _get_the_value(document, operation["from"])
+
+            if op == "move":
+                _remove_the_value(document, operation["from"])
+            else:
+                value = copy.deepcopy(value)
+
+            document = _add_the_value(document, operation["path"], value)
+        elif op == "test":
+            if _get_the_value(document, operation["path"]) != operation["value"]:
+                logging.error(f"The test operation {operation} failed.")
+                raise ValueError
+        else:
+            logging.error(f"The operation {operation} is not valid.")
+            raise ValueError
+
+    return document
+
+
+def _diff_the_values(base: any, new: any, path: str, patch: list):
+    """The function includes a functionality to compare two JSON values and to append the corresponding JSON Patch operations
+
+    Args:
+        base (any): Specify the base value
+        new (any): Specify the new value
+        path (str): Specify the JSON Pointer of the values
+        patch (list): Specify the list of the JSON Patch operations
+
+    Returns:
+        None
+    """
+
+    if isinstance(base, dict) and isinstance(new, dict):
+        _diff_the_dicts(base, new, path, patch)
+    elif isinstance(base, list) and isinstance(new, list):
+        if path.endswith("/panels") and _is_panel_list(base) and _is_panel_list(new):
+            _diff_the_panels(base, new, path, patch)
+        else:
+            _diff_the_lists(base, new, path, patch)
+    elif type(base) is not type(new) or base != new:
+        # The scalars are compared by type and value, because True == 1 == 1.0
+        patch.append({"op": "replace", "path": path, "value": new})
+
+
+def _diff_the_dicts(base: dict, new: dict, path: str, patch: list):
+    """The function includes a functionality to compare two JSON objects key by key
+
+    Args:
+        base (dict): Specify the base object
+        new (dict): Specify the new object
+        path (str): Specify the JSON Pointer of the objects
+        patch (list): Specify the list of the JSON Patch operations
+
+    Returns:
+        None
+    """
+
+    for key, value in base.items():
+        key_path: str = f"{path}/{_escape(key)}"
+
+        if key not in new:
+            patch.append({"op": "remove", "path": key_path})
+        else:
+            _diff_the_values(value, new[key], key_path, patch)
+
+    for key, value in new.items():
+        if key not in base:
+            patch.append(
+                {"op": "add", "path": f"{path}/{_escape(key)}", "value": value}
+            )
+
+
+def _diff_the_lists(base: list, new: list, path: str, patch: list):
+    """The function includes a functionality to compare two JSON arrays index by index
+
+    Args:
+        base (list): Specify the base array
+        new (list): Specify the new array
+        path (str): Specify the JSON Pointer of the arrays
+        patch (list): Specify the list of the JSON Patch operations
+
+    Returns:
+        None
+    """
+
+    for index in range(min(len(base), len(new))):
+        _diff_the_values(base[index], new[index], f"{path}/{index}", patch)
+
+    for index in range(len(base) - 1, len(new) - 1, -1):
+        patch.append({"op": "remove", "path": f"{path}/{index}"})
+
+    for index in range(len(base), len(new)):
+        patch.append({"op": "add", "path": f"{path}/{index}", "value": new[index]})
+
+
+def _diff_the_panels(base: list, new: list, path: str, patch: list):
+    """The function includes a functionality to compare two panel arrays. The panels are matched by the id or the gridPos, the removed panels are removed, the matched panels are moved to the new position and compared and the new panels are added
+
+    Args:
+        base (list): Specify the base panels
+        new (list): Specify the new panels
+        path (str): Specify the JSON Pointer of the panels
+        patch (list): Specify the list of the JSON Patch operations
+
+    Returns:
+        None
+    """
+
+    base_keys: list = [_get_the_panel_key(panel) for panel in base]
+    new_keys: list = [_get_the_panel_key(panel) for panel in new]
+
+    if len(set(base_keys)) != len(base_keys) or len(set(new_keys)) != len(new_keys):
+        # The panels are not uniquely identifiable and are compared index by index
+        _diff_the_lists(base, new, path, patch)
+        return
+
+    base_panels: dict = dict(zip(base_keys, base))
+    new_key_set: set = set(new_keys)
+
+    for index in range(len(base_keys) - 1, -1, -1):
+        if base_keys[index] not in new_key_set:
+            patch.append({"op": "remove", "path": f"{path}/{index}"})
+
+    current_keys: list = [key for key in base_keys if key in new_key_set]
+
+    for index, (key, panel) in enumerate(zip(new_keys, new)):
+        if key not in base_panels:
+            patch.append({"op": "add", "path": f"{path}/{index}", "value": panel})
+            current_keys.insert(index, key)
+            continue
+
+        current_index: int = current_keys.index(key, index)
+
+        if current_index != index:
+            patch.append(
+                {
+                    "op": "move",
+                    "from": f"{path}/{current_index}",
+                    "path": f"{path}/{index}",
+                }
+            )
+            current_keys.insert(index, current_keys.pop(current_index))
+
+        _diff_the_values(base_panels[key], panel, f"{path}/{index}", patch)
+
+
+def _is_panel_list(panels: list) -> bool:
+    """The function includes a functionality to check if an array consists of panels
+
+    Args:
+        panels (list): Specify the array
+
+    Returns:
+        is_panel_list (bool): Returns if all elements are objects with an id or a gridPos
+    """
+
+    return all(
+        isinstance(panel, dict) and ("id" in panel or "gridPos" in panel)
+        for panel in panels
+    )
+
+
+def _get_the_panel_key(panel: dict) -> tuple:
+    """The function includes a functionality to get the key that matches a panel
+
+    Args:
+        panel (dict): Specify the panel
+
+    Returns:
+        key (tuple): Returns the id or the gridPos of the panel
+    """
+
+    if panel.get("id") is not None:
+        return "id", panel.get("id")
+
+    grid_pos: dict = panel.get("gridPos") or dict()
+
+    return (
+        "gridPos",
+        grid_pos.get("x"),
+        grid_pos.get("y"),
+        grid_pos.get("w"),
+        grid_pos.get("h"),
+    )
+
+
+def _escape(key: str) -> str:
+    """The function includes a functionality to escape a key as JSON Pointer reference token
+
+    Args:
+        key (str): Specify the key
+
+    Returns:
+        token (str): Returns the escaped key
+    """
+
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _split_the_path(path: str) -> list:
+    """The function includes a functionality to split a JSON Pointer into the unescaped reference tokens
+
+    Args:
+        path (str): Specify the JSON Pointer
+
+    Raises:
+        ValueError: The JSON Pointer is not valid
+
+    Returns:
+        tokens (list): Returns the list of the reference tokens
+    """
+
+    if path == "":
+        return list()
+
+    if not path.startswith("/"):
+        logging.error(f"The path {path} is not a valid JSON Pointer.")
+        raise ValueError
+
+    return [
+        token.replace("~1", "/").replace("~0", "~") for token in path[1:].split("/")
+    ]
+
+
+def _get_the_container(document: any, tokens: list) -> any:
+    """The function includes a functionality to get the parent container of a JSON Pointer
+
+    Args:
+        document (any): Specify the document
+        tokens (list): Specify the reference tokens of the JSON Pointer
+
+    Raises:
+        ValueError: The JSON Pointer does not exist
+
+    Returns:
+        container (any): Returns the parent object or array
+    """
+
+    container: any = document
+
+    try:
+        for token in tokens[:-1]:
+            container = container[int(token) if isinstance(container, list) else token]
+    except (KeyError, IndexError, ValueError, TypeError):
+        logging.error(f"The path /{'/'.join(tokens)} does not exist.")
+        raise ValueError
+
+    return container
+
+
+def _get_the_value(document: any, path: str) -> any:
+    """The function includes a functionality to get the value of a JSON Pointer
+
+    Args:
+        document (any): Specify the document
+        path (str): Specify the JSON Pointer
+
+    Raises:
+        ValueError: The JSON Pointer does not exist
+
+    Returns:
+        value (any): Returns the value
+    """
+
+    tokens: list = _split_the_path(path)
+
+    if len(tokens) == 0:
+        return document
+
+    return _get_the_value_of_the_container(_get_the_container(document, tokens), tokens)
+
+
+def _get_the_value_of_the_container(container: any, tokens: list) -> any:
+    """The function includes a functionality to get the value of the last reference token inside the parent container
+
+    Args:
+        container (any): Specify the parent object or array
+        tokens (list): Specify the reference tokens of the JSON Pointer
+
+    Raises:
+        ValueError: The JSON Pointer does not exist
+
+    Returns:
+        value (any): Returns the value
+    """
+
+    try:
+        if isinstance(container, list):
+            return container[int(tokens[-1])]
+
+        return container[tokens[-1]]
+    except (KeyError, IndexError, ValueError, TypeError):
+        logging.error(f"The path /{'/'.join(tokens)} does not exist.")
+        raise ValueError
+
+
+def _add_the_value(document: any, path: str, value: any) -> any:
+    """The function includes a functionality to add a value at a JSON Pointer
+
+    Args:
+        document (any): Specify the document
+        path (str): Specify the JSON Pointer
+        value (any): Specify the value
+
+    Raises:
+        ValueError: The JSON Pointer does not exist
+
+    Returns:
+        document (any): Returns the document, which is the value if the path specifies the root
+    """
+
+    tokens: list = _split_the_path(path)
+
+    if len(tokens) == 0:
+        return value
+
+    container: any = _get_the_container(document, tokens)
+
+    if isinstance(container, list):
+        if tokens[-1] == "-":
+            container.append(value)
+        elif tokens[-1].isdigit() and int(tokens[-1]) <= len(container):
+            container.insert(int(tokens[-1]), value)
+        else:
+            logging.error(f"The path {path} does not exist.")
+            raise ValueError
+    elif isinstance(container, dict):
+        container[tokens[-1]] = value
+    else:
+        logging.error(f"The path {path} does not exist.")
+        raise ValueError
+
+    return document
+
+
+def _remove_the_value(document: any, path: str) -> tuple:
+    """The function includes a functionality to remove the value of a JSON Pointer
+
+    Args:
+        document (any): Specify the document
+        path (str): Specify the JSON Pointer
+
+    Raises:
+        ValueError: The JSON Pointer does not exist
+
+    Returns:
+        result (tuple): Returns the document and the removed value
+    """
+
+    tokens: list = _split_the_path(path)
+
+    if len(tokens) == 0:
+        return None, document
+
+    container: any = _get_the_container(document, tokens)
+    value: any = _get_the_value_of_the_container(container, tokens)
+
+    if isinstance(container, list):
+        del container[int(tokens[-1])]
+    else:
+        del container[tokens[-1]]
+
+    return document, value
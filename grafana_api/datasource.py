@@ -1,8 +1,10 @@
-import json
 import logging
+import math
+from typing import Iterator
 
 from .model import APIModel, APIEndpoints, RequestsMethods, DatasourceCache
 from .api import Api
+from .cache import LookupCache
 
 
 class Datasource:
@@ -198,8 +200,9 @@ class Datasource:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.DATASOURCES.value,
                 RequestsMethods.POST,
-                json.dumps(data_source),
+                data_source,
             )
+            self._invalidate_the_datasource_index()
 
             if api_call.get("message") != "Datasource added":
                 logging.error(f"Check the error: {api_call}.")
@@ -233,8 +236,9 @@ class Datasource:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.DATASOURCES.value}/{datasource_id}",
                 RequestsMethods.PUT,
-                json.dumps(data_source),
+                data_source,
             )
+            self._invalidate_the_datasource_index()
 
             if api_call.get("message") != "Datasource updated":
                 logging.error(f"Check the error: {api_call}.")
@@ -268,6 +272,7 @@ class Datasource:
                 f"{APIEndpoints.DATASOURCES.value}/{datasource_id}",
                 RequestsMethods.DELETE,
             )
+            self._invalidate_the_datasource_index()
 
             if api_call.get("message") != "Data source deleted":
                 logging.error(f"Check the error: {api_call}.")
@@ -301,6 +306,7 @@ class Datasource:
                 f"{APIEndpoints.DATASOURCES.value}/uid/{uid}",
                 RequestsMethods.DELETE,
             )
+            self._invalidate_the_datasource_index()
 
             if api_call.get("message") != "Data source deleted":
                 logging.error(f"Check the error: {api_call}.")
@@ -334,6 +340,7 @@ class Datasource:
                 f"{APIEndpoints.DATASOURCES.value}/name/{name}",
                 RequestsMethods.DELETE,
             )
+            self._invalidate_the_datasource_index()
 
             if api_call.get("message") != "Data source deleted":
                 logging.error(f"Check the error: {api_call}.")
@@ -381,7 +388,7 @@ class Datasource:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.DATASOURCE_QUERY.value,
                 RequestsMethods.POST,
-                json.dumps(datasource_queries_json_list),
+                datasource_queries_json_list,
             )
 
             if api_call == dict() or api_call.get("results") == dict():
@@ -415,7 +422,7 @@ class Datasource:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.DATASOURCES.value}/{datasource_id}/enable-permissions",
                 RequestsMethods.POST,
-                json.dumps({}),
+                {},
             )
 
             if api_call.get("message") != "Datasource permissions enabled":
@@ -449,7 +456,7 @@ class Datasource:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.DATASOURCES.value}/{datasource_id}/disable-permissions",
                 RequestsMethods.POST,
-                json.dumps({}),
+                {},
             )
 
             if api_call.get("message") != "Datasource permissions disabled":
@@ -519,7 +526,7 @@ class Datasource:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.DATASOURCES.value}/{datasource_id}/permissions",
                 RequestsMethods.POST,
-                json.dumps(datasource_permission),
+                datasource_permission,
             )
 
             if api_call.get("message") != "Datasource permission added":
@@ -565,6 +572,225 @@ class Datasource:
             logging.error("There is no datasource_id or permission_id defined.")
             raise ValueError
 
+    def _invalidate_the_datasource_index(self):
+        """The method includes a functionality to invalidate the datasource registries of the model. The registries load the datasources again on the next lookup
+
+        Returns:
+            None
+        """
+
+        with self.grafana_api_model._lock:
+            self.grafana_api_model._datasource_index_version += 1
+
+
+class DatasourceRegistry:
+    """The class includes the functionality of a local registry of the datasources. The datasources are loaded by one request, indexed by the id, the uid and the name and the lookups are answered locally. The registry keeps the index until the lookup_cache_ttl value of the model expires or without the value until the registry is invalidated. The index is loaded again once if a datasource is missing and after every creation, update or deletion of a datasource by the Datasource class of the same model
+
+    Args:
+        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+
+    Attributes:
+        grafana_api_model (APIModel): This is where we store the grafana_api_model
+    """
+
+    def __init__(self, grafana_api_model: APIModel):
+        self.grafana_api_model = grafana_api_model
+        self._lookup_cache: LookupCache = LookupCache(
+            math.inf
+            if grafana_api_model.lookup_cache_ttl is None
+            else grafana_api_model.lookup_cache_ttl
+        )
+        self._index_version: int = grafana_api_model._datasource_index_version
+
+    def __len__(self) -> int:
+        return len(self._get_the_datasources())
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter([dict(datasource) for datasource in self._get_the_datasources()])
+
+    def refresh(self) -> "DatasourceRegistry":
+        """The method includes a functionality to load all datasources again e.g. to prefetch the registry before a bulk operation
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            datasource_registry (DatasourceRegistry): Returns the datasource registry
+        """
+
+        lookup_cache: LookupCache = self._get_the_lookup_cache()
+        lookup_cache.invalidate()
+        lookup_cache.get(self._load_the_datasources)
+
+        return self
+
+    def invalidate(self):
+        """The method includes a functionality to invalidate all datasource registries of the model. The datasources are loaded again on the next lookup
+
+        Returns:
+            None
+        """
+
+        Datasource(self.grafana_api_model)._invalidate_the_datasource_index()
+
+    def get_by_id(self, datasource_id: int) -> dict:
+        """The method includes a functionality to get a datasource specified by the datasource id
+
+        Args:
+            datasource_id (int): Specify the id of the datasource
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            datasource (dict): Returns the datasource or None, if the datasource does not exist
+        """
+
+        return self._lookup(("id", datasource_id))
+
+    def get_by_uid(self, uid: str) -> dict:
+        """The method includes a functionality to get a datasource specified by the datasource uid
+
+        Args:
+            uid (str): Specify the uid of the datasource
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            datasource (dict): Returns the datasource or None, if the datasource does not exist
+        """
+
+        return self._lookup(("uid", uid))
+
+    def get_by_name(self, name: str) -> dict:
+        """The method includes a functionality to get a datasource specified by the datasource name
+
+        Args:
+            name (str): Specify the name of the datasource
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            datasource (dict): Returns the datasource or None, if the datasource does not exist
+        """
+
+        return self._lookup(("name", name))
+
+    def get_id_by_name(self, name: str) -> int:
+        """The method includes a functionality to get the id of a datasource specified by the datasource name
+
+        Args:
+            name (str): Specify the name of the datasource
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            datasource_id (int): Returns the id of the datasource or None, if the datasource does not exist
+        """
+
+        datasource: dict = self.get_by_name(name)
+
+        return None if datasource is None else datasource.get("id")
+
+    def get_uid_by_name(self, name: str) -> str:
+        """The method includes a functionality to get the uid of a datasource specified by the datasource name
+
+        Args:
+            name (str): Specify the name of the datasource
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            uid (str): Returns the uid of the datasource or None, if the datasource does not exist
+        """
+
+        datasource: dict = self.get_by_name(name)
+
+        return None if datasource is None else datasource.get("uid")
+
+    def _lookup(self, key: tuple) -> dict:
+        """The method includes a functionality to get a datasource of the registry specified by the index key
+
+        Args:
+            key (tuple): Specify the index key e.g. ("uid", "test")
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            datasource (dict): Returns a copy of the datasource or None, if the datasource does not exist
+        """
+
+        datasource: dict = self._get_the_lookup_cache().lookup(
+            self._load_the_datasources, key
+        )
+
+        return None if datasource is None else dict(datasource)
+
+    def _get_the_datasources(self) -> list:
+        """The method includes a functionality to get all datasources of the registry
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            datasources (list): Returns the list of all datasources
+        """
+
+        datasources: dict = self._get_the_lookup_cache().get(self._load_the_datasources)
+
+        return [datasource for key, datasource in datasources.items() if key[0] == "id"]
+
+    def _get_the_lookup_cache(self) -> LookupCache:
+        """The method includes a functionality to get the lookup cache of the registry. The cache is invalidated, if the datasources of the model were changed since the last access
+
+        Returns:
+            lookup_cache (LookupCache): Returns the lookup cache of the registry
+        """
+
+        with self.grafana_api_model._lock:
+            index_version: int = self.grafana_api_model._datasource_index_version
+
+            if index_version != self._index_version:
+                self._lookup_cache.invalidate()
+                self._index_version = index_version
+
+        return self._lookup_cache
+
+    def _load_the_datasources(self) -> dict:
+        """The method includes a functionality to load all datasources and to index them by the id, the uid and the name
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            datasources (dict): Returns the index of the datasources
+        """
+
+        api_call: list = Api(self.grafana_api_model).call_the_api(
+            APIEndpoints.DATASOURCES.value,
+            RequestsMethods.GET,
+        )
+
+        if not isinstance(api_call, list) or (
+            len(api_call) != 0 and api_call[0].get("id") is None
+        ):
+            logging.error(f"Check the error: {api_call}.")
+            raise Exception
+
+        datasources: dict = dict()
+
+        for datasource in api_call:
+            datasources[("id", datasource.get("id"))] = datasource
+            datasources[("uid", datasource.get("uid"))] = datasource
+            datasources[("name", datasource.get("name"))] = datasource
+
+        return datasources
+
 
 class DatasourceQueryResourceCaching:
     """The class includes all necessary methods to access the Grafana datasource query and resource caching API endpoints. It's required that the API token got the corresponding datasource access rights. Please check the used methods docstring for the necessary access rights. The functionality is a Grafana ENTERPRISE feature
@@ -757,7 +983,7 @@ class DatasourceQueryResourceCaching:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.DATASOURCES.value}/{uid}/cache",
                 RequestsMethods.POST,
-                json.dumps(datasource_cache_object),
+                datasource_cache_object,
             )
 
             if api_call == dict() or api_call.get("dataSourceID") is None:
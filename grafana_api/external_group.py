@@ -1,4 +1,3 @@
-import json
 import logging
 
 from .model import APIModel, APIEndpoints, RequestsMethods
@@ -78,7 +77,7 @@ class ExternalGroup:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.EXTERNAL_GROUPS.value}/{team_id}/groups",
                 RequestsMethods.POST,
-                json.dumps(dict({"groupId": group_id})),
+                dict({"groupId": group_id}),
             )
 
             if api_call.get("message") != "Group added to Team":
@@ -1,8 +1,13 @@
+import functools
 import logging
-import json
+import threading
 
 from .api import Api
-from .model import APIModel, APIEndpoints, RequestsMethods
+from .cache import LookupCache
+from .model import APIModel, APIEndpoints, RequestsMethods, FolderNode
+
+# The number of the folders that are requested per page of the search API
+FOLDER_PAGE_SIZE: int = 1000
 
 
 class Folder:
@@ -119,8 +124,9 @@ class Folder:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.FOLDERS.value,
                 RequestsMethods.POST,
-                json.dumps(folder_information),
+                folder_information,
             )
+            self._invalidate_the_folder_index()
 
             if api_call == dict() or api_call.get("id") is None:
                 logging.error(f"Please, check the error: {api_call}.")
@@ -165,8 +171,9 @@ class Folder:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.FOLDERS.value}/{uid}",
                 RequestsMethods.PUT,
-                json.dumps(folder_information),
+                folder_information,
             )
+            self._invalidate_the_folder_index()
 
             if api_call == dict() or api_call.get("id") is None:
                 logging.error(f"Please, check the error: {api_call}.")
@@ -196,6 +203,7 @@ class Folder:
                 f"{APIEndpoints.FOLDERS.value}/{uid}",
                 RequestsMethods.DELETE,
             )
+            self._invalidate_the_folder_index()
 
             if api_call.status_code != 200:
                 logging.error(f"Please, check the error: {api_call}.")
@@ -254,7 +262,7 @@ class Folder:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.FOLDERS.value}/{uid}/permissions",
                 RequestsMethods.POST,
-                json.dumps(permission_json),
+                permission_json,
             )
 
             if api_call.get("message") not in [
@@ -287,24 +295,80 @@ class Folder:
             return 0
 
         if len(dashboard_path) != 0:
-            folders: list = self.get_all_folder_ids_and_names()
-            folder_id: int = 0
-
-            for f in folders:
-                if dashboard_path == f.get("title"):
-                    folder_id = f.get("id")
+            folder: dict = self._get_the_folder_by_title(dashboard_path)
 
-            if folder_id == 0:
+            if folder is None or folder.get("id") in (None, 0):
                 logging.error(
                     f"There's no folder_id for the dashboard named {dashboard_path} available."
                 )
                 raise Exception
 
-            return folder_id
+            return folder.get("id")
+        else:
+            logging.error("There is no dashboard_path defined.")
+            raise ValueError
+
+    def get_folder_uid_by_dashboard_path(self, dashboard_path: str) -> str:
+        """The method includes a functionality to extract the folder uid specified inside model dashboard path
+
+        Args:
+            dashboard_path (str): Specify the dashboard path
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            folder_uid (str): Returns the folder uid or None for the General folder
+        """
+
+        if dashboard_path.lower() == "general":
+            return None
+
+        if len(dashboard_path) != 0:
+            folder: dict = self._get_the_folder_by_title(dashboard_path)
+
+            if folder is None or folder.get("uid") is None:
+                logging.error(
+                    f"There's no folder_uid for the dashboard named {dashboard_path} available."
+                )
+                raise Exception
+
+            return folder.get("uid")
         else:
             logging.error("There is no dashboard_path defined.")
             raise ValueError
 
+    def get_folder_index(self) -> dict:
+        """The method includes a functionality to extract all top level folders inside the organization and to index them by the title. All result pages of the search API are requested
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            folders (dict): Returns a dict of the folder titles and the corresponding folder ids and uids
+        """
+
+        api: Api = Api(self.grafana_api_model)
+
+        def _get_the_page(page: int) -> list:
+            result: list = api.call_the_api(
+                f"{APIEndpoints.SEARCH.value}?folderIds=0&type=dash-folder"
+                f"&limit={FOLDER_PAGE_SIZE}&page={page}"
+            )
+
+            if not isinstance(result, list):
+                logging.error(f"Please, check the error: {result}.")
+                raise Exception
+
+            return result
+
+        return {
+            folder.get("title"): {"id": folder.get("id"), "uid": folder.get("uid")}
+            for page in api.paginate(_get_the_page, FOLDER_PAGE_SIZE, prefetch=0)
+            for folder in page
+        }
+
     def get_all_folder_ids_and_names(self) -> list:
         """The method extract all folder id and names inside the complete organisation
 
@@ -324,3 +388,392 @@ class Folder:
             )
 
         return folders
+
+    def _get_the_folder_by_title(self, title: str) -> dict:
+        """The method includes a functionality to get the id and uid of a top level folder specified by the title. The shared folder lookup cache of the model is used, if a lookup cache TTL is defined
+
+        Args:
+            title (str): Specify the title of the folder
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            folder (dict): Returns the id and uid of the folder or None, if there is no folder with the title
+        """
+
+        lookup_cache: LookupCache = Api(self.grafana_api_model).get_the_lookup_cache(
+            "folders"
+        )
+
+        if lookup_cache is None:
+            return self.get_folder_index().get(title)
+
+        return lookup_cache.lookup(self.get_folder_index, title)
+
+    def _invalidate_the_folder_index(self):
+        """The method includes a functionality to invalidate the shared folder lookup cache of the model
+
+        Returns:
+            None
+        """
+
+        lookup_cache: LookupCache = Api(self.grafana_api_model).get_the_lookup_cache(
+            "folders"
+        )
+
+        if lookup_cache is not None:
+            lookup_cache.invalidate()
+
+
+class FolderTree:
+    """The class includes the functionality of a thread-safe local model of the nested folder hierarchy. The hierarchy is loaded level by level and the children of all folders of a level are requested concurrently. The paths e.g. team/prod/db are resolved in O(depth) and the ancestors and descendants are queried locally. The tree is loaded on the first access and can be updated incrementally
+
+    Args:
+        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+        page_size (int): Specify the number of the folders per page of the folder API (default 1000)
+        max_workers (int): Specify the optional maximum number of the concurrently requested folders. The default value is the max_workers value of the model (default None)
+
+    Attributes:
+        grafana_api_model (APIModel): This is where we store the grafana_api_model
+        page_size (int): This is where we store the page_size
+        max_workers (int): This is where we store the max_workers
+    """
+
+    def __init__(
+        self,
+        grafana_api_model: APIModel,
+        page_size: int = 1000,
+        max_workers: int = None,
+    ):
+        self.grafana_api_model = grafana_api_model
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self._nodes: dict = dict()
+        self._children: dict = dict()
+        self._loaded: bool = False
+        self._lock: threading.RLock = threading.RLock()
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._nodes)
+
+    def __contains__(self, uid: str) -> bool:
+        self._load()
+        return uid in self._nodes
+
+    def refresh(self, uid: str = None) -> "FolderTree":
+        """The method includes a functionality to load the folder hierarchy. Without uid, the complete tree is replaced. With uid, only the subtree below the inserted folder is replaced
+
+        Args:
+            uid (str): Specify the optional uid of the folder whose subtree should be refreshed (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            folder_tree (FolderTree): Returns the folder tree
+        """
+
+        nodes: list = list()
+        level: list = [uid]
+
+        with self._lock:
+            visited: set = (
+                {uid}
+                if uid is None
+                else {uid, *self._nodes}
+                - {descendant.uid for descendant in self.get_descendants(uid)}
+            )
+
+        while len(level) != 0:
+            results: list = Api(self.grafana_api_model).batch(
+                [
+                    functools.partial(self._get_the_children, parent_uid)
+                    for parent_uid in level
+                ],
+                max_workers=self.max_workers,
+            )
+            level = list()
+
+            for result in results:
+                if not result.successful:
+                    raise result.error
+
+                for node in result.result:
+                    # The folder API ignores the parentUid parameter, if the
+                    # nested folders are disabled. Known folders are skipped
+                    if node.uid not in visited:
+                        visited.add(node.uid)
+                        nodes.append(node)
+                        level.append(node.uid)
+
+        with self._lock:
+            if uid is None:
+                self._nodes.clear()
+                self._children.clear()
+            else:
+                for child_uid in list(self._children.get(uid, dict()).values()):
+                    self.remove(child_uid)
+
+            for node in nodes:
+                self.update(node)
+
+            self._loaded = True
+
+        return self
+
+    def update(self, node: FolderNode):
+        """The method includes a functionality to insert, rename or move a folder inside the tree e.g. after the creation or the update of a folder. The subtree of the folder is kept
+
+        Args:
+            node (FolderNode): Specify the folder
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            previous_node: FolderNode = self._nodes.get(node.uid)
+
+            if previous_node is not None:
+                self._remove_the_child(previous_node)
+
+            self._nodes[node.uid] = node
+            self._children.setdefault(node.parent_uid, dict())[node.title] = node.uid
+
+    def remove(self, uid: str):
+        """The method includes a functionality to remove a folder and the corresponding subtree from the tree e.g. after the deletion of a folder
+
+        Args:
+            uid (str): Specify the uid of the folder
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            node: FolderNode = self._nodes.get(uid)
+
+            if node is None:
+                return
+
+            for descendant in self.get_descendants(uid):
+                del self._nodes[descendant.uid]
+                self._children.pop(descendant.uid, None)
+
+            self._remove_the_child(node)
+            self._children.pop(uid, None)
+            del self._nodes[uid]
+
+    def get(self, uid: str) -> FolderNode:
+        """The method includes a functionality to get a folder specified by the uid
+
+        Args:
+            uid (str): Specify the uid of the folder
+
+        Returns:
+            folder (FolderNode): Returns the folder or None, if the uid is unknown
+        """
+
+        self._load()
+        return self._nodes.get(uid)
+
+    def get_children(self, uid: str = None) -> list:
+        """The method includes a functionality to get the direct children of a folder
+
+        Args:
+            uid (str): Specify the uid of the parent folder. None specifies the top level (default None)
+
+        Returns:
+            folders (list): Returns the list of the child folders
+        """
+
+        self._load()
+
+        with self._lock:
+            return [
+                self._nodes[child_uid]
+                for child_uid in self._children.get(uid, dict()).values()
+            ]
+
+    def resolve(self, path: str) -> str:
+        """The method includes a functionality to resolve a slash-separated folder path e.g. team/prod/db to the uid of the folder
+
+        Args:
+            path (str): Specify the path of the folder
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            uid (str): Returns the uid of the folder or None, if the path is unknown
+        """
+
+        titles: list = [title for title in path.split("/") if len(title) != 0]
+
+        if len(titles) == 0:
+            logging.error("There is no folder path defined.")
+            raise ValueError
+
+        self._load()
+        uid: str = None
+
+        with self._lock:
+            for title in titles:
+                uid = self._children.get(uid, dict()).get(title)
+
+                if uid is None:
+                    return None
+
+        return uid
+
+    def get_path(self, uid: str) -> str:
+        """The method includes a functionality to get the slash-separated path of a folder
+
+        Args:
+            uid (str): Specify the uid of the folder
+
+        Returns:
+            path (str): Returns the path of the folder or None, if the uid is unknown
+        """
+
+        node: FolderNode = self.get(uid)
+
+        if node is None:
+            return None
+
+        return "/".join(
+            [ancestor.title for ancestor in reversed(self.get_ancestors(uid))]
+            + [node.title]
+        )
+
+    def get_ancestors(self, uid: str) -> list:
+        """The method includes a functionality to get the ancestors of a folder starting with the parent folder
+
+        Args:
+            uid (str): Specify the uid of the folder
+
+        Returns:
+            folders (list): Returns the list of the ancestor folders
+        """
+
+        self._load()
+        ancestors: list = list()
+
+        with self._lock:
+            node: FolderNode = self._nodes.get(uid)
+
+            while node is not None and node.parent_uid is not None:
+                node = self._nodes.get(node.parent_uid)
+
+                if node is None or node in ancestors:
+                    break
+
+                ancestors.append(node)
+
+        return ancestors
+
+    def get_descendants(self, uid: str = None) -> list:
+        """The method includes a functionality to get all descendants of a folder in depth-first order
+
+        Args:
+            uid (str): Specify the uid of the folder. None specifies the complete tree (default None)
+
+        Returns:
+            folders (list): Returns the list of the descendant folders
+        """
+
+        self._load()
+        descendants: list = list()
+
+        with self._lock:
+            stack: list = list(reversed(self._children.get(uid, dict()).values()))
+
+            while len(stack) != 0:
+                node: FolderNode = self._nodes[stack.pop()]
+                descendants.append(node)
+                stack.extend(reversed(self._children.get(node.uid, dict()).values()))
+
+        return descendants
+
+    def is_ancestor(self, ancestor_uid: str, uid: str) -> bool:
+        """The method includes a functionality to check if a folder is an ancestor of another folder
+
+        Args:
+            ancestor_uid (str): Specify the uid of the possible ancestor folder
+            uid (str): Specify the uid of the folder
+
+        Returns:
+            is_ancestor (bool): Returns if the folder is an ancestor
+        """
+
+        return ancestor_uid in [ancestor.uid for ancestor in self.get_ancestors(uid)]
+
+    def _load(self):
+        """The method includes a functionality to load the tree on the first access
+
+        Returns:
+            None
+        """
+
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self.refresh()
+
+    def _get_the_children(self, parent_uid: str = None) -> list:
+        """The method includes a functionality to request all child folders of a folder. All result pages of the folder API are requested
+
+        Args:
+            parent_uid (str): Specify the uid of the parent folder. None specifies the top level (default None)
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            folders (list): Returns the list of the child folders
+        """
+
+        api: Api = Api(self.grafana_api_model)
+        query: str = "" if parent_uid is None else f"parentUid={parent_uid}&"
+
+        def _get_the_page(page: int) -> list:
+            result: list = api.call_the_api(
+                f"{APIEndpoints.FOLDERS.value}?{query}limit={self.page_size}&page={page}"
+            )
+
+            if not isinstance(result, list):
+                logging.error(f"Please, check the error: {result}.")
+                raise Exception
+
+            return result
+
+        return [
+            FolderNode(
+                uid=folder.get("uid"),
+                id=folder.get("id"),
+                title=folder.get("title"),
+                parent_uid=parent_uid,
+            )
+            for page in api.paginate(_get_the_page, self.page_size, prefetch=0)
+            for folder in page
+        ]
+
+    def _remove_the_child(self, node: FolderNode):
+        """The method includes a functionality to remove a folder from the children of the parent folder
+
+        Args:
+            node (FolderNode): Specify the folder
+
+        Returns:
+            None
+        """
+
+        children: dict = self._children.get(node.parent_uid)
+
+        if children is not None and children.get(node.title) == node.uid:
+            del children[node.title]
+
+            if len(children) == 0:
+                del self._children[node.parent_uid]
@@ -1,4 +1,3 @@
-import json
 import logging
 
 from .model import (
@@ -138,14 +137,12 @@ class LegacyPlaylist:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.PLAYLISTS.value}/{playlist_id}",
                 RequestsMethods.PUT,
-                json.dumps(
-                    dict(
-                        {
-                            "name": playlist.name,
-                            "interval": playlist.interval,
-                            "items": items,
-                        }
-                    )
+                dict(
+                    {
+                        "name": playlist.name,
+                        "interval": playlist.interval,
+                        "items": items,
+                    }
                 ),
             )
 
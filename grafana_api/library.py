@@ -1,4 +1,3 @@
-import json
 import logging
 
 from .model import APIModel, APIEndpoints, SortDirection, RequestsMethods
@@ -206,7 +205,7 @@ class Library:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.LIBRARY.value,
                 RequestsMethods.POST,
-                json.dumps(request_parameters),
+                request_parameters,
             )
 
             if api_call == dict() or api_call.get("result") is None:
@@ -273,7 +272,7 @@ class Library:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.LIBRARY.value}/{uid}",
                 RequestsMethods.PATCH,
-                json.dumps(request_parameters),
+                request_parameters,
             )
 
             if api_call == dict() or api_call.get("result") is None:
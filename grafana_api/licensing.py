@@ -1,6 +1,6 @@
 import json
-from httpx import Response
 import logging
+from typing import TYPE_CHECKING
 
 from .model import (
     APIModel,
@@ -9,6 +9,9 @@ from .model import (
 )
 from .api import Api
 
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
+
 
 class Licensing:
     """The class includes all necessary methods to access the Grafana licensing API endpoints. Be aware that the functionality is a Grafana ENTERPRISE v7.4+ feature
@@ -39,7 +42,7 @@ class Licensing:
             api_call (bool): Returns the result if the license is available or not
         """
 
-        api_call: Response = Api(self.grafana_api_model).call_the_api(
+        api_call: "httpx.Response" = Api(self.grafana_api_model).call_the_api(
             f"{APIEndpoints.LICENSING.value}/check",
         )
 
@@ -66,7 +69,7 @@ class Licensing:
         api_call: dict = Api(self.grafana_api_model).call_the_api(
             f"{APIEndpoints.LICENSING.value}/token/renew",
             RequestsMethods.POST,
-            json.dumps({}),
+            {},
         )
 
         if api_call == dict() or api_call.get("jti") is None:
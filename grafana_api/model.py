@@ -1,9 +1,19 @@
-import ssl
-import httpx
+import functools
+import logging
+import threading
+import weakref
+
+from .codec import JSONCodec, get_default_codec
 from enum import Enum
-from typing import List, TypeVar
+from typing import List, TypeVar, TYPE_CHECKING
 from dataclasses import dataclass, field
 
+# The httpx, ssl and asyncio modules are imported on the first use to keep the import of the model cheap
+if TYPE_CHECKING:  # pragma: no cover
+    import ssl
+    import httpx
+    from concurrent.futures import ThreadPoolExecutor
+
 Self = TypeVar("Self", bound="Route")
 
 # The constant includes all necessary error messages that can occurs, if you establish a connection to the Grafana API.
@@ -69,6 +79,130 @@ class SortDirection(Enum):
     DESC = "alpha-desc"
 
 
+@functools.lru_cache(maxsize=None)
+def _create_the_default_ssl_context(http2_support: bool) -> "ssl.SSLContext":
+    """The function includes a functionality to create the default ssl context once per HTTP/2 configuration
+
+    Args:
+        http2_support (bool): Specify if the HTTP/2 protocol should be negotiated
+
+    Returns:
+        ssl_context (ssl.SSLContext): Returns the default ssl context
+    """
+
+    import httpx
+
+    return httpx.create_ssl_context(http2=http2_support)
+
+
+@dataclass
+class RetryPolicy:
+    """The class includes all necessary variables to specify the retry behaviour of the API calls in case of temporary errors. The idempotent methods are retried for all specified status codes and transport errors, the other methods only in case of the status code 429 and of the connection errors, because the request was not processed by Grafana. The connection retries of the HTTP transport (the retries value of the model) are disabled, if a retry policy is defined, so the retries are not multiplied
+
+    Args:
+        max_retries (int): Specify the maximum number of the retries (default 3)
+        backoff_factor (float): Specify the backoff factor in seconds. The backoff is calculated by backoff_factor * 2 ** retry (default 0.5)
+        max_backoff (float): Specify the maximum backoff in seconds (default 30.0)
+        jitter (bool): Specify if the backoff should be randomized between zero and the calculated backoff (default True)
+        status_codes (tuple): Specify the retried HTTP status codes (default (429, 502, 503, 504))
+        methods (tuple): Specify the idempotent methods (default (GET, PUT, DELETE))
+        respect_retry_after (bool): Specify if the Retry-After header of the response should be used as backoff (default True)
+    """
+
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    status_codes: tuple = (429, 502, 503, 504)
+    methods: tuple = (RequestsMethods.GET, RequestsMethods.PUT, RequestsMethods.DELETE)
+    respect_retry_after: bool = True
+
+
+@dataclass
+class RateLimit:
+    """The class includes all necessary variables to specify the client-side rate limit of the API calls. The limits of the endpoint prefixes are enforced in addition to the global limits
+
+    Args:
+        requests_per_second (float): Specify the optional maximum number of the requests per second (default None)
+        burst (int): Specify the optional number of the requests that can be sent at once. The default value is the requests_per_second value (default None)
+        max_in_flight (int): Specify the optional maximum number of the concurrent requests. The limit is shared by the synchronous and the asynchronous requests of the model (default None)
+        endpoint_limits (dict): Specify the optional rate limits of the endpoint prefixes e.g. {APIEndpoints.DASHBOARDS: RateLimit(requests_per_second=10)} (default None)
+    """
+
+    requests_per_second: float = None
+    burst: int = None
+    max_in_flight: int = None
+    endpoint_limits: dict = None
+
+    def __post_init__(self):
+        if (
+            (self.requests_per_second is not None and self.requests_per_second <= 0)
+            or (self.burst is not None and self.burst < 1)
+            or (self.max_in_flight is not None and self.max_in_flight < 1)
+        ):
+            logging.error(
+                "Please define a requests_per_second value greater than 0 and a burst and max_in_flight value of at least 1."
+            )
+            raise ValueError
+
+
+@dataclass
+class CachePolicy:
+    """The class includes all necessary variables to specify the in-memory cache of the GET responses. The PUT, POST, PATCH and DELETE requests invalidate the cached responses of the same resource prefix
+
+    Args:
+        ttl (float): Specify the default TTL of the cached responses in seconds (default 60.0)
+        max_size (int): Specify the maximum number of the cached responses. The least recently used responses are evicted (default 1024)
+        endpoint_ttls (dict): Specify the optional TTLs of the endpoint prefixes in seconds e.g. {APIEndpoints.SEARCH: 5}. A TTL of 0 disables the cache of the endpoint prefix (default None)
+    """
+
+    ttl: float = 60.0
+    max_size: int = 1024
+    endpoint_ttls: dict = None
+
+
+@dataclass
+class APIStatistics:
+    """The class includes all counters that are collected by the API calls of a Grafana API model
+
+    Args:
+        requests (int): Specify the number of the sent requests (default 0)
+        retries (int): Specify the number of the retried requests (default 0)
+        throttled (int): Specify the number of the requests that were delayed by the rate limit (default 0)
+        cache_hits (int): Specify the number of the responses that were served from the response cache (default 0)
+        cache_misses (int): Specify the number of the cacheable requests that were not found inside the response cache (default 0)
+        not_modified (int): Specify the number of the conditional requests that were answered with 304 Not Modified (default 0)
+        bytes_saved (int): Specify the number of the response body bytes that were not transferred because of the conditional requests (default 0)
+        coalesced (int): Specify the number of the GET requests that shared the response of an identical in-flight request (default 0)
+    """
+
+    requests: int = 0
+    retries: int = 0
+    throttled: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    not_modified: int = 0
+    bytes_saved: int = 0
+    coalesced: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def increment(self, name: str, value: int = 1):
+        """The method includes a functionality to increment a counter thread-safe
+
+        Args:
+            name (str): Specify the name of the counter
+            value (int): Specify the value that should be added (default 1)
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            setattr(self, name, getattr(self, name) + value)
+
+
 @dataclass
 class APIModel:
     """The class includes all necessary variables to establish a connection to the Grafana API endpoints
@@ -80,9 +214,20 @@ class APIModel:
         password (str): Specify the password of the Grafana system
         timeout (float): Specify the timeout of the Grafana system
         http2_support (bool): Specify if you want to use HTTP/2
-        ssl_context (ssl.SSLContext): Specify the custom ssl context of the Grafana system
+        ssl_context (ssl.SSLContext): Specify the custom ssl context of the Grafana system. If not specified, the default context is created on the first request and shared by all models with the same HTTP/2 configuration (default None)
         num_pools (int): Specify the number of the connection pool
-        retries (any): Specify the number of the retries. Please use False as parameter to disable the retries
+        retries (any): Specify the number of the connection retries of the HTTP transport. Please use False as parameter to disable the retries. The value is ignored, if a retry_policy is defined
+        max_workers (int): Specify the number of the worker threads that execute concurrent API calls (default 10)
+        codec (JSONCodec): Specify the JSON codec that encodes the request bodies and decodes the responses (default orjson or ujson if installed, otherwise the standard library json module)
+        retry_policy (RetryPolicy): Specify the optional retry policy for temporary errors e.g. the status codes 429 or 503 (default None)
+        rate_limit (RateLimit): Specify the optional client-side rate limit that is shared by all API calls of the model (default None)
+        cache_policy (CachePolicy): Specify the optional in-memory cache of the GET responses that is shared by all API calls of the model (default None)
+        conditional_requests (bool): Specify if the ETag and Last-Modified validators of the GET responses should be used to send conditional requests and to serve the stored response on 304 Not Modified (default False)
+        coalesce_requests (bool): Specify if identical concurrent GET requests should be coalesced into a single request whose response is shared by all callers (default False)
+        lookup_cache_ttl (float): Specify the optional TTL in seconds of the lookup tables e.g. the folder and dashboard titles and the corresponding ids that are shared by all API calls of the model. The datasource registries keep their index for the TTL or without the TTL until the next datasource mutation. The tables are invalidated by the mutations of the model (default None)
+        statistics (APIStatistics): Specify the counters that are collected by the API calls of the model
+
+    The model owns the persistent HTTP clients and the thread pool that are shared by all classes that are created with the model. Please use the model as (async) context manager or call the close or aclose method to release the connection pools
     """
 
     host: str
@@ -91,9 +236,267 @@ class APIModel:
     password: str = None
     timeout: float = 10.0
     http2_support: bool = False
-    ssl_context: ssl.SSLContext = httpx.create_ssl_context(http2=http2_support)
+    ssl_context: "ssl.SSLContext" = None
     num_pools: int = 10
     retries: any = 10
+    max_workers: int = 10
+    codec: JSONCodec = field(default_factory=get_default_codec, compare=False)
+    retry_policy: RetryPolicy = None
+    rate_limit: RateLimit = None
+    cache_policy: CachePolicy = None
+    conditional_requests: bool = False
+    coalesce_requests: bool = False
+    lookup_cache_ttl: float = None
+    statistics: APIStatistics = field(default_factory=APIStatistics, compare=False)
+    _http_client: "httpx.Client" = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _default_headers: tuple = field(default=None, init=False, repr=False, compare=False)
+    _async_http_clients: weakref.WeakKeyDictionary = field(
+        default_factory=weakref.WeakKeyDictionary,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _executor: "ThreadPoolExecutor" = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _rate_limiter: any = field(default=None, init=False, repr=False, compare=False)
+    _response_cache: any = field(default=None, init=False, repr=False, compare=False)
+    _validator_cache: any = field(default=None, init=False, repr=False, compare=False)
+    _in_flight_requests: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _lookup_caches: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _datasource_index_version: int = field(
+        default=0, init=False, repr=False, compare=False
+    )
+    _async_in_flight_requests: weakref.WeakKeyDictionary = field(
+        default_factory=weakref.WeakKeyDictionary,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _lock: threading.RLock = field(
+        default_factory=threading.RLock, init=False, repr=False, compare=False
+    )
+
+    def get_the_ssl_context(self) -> "ssl.SSLContext":
+        """The method includes a functionality to get the ssl context of the model. The default context is created lazily, because the creation loads the system CA bundle
+
+        Returns:
+            ssl_context (ssl.SSLContext): Returns the custom or the default ssl context
+        """
+
+        if self.ssl_context is not None:
+            return self.ssl_context
+
+        return _create_the_default_ssl_context(self.http2_support)
+
+    def close(self):
+        """The method includes a functionality to close the shared HTTP client, the corresponding connection pool and the shared thread pool
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
+
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    async def aclose(self):
+        """The method includes a functionality to close the shared asynchronous HTTP clients and all resources of the close method
+
+        Returns:
+            None
+        """
+
+        import asyncio
+
+        with self._lock:
+            async_http_clients: list = list(self._async_http_clients.items())
+            self._async_http_clients.clear()
+
+        event_loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        for async_http_client_event_loop, async_http_client in async_http_clients:
+            if async_http_client_event_loop is event_loop:
+                await async_http_client.aclose()
+
+        self.close()
+
+    def __enter__(self) -> "APIModel":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def __aenter__(self) -> "APIModel":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+
+@dataclass
+class BatchOperation:
+    """The class includes all necessary variables to specify an API call that is executed as part of a batch
+
+    Args:
+        api_call (str): Specify the API call endpoint
+        method (RequestsMethods): Specify the used method (default GET)
+        json_complete (any): Specify the inserted JSON as string, as bytes or as JSON serializable object (default None)
+        org_id_header (int): Specify the optional organization id as header for the corresponding API call (default None)
+        disable_provenance_header (bool): Specify the optional disable provenance as header for the corresponding API call (default False)
+        response_status_code (bool): Specify if the response should include the original status code (default False)
+    """
+
+    api_call: str
+    method: RequestsMethods = RequestsMethods.GET
+    json_complete: any = None
+    org_id_header: int = None
+    disable_provenance_header: bool = False
+    response_status_code: bool = False
+
+
+@dataclass
+class BatchResult:
+    """The class includes the result of an operation that is executed as part of a batch
+
+    Args:
+        result (any): Specify the result of the operation (default None)
+        error (Exception): Specify the error of the failed operation (default None)
+    """
+
+    result: any = None
+    error: Exception = None
+
+    @property
+    def successful(self) -> bool:
+        """The property includes a functionality to check if the operation was successful
+
+        Returns:
+            successful (bool): Returns if the operation was successful
+        """
+
+        return self.error is None
+
+
+@dataclass
+class SearchHit:
+    """The class includes all necessary variables to specify a hit of the Grafana search API
+
+    Args:
+        id (int): Specify the id of the dashboard or folder
+        uid (str): Specify the uid of the dashboard or folder
+        title (str): Specify the title of the dashboard or folder
+        type (str): Specify the type of the hit e.g. dash-db or dash-folder
+        uri (str): Specify the optional uri of the hit (default None)
+        url (str): Specify the optional url of the hit (default None)
+        slug (str): Specify the optional slug of the hit (default None)
+        tags (list): Specify the optional tags of the hit (default None)
+        is_starred (bool): Specify if the hit is starred (default False)
+        folder_id (int): Specify the optional id of the parent folder (default None)
+        folder_uid (str): Specify the optional uid of the parent folder (default None)
+        folder_title (str): Specify the optional title of the parent folder (default None)
+        folder_url (str): Specify the optional url of the parent folder (default None)
+    """
+
+    id: int
+    uid: str
+    title: str
+    type: str
+    uri: str = None
+    url: str = None
+    slug: str = None
+    tags: list = None
+    is_starred: bool = False
+    folder_id: int = None
+    folder_uid: str = None
+    folder_title: str = None
+    folder_url: str = None
+
+    @classmethod
+    def from_dict(cls, hit: dict) -> "SearchHit":
+        """The method includes a functionality to create a search hit from the corresponding search API result
+
+        Args:
+            hit (dict): Specify the search API result
+
+        Returns:
+            search_hit (SearchHit): Returns the search hit
+        """
+
+        return cls(
+            id=hit.get("id"),
+            uid=hit.get("uid"),
+            title=hit.get("title"),
+            type=hit.get("type"),
+            uri=hit.get("uri"),
+            url=hit.get("url"),
+            slug=hit.get("slug"),
+            tags=hit.get("tags", list()),
+            is_starred=hit.get("isStarred", False),
+            folder_id=hit.get("folderId"),
+            folder_uid=hit.get("folderUid"),
+            folder_title=hit.get("folderTitle"),
+            folder_url=hit.get("folderUrl"),
+        )
+
+
+@dataclass
+class FolderNode:
+    """The class includes all necessary variables to specify a folder of the Grafana folder hierarchy
+
+    Args:
+        uid (str): Specify the uid of the folder
+        id (int): Specify the id of the folder
+        title (str): Specify the title of the folder
+        parent_uid (str): Specify the optional uid of the parent folder. None specifies a top level folder (default None)
+    """
+
+    uid: str
+    id: int
+    title: str
+    parent_uid: str = None
+
+
+@dataclass
+class PermissionDiff:
+    """The class includes the difference between the current and the desired permissions of a dashboard or folder
+
+    Args:
+        uid (str): Specify the uid of the dashboard or folder
+        resource_type (str): Specify the type of the resource, dashboard or folder
+        added (list): Specify the permission items that are missing inside the current permissions (default empty list)
+        removed (list): Specify the permission items that are not part of the desired permissions (default empty list)
+        changed (list): Specify the desired permission items whose permission level differs (default empty list)
+        updated (bool): Specify if the permissions were updated (default False)
+    """
+
+    uid: str
+    resource_type: str
+    added: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    changed: list = field(default_factory=list)
+    updated: bool = False
+
+    @property
+    def changes(self) -> bool:
+        """The property includes a functionality to check if the current permissions differ from the desired permissions
+
+        Returns:
+            changes (bool): Returns if the permissions differ
+        """
+
+        return len(self.added) != 0 or len(self.removed) != 0 or len(self.changed) != 0
 
 
 @dataclass
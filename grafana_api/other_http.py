@@ -1,14 +1,14 @@
 import logging
-from typing import Union
-import asyncio
-
-from httpx import AsyncClient, Client, BasicAuth, Response
+from typing import Iterator, TYPE_CHECKING
 
 import json
 
 from .model import APIModel, APIEndpoints
 from .api import Api
 
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
+
 
 class OtherHTTP:
     """The class includes all necessary methods to access other Grafana API endpoints
@@ -106,6 +106,8 @@ class OtherHTTP:
 
         basic_auth = None
         if basic_auth_username is not None and basic_auth_password is not None:
+            from httpx import BasicAuth
+
             basic_auth = BasicAuth(basic_auth_username, basic_auth_password)
 
         api_call: str = self._basic_get_call_without_token_auth(
@@ -118,6 +120,43 @@ class OtherHTTP:
         else:
             return api_call
 
+    def stream_metrics(
+        self, basic_auth_username: str = None, basic_auth_password: str = None
+    ) -> Iterator[str]:
+        """The method includes a functionality to stream the Grafana metrics information line by line instead of loading the complete metrics into memory
+
+        Args:
+            basic_auth_username (str): Specify the optional basic auth username
+            basic_auth_password (str): Specify the optional basic auth password
+
+        Raises:
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            api_call (Iterator[str]): Returns an iterator over the lines of the metrics information
+        """
+
+        http = Api(self.grafana_api_model).create_the_http_api_client()
+
+        basic_auth = None
+        if basic_auth_username is not None and basic_auth_password is not None:
+            from httpx import BasicAuth
+
+            basic_auth = BasicAuth(basic_auth_username, basic_auth_password)
+
+        try:
+            with http.stream(
+                "GET", f"{self.grafana_api_model.host}/metrics", auth=basic_auth
+            ) as response:
+                if response.is_error:
+                    response.read()
+                    logging.error(f"Check the error: {response.text}.")
+                    raise Exception
+
+                yield from response.iter_lines()
+        finally:
+            http.close()
+
     def get_plugin_metrics(
         self,
         plugin_id: str,
@@ -143,6 +182,8 @@ class OtherHTTP:
 
         basic_auth = None
         if basic_auth_username is not None and basic_auth_password is not None:
+            from httpx import BasicAuth
+
             basic_auth = BasicAuth(basic_auth_username, basic_auth_password)
 
         if len(plugin_id) != 0:
@@ -160,13 +201,14 @@ class OtherHTTP:
             logging.error("There is no plugin_id defined.")
             raise ValueError
 
+    @staticmethod
     def _basic_get_call_without_token_auth(
-        self, http: Union[Client, AsyncClient], url: str, basic_auth: BasicAuth = None
-    ) -> Response:
-        """The method includes a functionality to perform a basic GET call to an endpoint with optional BasicAuth
+        http: "httpx.Client", url: str, basic_auth: "httpx.BasicAuth" = None
+    ) -> "httpx.Response":
+        """The method includes a functionality to perform a basic GET call to an endpoint with optional BasicAuth. The used client is closed after the call
 
         Args:
-            http (Union[Client, AsyncClient]): Specify the used client
+            http (Client): Specify the used client
             url (str): Specify the url of the performed api call
             basic_auth (BasicAuth): Specify the optional basic auth credentials (Default None)
 
@@ -178,14 +220,8 @@ class OtherHTTP:
         """
 
         try:
-            if self.grafana_api_model.http2_support:
-
-                async def _execute_async_http_requests():
-                    async with http:
-                        return await http.request("GET", url, auth=basic_auth)
-
-                return asyncio.run(_execute_async_http_requests())
-            else:
-                return http.request("GET", url, auth=basic_auth)
+            return http.request("GET", url, auth=basic_auth)
         except Exception as e:
             raise e
+        finally:
+            http.close()
@@ -0,0 +1,217 @@
+import collections
+import functools
+import logging
+
+from .api import Api
+from .dashboard import Dashboard
+from .folder import Folder
+from .model import APIModel, APIEndpoints, PermissionDiff
+
+# The keys that identify the principal of a permission item
+PERMISSION_PRINCIPALS: tuple = ("userId", "teamId", "role")
+
+
+class PermissionReconciler:
+    """The class includes all necessary methods to reconcile the permissions of many dashboards and folders with a desired state. The current permissions are requested concurrently, the differences are calculated locally and only the dashboards and folders with different permissions are updated
+
+    Args:
+        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+
+    Attributes:
+        grafana_api_model (APIModel): This is where we store the grafana_api_model
+    """
+
+    def __init__(self, grafana_api_model: APIModel):
+        self.grafana_api_model = grafana_api_model
+
+    def reconcile(
+        self,
+        dashboards: dict = None,
+        folders: dict = None,
+        concurrency: int = None,
+        dry_run: bool = False,
+    ) -> list:
+        """The method includes a functionality to reconcile the permissions of the dashboards and folders with the desired permissions. The permission items e.g. {"teamId": 1, "permission": 2} specify a user, team or role and the permission level. The inherited permissions are ignored and the Grafana permission API replaces the complete permission list of an updated dashboard or folder
+
+        Args:
+            dashboards (dict): Specify the optional dict of the dashboard uids and the desired permission items (default None)
+            folders (dict): Specify the optional dict of the folder uids and the desired permission items (default None)
+            concurrency (int): Specify the optional maximum number of the concurrently reconciled dashboards and folders. The default value is the max_workers value of the model (default None)
+            dry_run (bool): Specify if the differences should only be calculated without updating the permissions (default False)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call. The error is raised after the reconciliation of all other dashboards and folders
+
+        Returns:
+            permission_diffs (list): Returns the list of the PermissionDiff objects of all dashboards and folders
+        """
+
+        if not dashboards and not folders:
+            logging.error("There are no dashboards or folders defined.")
+            raise ValueError
+
+        resources: list = [
+            ("dashboard", uid, items) for uid, items in (dashboards or dict()).items()
+        ] + [("folder", uid, items) for uid, items in (folders or dict()).items()]
+        pending: collections.deque = collections.deque(resources)
+        permission_diffs: list = list()
+        failed_uids: list = list()
+
+        for result in Api(self.grafana_api_model).batch_iter(
+            (
+                functools.partial(self._reconcile_the_permissions, *resource, dry_run)
+                for resource in resources
+            ),
+            concurrency,
+        ):
+            _, uid, _ = pending.popleft()
+
+            if result.successful:
+                permission_diffs.append(result.result)
+            else:
+                logging.error(f"Check the error: {result.error}.")
+                failed_uids.append(uid)
+
+        if len(failed_uids) != 0:
+            logging.error(
+                f"The reconciliation of the permissions {failed_uids} failed."
+            )
+            raise Exception
+
+        return permission_diffs
+
+    @staticmethod
+    def calculate_permission_diff(
+        uid: str, resource_type: str, current: list, desired: list
+    ) -> PermissionDiff:
+        """The method includes a functionality to calculate the difference between the current and the desired permission items. The inherited permission items are ignored
+
+        Args:
+            uid (str): Specify the uid of the dashboard or folder
+            resource_type (str): Specify the type of the resource, dashboard or folder
+            current (list): Specify the current permission items
+            desired (list): Specify the desired permission items
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+
+        Returns:
+            permission_diff (PermissionDiff): Returns the difference
+        """
+
+        current_permissions: dict = _index_the_permissions(
+            [item for item in current if not item.get("inherited")]
+        )
+        desired_permissions: dict = _index_the_permissions(desired)
+        permission_diff: PermissionDiff = PermissionDiff(uid, resource_type)
+
+        for key, permission in desired_permissions.items():
+            if key not in current_permissions:
+                permission_diff.added.append(_create_the_item(key, permission))
+            elif current_permissions[key] != permission:
+                permission_diff.changed.append(_create_the_item(key, permission))
+
+        for key, permission in current_permissions.items():
+            if key not in desired_permissions:
+                permission_diff.removed.append(_create_the_item(key, permission))
+
+        return permission_diff
+
+    def _reconcile_the_permissions(
+        self, resource_type: str, uid: str, desired: list, dry_run: bool
+    ) -> PermissionDiff:
+        """The method includes a functionality to reconcile the permissions of a dashboard or folder
+
+        Args:
+            resource_type (str): Specify the type of the resource, dashboard or folder
+            uid (str): Specify the uid of the dashboard or folder
+            desired (list): Specify the desired permission items
+            dry_run (bool): Specify if the difference should only be calculated
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            permission_diff (PermissionDiff): Returns the difference
+        """
+
+        endpoint: str = (
+            APIEndpoints.DASHBOARDS.value
+            if resource_type == "dashboard"
+            else APIEndpoints.FOLDERS.value
+        )
+        api_call: list = Api(self.grafana_api_model).call_the_api(
+            f"{endpoint}/uid/{uid}/permissions"
+            if resource_type == "dashboard"
+            else f"{endpoint}/{uid}/permissions"
+        )
+
+        if not isinstance(api_call, list):
+            logging.error(f"Please, check the error: {api_call}.")
+            raise Exception
+
+        permission_diff: PermissionDiff = self.calculate_permission_diff(
+            uid, resource_type, api_call, desired
+        )
+
+        if permission_diff.changes and not dry_run:
+            items: list = [
+                _create_the_item(key, permission)
+                for key, permission in _index_the_permissions(desired).items()
+            ]
+
+            if resource_type == "dashboard":
+                Dashboard(self.grafana_api_model).update_dashboard_permissions_by_uid(
+                    uid, dict({"items": items})
+                )
+            else:
+                Folder(self.grafana_api_model).update_folder_permissions(
+                    uid, dict({"items": items})
+                )
+
+            permission_diff.updated = True
+
+        return permission_diff
+
+
+def _index_the_permissions(items: list) -> dict:
+    """The function includes a functionality to index the permission items by the principal
+
+    Args:
+        items (list): Specify the permission items
+
+    Raises:
+        ValueError: Missed specifying a necessary value
+
+    Returns:
+        permissions (dict): Returns a dict of the principals and the corresponding permission levels
+    """
+
+    permissions: dict = dict()
+
+    for item in items:
+        for principal in PERMISSION_PRINCIPALS:
+            if item.get(principal):
+                permissions[(principal, item.get(principal))] = item.get("permission")
+                break
+        else:
+            logging.error(f"There is no userId, teamId or role defined: {item}.")
+            raise ValueError
+
+    return permissions
+
+
+def _create_the_item(key: tuple, permission: int) -> dict:
+    """The function includes a functionality to create a permission item
+
+    Args:
+        key (tuple): Specify the principal of the permission item
+        permission (int): Specify the permission level
+
+    Returns:
+        item (dict): Returns the permission item
+    """
+
+    return dict({key[0]: key[1], "permission": permission})
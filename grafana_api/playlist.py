@@ -1,4 +1,3 @@
-import json
 import logging
 
 from .model import (
@@ -172,14 +171,12 @@ class Playlist:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.PLAYLISTS.value}",
                 RequestsMethods.POST,
-                json.dumps(
-                    dict(
-                        {
-                            "name": playlist.name,
-                            "interval": playlist.interval,
-                            "items": items,
-                        }
-                    )
+                dict(
+                    {
+                        "name": playlist.name,
+                        "interval": playlist.interval,
+                        "items": items,
+                    }
                 ),
             )
 
@@ -223,14 +220,12 @@ class Playlist:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.PLAYLISTS.value}/{playlist_uid}",
                 RequestsMethods.PUT,
-                json.dumps(
-                    dict(
-                        {
-                            "name": playlist.name,
-                            "interval": playlist.interval,
-                            "items": items,
-                        }
-                    )
+                dict(
+                    {
+                        "name": playlist.name,
+                        "interval": playlist.interval,
+                        "items": items,
+                    }
                 ),
             )
 
@@ -1,4 +1,3 @@
-import json
 import logging
 
 from .model import APIModel, APIEndpoints, RequestsMethods
@@ -84,7 +83,7 @@ class Preferences:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.USER_PREFERENCES.value,
                 RequestsMethods.PATCH,
-                json.dumps(modified_values),
+                modified_values,
             )
 
             if api_call.get("message") != "Preferences updated":
@@ -162,7 +161,7 @@ class Preferences:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.ORG_PREFERENCES.value,
                 RequestsMethods.PATCH,
-                json.dumps(modified_values),
+                modified_values,
             )
 
             if api_call.get("message") != "Preferences updated":
@@ -1,4 +1,3 @@
-import json
 import logging
 
 from .model import (
@@ -56,13 +55,11 @@ class QueryHistory:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.QUERY_HISTORY.value,
                 RequestsMethods.POST,
-                json.dumps(
-                    dict(
-                        {
-                            "datasourceUid": datasource_uid,
-                            "queries": queries_json_list,
-                        }
-                    )
+                dict(
+                    {
+                        "datasourceUid": datasource_uid,
+                        "queries": queries_json_list,
+                    }
                 ),
             )
 
@@ -173,7 +170,7 @@ class QueryHistory:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.QUERY_HISTORY.value}/{uid}",
                 RequestsMethods.PATCH,
-                json.dumps({"comment": comment}),
+                {"comment": comment},
             )
 
             if api_call == dict() or api_call.get("result") is None:
@@ -203,7 +200,7 @@ class QueryHistory:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.QUERY_HISTORY.value}/star/{uid}",
                 RequestsMethods.POST,
-                json.dumps({}),
+                {},
             )
 
             if api_call == dict() or api_call.get("result") is None:
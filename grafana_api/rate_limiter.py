@@ -0,0 +1,264 @@
+import collections
+import contextlib
+import threading
+import time
+
+from .model import RateLimit
+
+
+class TokenBucket:
+    """The class includes the functionality of a thread-safe token bucket. A token is reserved for every request and the bucket returns the time that the request has to wait for the reserved token. The reservations are served in the order of the requests
+
+    Args:
+        requests_per_second (float): Specify the refill rate of the bucket
+        burst (int): Specify the capacity of the bucket
+
+    Attributes:
+        requests_per_second (float): This is where we store the requests_per_second
+        burst (int): This is where we store the burst
+    """
+
+    def __init__(self, requests_per_second: float, burst: int):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self._tokens: float = float(burst)
+        self._updated: float = time.monotonic()
+        self._lock: threading.Lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """The method includes a functionality to reserve a token
+
+        Returns:
+            wait (float): Returns the seconds until the reserved token is available
+        """
+
+        with self._lock:
+            now: float = time.monotonic()
+            self._tokens = min(
+                float(self.burst),
+                self._tokens + (now - self._updated) * self.requests_per_second,
+            )
+            self._updated = now
+            self._tokens -= 1
+
+            if self._tokens >= 0:
+                return 0.0
+
+            return -self._tokens / self.requests_per_second
+
+
+class InFlightLimit:
+    """The class includes the functionality of a thread-safe counter of the in-flight requests that is shared by the threads and the event loops of a Grafana API model. A released slot is handed over to the longest waiting request, regardless of whether the request waits inside a thread or a coroutine
+
+    Args:
+        max_in_flight (int): Specify the maximum number of the in-flight requests
+
+    Attributes:
+        max_in_flight (int): This is where we store the max_in_flight
+    """
+
+    def __init__(self, max_in_flight: int):
+        self.max_in_flight = max_in_flight
+        self._in_flight: int = 0
+        self._waiters: collections.deque = collections.deque()
+        self._lock: threading.Lock = threading.Lock()
+
+    def acquire(self):
+        """The method includes a functionality to wait until a slot is available and to reserve the slot
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            if self._in_flight < self.max_in_flight and len(self._waiters) == 0:
+                self._in_flight += 1
+                return None
+
+            waiter: threading.Event = threading.Event()
+            self._waiters.append(waiter)
+
+        waiter.wait()
+
+    async def async_acquire(self):
+        """The method includes a functionality to wait asynchronously until a slot is available and to reserve the slot
+
+        Returns:
+            None
+        """
+
+        import asyncio
+
+        event_loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        with self._lock:
+            if self._in_flight < self.max_in_flight and len(self._waiters) == 0:
+                self._in_flight += 1
+                return None
+
+            waiter: tuple = (event_loop, event_loop.create_future())
+            self._waiters.append(waiter)
+
+        try:
+            await waiter[1]
+        except asyncio.CancelledError as e:
+            with self._lock:
+                handed_over: bool = waiter not in self._waiters
+
+                if not handed_over:
+                    self._waiters.remove(waiter)
+
+            if handed_over:
+                self.release()
+
+            raise e
+
+    def release(self):
+        """The method includes a functionality to release a slot. The slot is handed over to the longest waiting request
+
+        Returns:
+            None
+        """
+
+        while True:
+            with self._lock:
+                if len(self._waiters) == 0:
+                    self._in_flight -= 1
+                    return None
+
+                waiter: any = self._waiters.popleft()
+
+            if isinstance(waiter, threading.Event):
+                waiter.set()
+                return None
+
+            event_loop, future = waiter
+
+            try:
+                event_loop.call_soon_threadsafe(
+                    lambda: future.done() or future.set_result(None)
+                )
+                return None
+            except RuntimeError:
+                # The event loop of the waiter is closed, the slot is handed over to the next waiter
+                continue
+
+
+class RateLimiter:
+    """The class includes the functionality to limit the requests per second and the number of the in-flight requests of a Grafana API model. The limits of the endpoint prefixes are enforced in addition to the global limits
+
+    Args:
+        rate_limit (RateLimit): Specify the rate limit configuration
+
+    Attributes:
+        rate_limit (RateLimit): This is where we store the rate_limit
+    """
+
+    def __init__(self, rate_limit: RateLimit):
+        self.rate_limit = rate_limit
+        self._bucket: TokenBucket = None
+        self._in_flight: InFlightLimit = None
+
+        if rate_limit.requests_per_second is not None:
+            self._bucket = TokenBucket(
+                rate_limit.requests_per_second,
+                rate_limit.burst or max(1, int(rate_limit.requests_per_second)),
+            )
+
+        if rate_limit.max_in_flight is not None:
+            self._in_flight = InFlightLimit(rate_limit.max_in_flight)
+
+        self._endpoint_limiters: list = sorted(
+            [
+                (getattr(prefix, "value", prefix), RateLimiter(endpoint_rate_limit))
+                for prefix, endpoint_rate_limit in (
+                    rate_limit.endpoint_limits or dict()
+                ).items()
+            ],
+            key=lambda endpoint_limiter: len(endpoint_limiter[0]),
+            reverse=True,
+        )
+
+    def get_the_limiters(self, api_call: str) -> list:
+        """The method includes a functionality to get the limiters that apply to an API call. The limiter of the longest matching endpoint prefix is used in addition to the global limiter
+
+        Args:
+            api_call (str): Specify the API call endpoint
+
+        Returns:
+            limiters (list): Returns the list of the limiters
+        """
+
+        for prefix, endpoint_limiter in self._endpoint_limiters:
+            if api_call.startswith(prefix):
+                return [self, endpoint_limiter]
+
+        return [self]
+
+    @contextlib.contextmanager
+    def limit(self, api_call: str) -> float:
+        """The method includes a functionality to wait until an API call is allowed by all corresponding limiters and to release the in-flight slots after the call
+
+        Args:
+            api_call (str): Specify the API call endpoint
+
+        Returns:
+            wait (float): Returns the seconds that the API call waited for a token
+        """
+
+        limiters: list = self.get_the_limiters(api_call)
+        acquired: list = list()
+        wait: float = 0.0
+
+        try:
+            for limiter in limiters:
+                if limiter._in_flight is not None:
+                    limiter._in_flight.acquire()
+                    acquired.append(limiter._in_flight)
+
+            for limiter in limiters:
+                if limiter._bucket is not None:
+                    wait = max(wait, limiter._bucket.reserve())
+
+            if wait > 0:
+                time.sleep(wait)
+
+            yield wait
+        finally:
+            for in_flight in reversed(acquired):
+                in_flight.release()
+
+    @contextlib.asynccontextmanager
+    async def async_limit(self, api_call: str) -> float:
+        """The method includes a functionality to wait asynchronously until an API call is allowed by all corresponding limiters and to release the in-flight slots after the call
+
+        Args:
+            api_call (str): Specify the API call endpoint
+
+        Returns:
+            wait (float): Returns the seconds that the API call waited for a token
+        """
+
+        import asyncio
+
+        limiters: list = self.get_the_limiters(api_call)
+        acquired: list = list()
+        wait: float = 0.0
+
+        try:
+            for limiter in limiters:
+                if limiter._in_flight is not None:
+                    await limiter._in_flight.async_acquire()
+                    acquired.append(limiter._in_flight)
+
+            for limiter in limiters:
+                if limiter._bucket is not None:
+                    wait = max(wait, limiter._bucket.reserve())
+
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            yield wait
+        finally:
+            for in_flight in reversed(acquired):
+                in_flight.release()
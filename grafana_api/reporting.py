@@ -1,4 +1,3 @@
-import json
 import logging
 
 from .model import (
@@ -61,7 +60,7 @@ class Reporting:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.REPORTING.value,
                 RequestsMethods.POST,
-                json.dumps(result),
+                result,
                 timeout=60,
             )
 
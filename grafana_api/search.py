@@ -1,7 +1,13 @@
 import logging
+import threading
+from typing import Iterator
+from urllib.parse import urlencode
 
 from .api import Api
-from .model import APIModel, APIEndpoints
+from .model import APIModel, APIEndpoints, SearchHit
+
+# The search API of Grafana returns at most 5000 results per page
+SEARCH_PAGE_SIZE_LIMIT: int = 5000
 
 
 class Search:
@@ -42,3 +48,343 @@ class Search:
         else:
             logging.error("There is no search_query defined.")
             raise ValueError
+
+    def iter_search(
+        self,
+        query: str = None,
+        type: str = None,
+        tags: list = None,
+        folder_uids: list = None,
+        page_size: int = 1000,
+        prefetch: int = 2,
+    ) -> Iterator[SearchHit]:
+        """The method includes a functionality to iterate over all results of a search. The pages are requested lazily, the next pages are prefetched concurrently and the iteration stops at the first page that is shorter than the page size
+
+        Args:
+            query (str): Specify the optional search query (default None)
+            type (str): Specify the optional type of the results e.g. dash-db or dash-folder (default None)
+            tags (list): Specify the optional list of the tags that the results must include (default None)
+            folder_uids (list): Specify the optional list of the folder uids that include the results (default None)
+            page_size (int): Specify the number of the results per page between 1 and the maximum value 5000 of Grafana (default 1000)
+            prefetch (int): Specify the number of the pages that are fetched ahead of the consumer (default 2)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            search_hits (Iterator[SearchHit]): Returns an iterator over the search results
+        """
+
+        if page_size <= 0 or page_size > SEARCH_PAGE_SIZE_LIMIT:
+            logging.error(
+                f"Please define a page_size between 1 and {SEARCH_PAGE_SIZE_LIMIT}."
+            )
+            raise ValueError
+
+        parameters: list = list()
+
+        if query is not None:
+            parameters.append(("query", query))
+        if type is not None:
+            parameters.append(("type", type))
+        for tag in tags or list():
+            parameters.append(("tag", tag))
+        for folder_uid in folder_uids or list():
+            parameters.append(("folderUIDs", folder_uid))
+
+        parameters.append(("limit", page_size))
+
+        def _get_the_page(page: int) -> list:
+            result: list = Api(self.grafana_api_model).call_the_api(
+                f"{APIEndpoints.SEARCH.value}?{urlencode(parameters + [('page', page)])}"
+            )
+
+            if not isinstance(result, list):
+                logging.error(f"Check the error: {result}.")
+                raise Exception
+
+            return result
+
+        for page in Api(self.grafana_api_model).paginate(
+            _get_the_page, page_size, prefetch
+        ):
+            for hit in page:
+                yield SearchHit.from_dict(hit)
+
+
+class SearchIndex:
+    """The class includes the functionality of a thread-safe local index over the dashboards and folders of the Grafana search API. The index is built from one paginated crawl and answers the uid, id, title, folder and tag lookups locally. The index is built on the first lookup and can be refreshed completely or for the inserted folders
+
+    Args:
+        grafana_api_model (APIModel): Inject a Grafana API model object that includes all necessary values and information
+        page_size (int): Specify the number of the results per page of the crawl between 1 and the maximum value 5000 of Grafana (default 1000)
+        prefetch (int): Specify the number of the pages that are fetched ahead during the crawl (default 2)
+
+    Attributes:
+        grafana_api_model (APIModel): This is where we store the grafana_api_model
+        page_size (int): This is where we store the page_size
+        prefetch (int): This is where we store the prefetch
+    """
+
+    def __init__(
+        self, grafana_api_model: APIModel, page_size: int = 1000, prefetch: int = 2
+    ):
+        self.grafana_api_model = grafana_api_model
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self._hits: dict = dict()
+        self._ids: dict = dict()
+        self._titles: dict = dict()
+        self._folders: dict = dict()
+        self._tags: dict = dict()
+        self._loaded: bool = False
+        self._lock: threading.RLock = threading.RLock()
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._hits)
+
+    def __contains__(self, uid: str) -> bool:
+        self._load()
+        return uid in self._hits
+
+    def __iter__(self) -> Iterator[SearchHit]:
+        self._load()
+
+        with self._lock:
+            return iter(list(self._hits.values()))
+
+    def refresh(self, folder_uids: list = None) -> "SearchIndex":
+        """The method includes a functionality to crawl the search API and to update the index. Without folder uids, the complete index is replaced. With folder uids, only the direct children of the inserted folders are replaced
+
+        Args:
+            folder_uids (list): Specify the optional list of the folder uids that should be refreshed (default None)
+
+        Raises:
+            ValueError: Missed specifying a necessary value
+            Exception: Unspecified error by executing the API call
+
+        Returns:
+            search_index (SearchIndex): Returns the search index
+        """
+
+        hits: list = list(
+            Search(self.grafana_api_model).iter_search(
+                folder_uids=folder_uids,
+                page_size=self.page_size,
+                prefetch=self.prefetch,
+            )
+        )
+
+        with self._lock:
+            if folder_uids is None:
+                self.clear()
+            else:
+                for folder_uid in folder_uids:
+                    for uid in list(self._folders.get(folder_uid, dict())):
+                        self.remove(uid)
+
+            for hit in hits:
+                if hit.uid is None or hit.id is None or hit.title is None:
+                    logging.error(f"There is no title, uid or id defined: {hit}.")
+                    continue
+
+                self.update(hit)
+
+            self._loaded = True
+
+        return self
+
+    def update(self, hit: SearchHit):
+        """The method includes a functionality to insert or replace a search hit inside the index e.g. after the creation or the update of a dashboard
+
+        Args:
+            hit (SearchHit): Specify the search hit
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self.remove(hit.uid)
+            self._hits[hit.uid] = hit
+            self._ids[hit.id] = hit.uid
+            self._titles.setdefault(hit.title, dict())[hit.uid] = None
+            self._folders.setdefault(hit.folder_uid, dict())[hit.uid] = None
+
+            for tag in hit.tags or list():
+                self._tags.setdefault(tag, dict())[hit.uid] = None
+
+    def remove(self, uid: str):
+        """The method includes a functionality to remove a search hit from the index e.g. after the deletion of a dashboard
+
+        Args:
+            uid (str): Specify the uid of the dashboard or folder
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            hit: SearchHit = self._hits.pop(uid, None)
+
+            if hit is None:
+                return
+
+            if self._ids.get(hit.id) == uid:
+                del self._ids[hit.id]
+
+            self._remove_from_the_index(self._titles, hit.title, uid)
+            self._remove_from_the_index(self._folders, hit.folder_uid, uid)
+
+            for tag in hit.tags or list():
+                self._remove_from_the_index(self._tags, tag, uid)
+
+    def clear(self):
+        """The method includes a functionality to remove all search hits from the index. The index is crawled again on the next lookup
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self._hits.clear()
+            self._ids.clear()
+            self._titles.clear()
+            self._folders.clear()
+            self._tags.clear()
+            self._loaded = False
+
+    def get(self, uid: str) -> SearchHit:
+        """The method includes a functionality to get a dashboard or folder specified by the uid
+
+        Args:
+            uid (str): Specify the uid of the dashboard or folder
+
+        Returns:
+            hit (SearchHit): Returns the search hit or None, if the uid is not indexed
+        """
+
+        self._load()
+        return self._hits.get(uid)
+
+    def get_by_id(self, id: int) -> SearchHit:
+        """The method includes a functionality to get a dashboard or folder specified by the id
+
+        Args:
+            id (int): Specify the id of the dashboard or folder
+
+        Returns:
+            hit (SearchHit): Returns the search hit or None, if the id is not indexed
+        """
+
+        self._load()
+
+        with self._lock:
+            return self._hits.get(self._ids.get(id))
+
+    def find_by_title(
+        self, title: str, folder_uid: str = None, type: str = None
+    ) -> list:
+        """The method includes a functionality to find the dashboards and folders specified by the title and optionally by the parent folder and the type
+
+        Args:
+            title (str): Specify the title of the dashboard or folder
+            folder_uid (str): Specify the optional uid of the parent folder (default None)
+            type (str): Specify the optional type of the results e.g. dash-db or dash-folder (default None)
+
+        Returns:
+            hits (list): Returns the list of the matching search hits
+        """
+
+        return [
+            hit
+            for hit in self._get_the_hits(self._titles, title)
+            if (folder_uid is None or hit.folder_uid == folder_uid)
+            and (type is None or hit.type == type)
+        ]
+
+    def find_by_tags(self, tags: list) -> list:
+        """The method includes a functionality to find the dashboards that include all inserted tags
+
+        Args:
+            tags (list): Specify the list of the tags
+
+        Returns:
+            hits (list): Returns the list of the matching search hits
+        """
+
+        self._load()
+
+        with self._lock:
+            uids: list = sorted(
+                [self._tags.get(tag, dict()) for tag in tags], key=len
+            ) or [dict()]
+
+            return [
+                self._hits[uid]
+                for uid in uids[0]
+                if all(uid in tag_uids for tag_uids in uids[1:])
+            ]
+
+    def find_in_folder(self, folder_uid: str = None) -> list:
+        """The method includes a functionality to find the dashboards and folders that are direct children of a folder
+
+        Args:
+            folder_uid (str): Specify the uid of the parent folder. None specifies the top level (default None)
+
+        Returns:
+            hits (list): Returns the list of the search hits
+        """
+
+        return self._get_the_hits(self._folders, folder_uid)
+
+    def _load(self):
+        """The method includes a functionality to crawl the search API on the first lookup
+
+        Returns:
+            None
+        """
+
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self.refresh()
+
+    def _get_the_hits(self, index: dict, key: any) -> list:
+        """The method includes a functionality to get the search hits of a key of an index
+
+        Args:
+            index (dict): Specify the index
+            key (any): Specify the key
+
+        Returns:
+            hits (list): Returns the list of the search hits
+        """
+
+        self._load()
+
+        with self._lock:
+            return [self._hits[uid] for uid in index.get(key, dict())]
+
+    @staticmethod
+    def _remove_from_the_index(index: dict, key: any, uid: str):
+        """The method includes a functionality to remove a uid from a key of an index and to drop empty keys
+
+        Args:
+            index (dict): Specify the index
+            key (any): Specify the key
+            uid (str): Specify the uid
+
+        Returns:
+            None
+        """
+
+        uids: dict = index.get(key)
+
+        if uids is not None:
+            uids.pop(uid, None)
+
+            if len(uids) == 0:
+                del index[key]
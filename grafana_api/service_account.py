@@ -1,4 +1,3 @@
-import json
 import logging
 
 from .api import Api
@@ -109,7 +108,7 @@ class ServiceAccount:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.SERVICE_ACCOUNTS.value,
                 RequestsMethods.POST,
-                json.dumps(dict({"name": name, "role": role})),
+                dict({"name": name, "role": role}),
             )
 
             if api_call == dict() or api_call.get("id") is None:
@@ -145,7 +144,7 @@ class ServiceAccount:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.SERVICE_ACCOUNTS.value}/{id}",
                 RequestsMethods.PATCH,
-                json.dumps(dict({"name": name, "role": role})),
+                dict({"name": name, "role": role}),
             )
 
             if api_call == dict() or api_call.get("id") is None:
@@ -246,7 +245,7 @@ class ServiceAccount:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.SERVICE_ACCOUNTS.value}/{id}/tokens",
                 RequestsMethods.POST,
-                json.dumps(dict({"name": name, "role": role})),
+                dict({"name": name, "role": role}),
             )
 
             if api_call == dict() or api_call.get("id") is None:
@@ -309,7 +308,7 @@ class ServiceAccount:
         api_call: dict = Api(self.grafana_api_model).call_the_api(
             f"{APIEndpoints.SERVICE_ACCOUNTS.value}/migrate",
             RequestsMethods.POST,
-            json.dumps(dict()),
+            dict(),
         )
 
         if (
@@ -345,7 +344,7 @@ class ServiceAccount:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.SERVICE_ACCOUNTS.value}/migrate/{key_id}",
                 RequestsMethods.POST,
-                json.dumps(dict()),
+                dict(),
             )
 
             if api_call.get("message") != "Service accounts migrated":
@@ -400,7 +399,7 @@ class ServiceAccount:
         api_call: dict = Api(self.grafana_api_model).call_the_api(
             f"{APIEndpoints.SERVICE_ACCOUNTS.value}/hideApiKeys",
             RequestsMethods.POST,
-            json.dumps(dict()),
+            dict(),
         )
 
         if api_call.get("message") != "API keys hidden":
@@ -432,7 +431,7 @@ class ServiceAccount:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.SERVICE_ACCOUNTS.value}/{id}/revert/{key_id}",
                 RequestsMethods.POST,
-                json.dumps(dict()),
+                dict(),
             )
 
             if api_call.get("message") != "reverted service account to API key":
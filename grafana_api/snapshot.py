@@ -1,4 +1,3 @@
-import json
 import logging
 
 from .model import (
@@ -72,7 +71,7 @@ class Snapshot:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 APIEndpoints.SNAPSHOTS.value,
                 RequestsMethods.POST,
-                json.dumps(snapshot_json),
+                snapshot_json,
             )
 
             if api_call == dict() or api_call.get("id") is None:
@@ -1,4 +1,3 @@
-import json
 import logging
 
 from .model import (
@@ -117,7 +116,7 @@ class Team:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.TEAMS.value}",
                 RequestsMethods.POST,
-                json.dumps(dict({"name": team.name, "email": team.name})),
+                dict({"name": team.name, "email": team.name}),
             )
 
             if api_call.get("message") != "Team created":
@@ -153,7 +152,7 @@ class Team:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.TEAMS.value}/{id}",
                 RequestsMethods.PUT,
-                json.dumps(dict({"name": name, "email": email})),
+                dict({"name": name, "email": email}),
             )
 
             if api_call.get("message") != "Team updated":
@@ -253,7 +252,7 @@ class Team:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.TEAMS.value}/{id}/members",
                 RequestsMethods.POST,
-                json.dumps(dict({"userId": user_id})),
+                dict({"userId": user_id}),
             )
 
             if api_call.get("message") != "Member added to Team":
@@ -381,7 +380,7 @@ class Team:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.TEAMS.value}/{id}/preferences",
                 RequestsMethods.PUT,
-                json.dumps(team_preferences),
+                team_preferences,
             )
 
             if api_call.get("message") != "Preferences updated":
@@ -1,4 +1,3 @@
-import json
 import logging
 
 from .model import (
@@ -153,15 +152,13 @@ class User:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.USERS.value}/{id}",
                 RequestsMethods.PUT,
-                json.dumps(
-                    dict(
-                        {
-                            "email": user.email,
-                            "name": user.name,
-                            "login": user.login,
-                            "theme": user.theme,
-                        }
-                    )
+                dict(
+                    {
+                        "email": user.email,
+                        "name": user.name,
+                        "login": user.login,
+                        "theme": user.theme,
+                    }
                 ),
             )
 
@@ -257,7 +254,7 @@ class User:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.USERS.value}/{user_id}/using/{org_id}",
                 RequestsMethods.POST,
-                json.dumps(dict()),
+                dict(),
             )
 
             if api_call.get("message") != "Active organization changed":
@@ -329,14 +326,12 @@ class CurrentUser:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.USER.value}/password",
                 RequestsMethods.PUT,
-                json.dumps(
-                    dict(
-                        {
-                            "oldPassword": old_password,
-                            "newPassword": new_password,
-                            "confirmNew": confirm_new_password,
-                        }
-                    )
+                dict(
+                    {
+                        "oldPassword": old_password,
+                        "newPassword": new_password,
+                        "confirmNew": confirm_new_password,
+                    }
                 ),
             )
 
@@ -367,7 +362,7 @@ class CurrentUser:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.USER.value}/using/{org_id}",
                 RequestsMethods.POST,
-                json.dumps(dict()),
+                dict(),
             )
 
             if api_call.get("message") != "Active organization changed":
@@ -437,7 +432,7 @@ class CurrentUser:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.USER.value}/stars/dashboard/{dashboard_id}",
                 RequestsMethods.POST,
-                json.dumps(dict()),
+                dict(),
             )
 
             if api_call.get("message") != "Dashboard starred!":
@@ -516,7 +511,7 @@ class CurrentUser:
             api_call: dict = Api(self.grafana_api_model).call_the_api(
                 f"{APIEndpoints.USER.value}/revoke-auth-token",
                 RequestsMethods.POST,
-                json.dumps(dict({"authTokenId": auth_token_id})),
+                dict({"authTokenId": auth_token_id}),
             )
 
             if api_call.get("message") != "User auth token revoked":
@@ -29,6 +29,7 @@ setuptools.setup(
     install_requires=["httpx"],
     extras_require={
         "http2": ["httpx[http2]"],
+        "orjson": ["orjson"],
     },
     tests_require=["pytest-httpx", "pytest"],
     python_requires=">=3.8",
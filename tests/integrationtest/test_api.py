@@ -19,17 +19,24 @@ class APITest(TestCase):
     api: Api = Api(model)
 
     def test_get_http_client_version(self):
-        http = self.api.create_the_http_api_client()
         url: str = f"{self.model.host}/api/health"
 
-        if self.https2_support:
+        with self.api.create_the_http_api_client() as http:
+            response = http.request("GET", url)
 
-            async def _execute_async_http_requests():
-                async with http:
-                    return await http.request("GET", url)
+        self.assertEqual(
+            "HTTP/2" if self.https2_support else "HTTP/1.1", response.http_version
+        )
 
-            response = asyncio.run(_execute_async_http_requests())
-            self.assertEqual("HTTP/2", response.http_version)
-        else:
-            response = http.request("GET", url)
-            self.assertEqual("HTTP/1.1", response.http_version)
+    def test_get_async_http_client_version(self):
+        url: str = f"{self.model.host}/api/health"
+
+        async def _execute_async_http_requests():
+            async with self.api.create_the_async_http_api_client() as http:
+                return await http.request("GET", url)
+
+        response = asyncio.run(_execute_async_http_requests())
+
+        self.assertEqual(
+            "HTTP/2" if self.https2_support else "HTTP/1.1", response.http_version
+        )
@@ -1,18 +1,33 @@
-from httpx import ConnectError, UnsupportedProtocol
+import asyncio
+import threading
+import time
+from typing import Iterator
+
+from httpx import ConnectError, UnsupportedProtocol, Response, ReadTimeout
 
 import pytest
 from pytest_httpx import HTTPXMock
 from unittest import TestCase
 from unittest.mock import MagicMock, patch, Mock
 
-from grafana_api.model import APIModel, RequestsMethods
-from grafana_api.api import Api
+from grafana_api.model import (
+    APIModel,
+    RequestsMethods,
+    BatchOperation,
+    RetryPolicy,
+    RateLimit,
+    CachePolicy,
+)
+from grafana_api.api import Api, AsyncApi
 
 
 class ApiTestCase(TestCase):
     model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
     api: Api = Api(grafana_api_model=model)
 
+    def tearDown(self):
+        self.model.close()
+
     def test_call_the_api_non_method(self):
         with self.assertRaises(Exception):
             self.api.call_the_api(api_call=MagicMock(), method=None)
@@ -197,31 +212,37 @@ class ApiTestCase(TestCase):
         with self.assertRaises(ConnectError):
             self.api._check_the_api_call_response(response=mock)
 
-    @patch("grafana_api.api.Api._check_if_valid_json")
-    def test_check_the_api_call_response_valid_json(self, check_if_valid_json_mock):
-        check_if_valid_json_mock.return_value = True
+    @patch("grafana_api.api.Api._decode_the_api_call_response")
+    def test_check_the_api_call_response_valid_json(
+        self, decode_the_api_call_response_mock
+    ):
+        decode_the_api_call_response_mock.return_value = (True, dict({"a": 1}))
 
         mock: Mock = Mock()
         mock.text = "{}"
 
-        self.assertEqual({}, self.api._check_the_api_call_response(response=mock))
+        self.assertEqual(
+            dict({"a": 1}), self.api._check_the_api_call_response(response=mock)
+        )
+        decode_the_api_call_response_mock.assert_called_once_with(mock)
 
-    @patch("grafana_api.api.Api._check_if_valid_json")
+    @patch("grafana_api.api.Api._decode_the_api_call_response")
     def test_check_the_api_call_response_no_valid_json_status_code_result(
-        self, check_if_valid_json_mock
+        self, decode_the_api_call_response_mock
     ):
-        check_if_valid_json_mock.return_value = False
+        decode_the_api_call_response_mock.return_value = (False, None)
 
         mock: Mock = Mock()
-        mock.text = ""
+        mock.text = "{}"
         mock.status_code = 200
 
         self.assertEqual(
-            dict({"status": 200, "data": ""}),
+            dict({"status": 200, "data": "{}"}),
             self.api._check_the_api_call_response(
                 response=mock, response_status_code=True
             ),
         )
+        decode_the_api_call_response_mock.assert_called_once_with(mock)
 
     def test_check_the_api_call_response_return_status_code_dict(self):
         mock: Mock = Mock()
@@ -247,6 +268,125 @@ class ApiTestCase(TestCase):
             ),
         )
 
+    @patch("httpx.Client")
+    def test_get_the_http_api_client(self, httpx_client_mock):
+        model: APIModel = APIModel(host="https://test.test.de", token="test")
+        api: Api = Api(grafana_api_model=model)
+
+        httpx_client_mock.return_value.is_closed = False
+
+        self.assertEqual(
+            api.get_the_http_api_client(),
+            Api(grafana_api_model=model).get_the_http_api_client(),
+        )
+        self.assertEqual(1, httpx_client_mock.call_count)
+
+    @patch("httpx.Client")
+    def test_get_the_http_api_client_closed_client(self, httpx_client_mock):
+        model: APIModel = APIModel(host="https://test.test.de", token="test")
+        api: Api = Api(grafana_api_model=model)
+
+        httpx_client_mock.return_value.is_closed = False
+        api.get_the_http_api_client()
+        model.close()
+        api.get_the_http_api_client()
+
+        httpx_client_mock.return_value.close.assert_called_once()
+        self.assertEqual(2, httpx_client_mock.call_count)
+
+    def test_create_the_http_api_client(self):
+        model: APIModel = APIModel(
+            host="https://test.test.de", token="test", http2_support=True
+        )
+
+        with Api(grafana_api_model=model).create_the_http_api_client() as client:
+            self.assertEqual(False, client.is_closed)
+
+    def test_create_the_http_api_client_transport_retries(self):
+        for retry_policy, retries in [(None, 10), (RetryPolicy(), 0)]:
+            model: APIModel = APIModel(
+                host="https://test.test.de", token="test", retry_policy=retry_policy
+            )
+
+            with Api(grafana_api_model=model).create_the_http_api_client() as client:
+                self.assertEqual(retries, client._transport._pool._retries)
+
+            async_client: any = Api(
+                grafana_api_model=model
+            ).create_the_async_http_api_client()
+
+            self.assertEqual(retries, async_client._transport._pool._retries)
+            asyncio.run(async_client.aclose())
+
+    def test_check_the_api_call_response_single_json_decoding(self):
+        mock: Mock = Mock()
+        mock.text = '{"message": "test"}'
+
+        with patch.object(
+            self.model.codec, "loads", wraps=self.model.codec.loads
+        ) as loads_mock:
+            self.assertEqual(
+                dict({"message": "test"}),
+                self.api._check_the_api_call_response(response=mock),
+            )
+
+        self.assertEqual(1, loads_mock.call_count)
+
+    def test_check_the_api_call_response_content(self):
+        response: Response = Response(
+            200,
+            content=b'{"test": "test"}',
+            headers={"content-type": "application/json"},
+        )
+
+        self.assertEqual(
+            dict({"test": "test"}),
+            self.api._check_the_api_call_response(response=response),
+        )
+
+    def test_check_the_api_call_response_html_content_type(self):
+        response: Response = Response(
+            200, content=b"{}", headers={"content-type": "text/html; charset=utf-8"}
+        )
+
+        with patch.object(self.model.codec, "loads") as loads_mock:
+            self.assertEqual(
+                response, self.api._check_the_api_call_response(response=response)
+            )
+
+        loads_mock.assert_not_called()
+
+    def test_check_if_json_content_type(self):
+        self.assertTrue(
+            self.api._check_if_json_content_type(
+                Response(200, headers={"content-type": "application/json"})
+            )
+        )
+        self.assertTrue(
+            self.api._check_if_json_content_type(
+                Response(200, headers={"content-type": "text/plain; charset=utf-8"})
+            )
+        )
+        self.assertTrue(self.api._check_if_json_content_type(Response(200)))
+        self.assertFalse(
+            self.api._check_if_json_content_type(
+                Response(200, headers={"content-type": "image/png"})
+            )
+        )
+
+    def test_encode_the_json_complete(self):
+        self.assertEqual(
+            '{"test": "test"}', self.api._encode_the_json_complete('{"test": "test"}')
+        )
+        self.assertEqual(b"{}", self.api._encode_the_json_complete(b"{}"))
+        self.assertEqual(None, self.api._encode_the_json_complete(None))
+        self.assertEqual(
+            dict({"test": [1, 2]}),
+            self.model.codec.loads(
+                self.api._encode_the_json_complete(dict({"test": [1, 2]}))
+            ),
+        )
+
     def test_prepare_api_string(self):
         self.assertEqual("test&", self.api.prepare_api_string("test"))
 
@@ -389,3 +529,828 @@ def test_call_the_api_http2_delete(httpx_mock: HTTPXMock):
         api.call_the_api(method=RequestsMethods.DELETE, api_call="/test")["message"]
         == "Deletion successful"
     )
+
+
+def test_call_the_api_shared_client(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    with APIModel(host="https://test.com", token="test") as model:
+        api: Api = Api(model)
+
+        assert api.call_the_api(api_call="/test")["status"] == "success"
+        assert api.call_the_api(api_call="/test")["status"] == "success"
+        assert model._http_client is not None
+
+    assert model._http_client is None
+
+
+def test_async_call_the_api(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    async def _call_the_api() -> dict:
+        async with APIModel(host="https://test.com", token="test") as model:
+            api: AsyncApi = AsyncApi(model)
+            result: dict = await api.call_the_api(api_call="/test")
+
+            assert api.get_the_async_http_api_client() == (
+                AsyncApi(model).get_the_async_http_api_client()
+            )
+            return result
+
+    assert asyncio.run(_call_the_api())["status"] == "success"
+
+
+def test_async_call_the_api_post(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    async def _call_the_api() -> dict:
+        async with APIModel(
+            host="https://test.com", token="test", http2_support=True
+        ) as model:
+            return await AsyncApi(model).call_the_api(
+                api_call="/test",
+                method=RequestsMethods.POST,
+                json_complete='{"test": "test"}',
+                org_id_header=1,
+            )
+
+    assert asyncio.run(_call_the_api())["status"] == "success"
+    assert httpx_mock.get_request().headers["X-Grafana-Org-Id"] == "1"
+
+
+def test_async_call_the_api_post_no_json_complete():
+    async def _call_the_api() -> dict:
+        async with APIModel(host="https://test.com", token="test") as model:
+            return await AsyncApi(model).call_the_api(
+                api_call="/test", method=RequestsMethods.POST
+            )
+
+    with pytest.raises(Exception):
+        asyncio.run(_call_the_api())
+
+
+def test_async_run_in_executor(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    async def _run_in_executor() -> dict:
+        async with APIModel(host="https://test.com", token="test") as model:
+            result: dict = await AsyncApi(model).run_in_executor(
+                Api(model).call_the_api, "/test"
+            )
+
+            assert model._http_client is None
+            assert len(model._async_http_clients) == 1
+            return result
+
+    assert asyncio.run(_run_in_executor())["status"] == "success"
+
+
+def test_call_the_api_post_json_serializable_object(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    with APIModel(host="https://test.com", token="test") as model:
+        assert (
+            Api(model).call_the_api(
+                method=RequestsMethods.POST,
+                api_call="/test",
+                json_complete=dict({"test": "test"}),
+            )["status"]
+            == "success"
+        )
+
+    assert model.codec.loads(httpx_mock.get_request().content) == dict({"test": "test"})
+
+
+def test_batch(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url="https://test.com/test/1", text='{"status": 1}')
+    httpx_mock.add_response(url="https://test.com/test/2", status_code=404, text="")
+    httpx_mock.add_response(
+        url="https://test.com/test/3", method="POST", text='{"status": 3}'
+    )
+
+    with APIModel(host="https://test.com", token="test") as model:
+        api: Api = Api(model)
+        results: list = api.batch(
+            [
+                BatchOperation(api_call="/test/1"),
+                BatchOperation(api_call="/test/2", response_status_code=True),
+                BatchOperation(
+                    api_call="/test/3", method=RequestsMethods.POST, json_complete={}
+                ),
+                lambda: api.call_the_api("/test/1")["status"] + 10,
+                BatchOperation(api_call="/test/1", method=RequestsMethods.POST),
+                MagicMock(side_effect=ValueError),
+                "test",
+            ]
+        )
+
+    assert [result.result for result in results[:4]] == [
+        {"status": 1},
+        {"status": 404, "data": ""},
+        {"status": 3},
+        11,
+    ]
+    assert [result.successful for result in results] == [
+        True,
+        True,
+        True,
+        True,
+        False,
+        False,
+        False,
+    ]
+    assert isinstance(results[5].error, ValueError)
+
+
+def test_batch_max_workers(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    with APIModel(host="https://test.com", token="test") as model:
+        results: list = Api(model).batch(
+            [BatchOperation(api_call="/test") for _ in range(5)], max_workers=2
+        )
+
+    assert [result.result["status"] for result in results] == ["success"] * 5
+
+
+def test_batch_nested(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    with APIModel(host="https://test.com", token="test", max_workers=1) as model:
+        api: Api = Api(model)
+        results: list = api.batch(
+            [lambda: api.batch([BatchOperation(api_call="/test")])[0].result]
+        )
+
+    assert results[0].result["status"] == "success"
+
+
+def test_batch_iter(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url="https://test.com/test/1", text='{"status": 1}')
+    consumed: list = list()
+
+    def _get_the_operations() -> Iterator:
+        for i in range(6):
+            consumed.append(i)
+            yield lambda i=i: i * 2
+
+    with APIModel(host="https://test.com", token="test") as model:
+        api: Api = Api(model)
+        results = api.batch_iter(_get_the_operations(), max_workers=2)
+
+        assert next(results).result == 0
+        assert len(consumed) == 2
+        assert [result.result for result in results] == [2, 4, 6, 8, 10]
+
+        results: list = list(
+            api.batch_iter(
+                [BatchOperation(api_call="/test/1"), MagicMock(side_effect=ValueError)]
+            )
+        )
+
+    assert results[0].result == {"status": 1}
+    assert isinstance(results[1].error, ValueError)
+
+
+def test_batch_iter_max_workers():
+    lock: threading.Lock = threading.Lock()
+    in_flight: list = [0, 0]
+
+    def _execute_the_operation() -> int:
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+
+        time.sleep(0.1)
+
+        with lock:
+            in_flight[0] -= 1
+
+        return 1
+
+    with APIModel(host="https://test.com", token="test", max_workers=4) as model:
+        results: list = list(
+            Api(model).batch_iter(
+                (_execute_the_operation for _ in range(40)), max_workers=20
+            )
+        )
+
+    assert [result.result for result in results] == [1] * 40
+    assert in_flight[1] == 20
+
+
+def test_batch_iter_nested():
+    with APIModel(host="https://test.com", token="test", max_workers=1) as model:
+        api: Api = Api(model)
+        results: list = api.batch(
+            [
+                lambda: [
+                    result.result for result in api.batch_iter([lambda: 1, lambda: 2])
+                ]
+            ]
+        )
+
+    assert results[0].result == [1, 2]
+
+
+def test_get_the_lookup_cache():
+    model: APIModel = APIModel(host="https://test.com", token="test")
+
+    assert Api(model).get_the_lookup_cache("folders") is None
+
+    model.lookup_cache_ttl = 60
+    lookup_cache = Api(model).get_the_lookup_cache("folders")
+
+    assert Api(model).get_the_lookup_cache("folders") is lookup_cache
+    assert Api(model).get_the_lookup_cache("dashboards") is not lookup_cache
+
+    model.lookup_cache_ttl = 30
+
+    assert Api(model).get_the_lookup_cache("folders").ttl == 30
+
+
+def test_paginate():
+    fetched: list = list()
+
+    def _fetch_the_page(page: int) -> list:
+        fetched.append(page)
+        return [page] * (2 if page < 3 else 1)
+
+    with APIModel(host="https://test.com", token="test") as model:
+        pages: list = list(Api(model).paginate(_fetch_the_page, 2, prefetch=3))
+
+    assert pages == [[1, 1], [2, 2], [3]]
+    assert set(range(1, 4)) <= set(fetched) <= set(range(1, 7))
+
+
+def test_paginate_nested():
+    with APIModel(host="https://test.com", token="test", max_workers=1) as model:
+        api: Api = Api(model)
+        results: list = api.batch(
+            [lambda: list(api.paginate(lambda page: [page] * (page < 2), 1))]
+        )
+
+    assert results[0].result == [[1], []]
+
+
+def test_paginate_error():
+    with APIModel(host="https://test.com", token="test") as model:
+        with pytest.raises(ValueError):
+            list(Api(model).paginate(lambda page: [], 0))
+        with pytest.raises(ZeroDivisionError):
+            list(Api(model).paginate(lambda page: [1 / 0], 1))
+
+
+def test_async_batch(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url="https://test.com/test/1", text='{"status": 1}')
+    httpx_mock.add_response(url="https://test.com/test/2", text='{"status": 2}')
+
+    async def _get_the_status() -> int:
+        return 3
+
+    async def _batch() -> list:
+        async with APIModel(host="https://test.com", token="test") as model:
+            api: AsyncApi = AsyncApi(model)
+            return await api.batch(
+                [
+                    BatchOperation(api_call="/test/1"),
+                    lambda: Api(model).call_the_api("/test/2"),
+                    _get_the_status,
+                    BatchOperation(api_call="/test/1", method=RequestsMethods.PUT),
+                    "test",
+                ],
+                max_workers=2,
+            )
+
+    results: list = asyncio.run(_batch())
+
+    assert [result.result for result in results[:3]] == [
+        {"status": 1},
+        {"status": 2},
+        3,
+    ]
+    assert [result.successful for result in results] == [
+        True,
+        True,
+        True,
+        False,
+        False,
+    ]
+
+
+@patch("time.sleep")
+def test_call_the_api_retry_policy(sleep_mock, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=503, text="")
+    httpx_mock.add_response(status_code=429, text="", headers={"Retry-After": "2"})
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    with APIModel(
+        host="https://test.com", token="test", retry_policy=RetryPolicy(jitter=False)
+    ) as model:
+        assert Api(model).call_the_api(api_call="/test")["status"] == "success"
+
+    assert [mock_call.args[0] for mock_call in sleep_mock.call_args_list] == [0.5, 2.0]
+    assert model.statistics.retries == 2
+    assert model.statistics.requests == 3
+
+
+@patch("time.sleep")
+def test_call_the_api_retry_policy_max_retries(sleep_mock, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=503, text="Service Unavailable")
+
+    with APIModel(
+        host="https://test.com",
+        token="test",
+        retry_policy=RetryPolicy(max_retries=2, max_backoff=0.6),
+    ) as model:
+        result: dict = Api(model).call_the_api(
+            api_call="/test", response_status_code=True
+        )
+
+    assert result == {"status": 503, "data": "Service Unavailable"}
+    assert model.statistics.retries == 2
+    assert all(0 <= mock_call.args[0] <= 0.6 for mock_call in sleep_mock.call_args_list)
+
+
+@patch("time.sleep")
+def test_call_the_api_retry_policy_non_idempotent(sleep_mock, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=503, text="")
+
+    with APIModel(
+        host="https://test.com", token="test", retry_policy=RetryPolicy()
+    ) as model:
+        Api(model).call_the_api(
+            api_call="/test", method=RequestsMethods.POST, json_complete={}
+        )
+
+    sleep_mock.assert_not_called()
+    assert model.statistics.retries == 0
+
+
+@patch("time.sleep")
+def test_call_the_api_retry_policy_transport_error(sleep_mock, httpx_mock: HTTPXMock):
+    httpx_mock.add_exception(ReadTimeout("Test"))
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    with APIModel(
+        host="https://test.com", token="test", retry_policy=RetryPolicy()
+    ) as model:
+        assert Api(model).call_the_api(api_call="/test")["status"] == "success"
+
+    assert model.statistics.retries == 1
+
+
+@patch("time.sleep")
+def test_call_the_api_retry_policy_transport_error_non_idempotent(
+    sleep_mock, httpx_mock: HTTPXMock
+):
+    httpx_mock.add_exception(ReadTimeout("Test"))
+
+    with APIModel(
+        host="https://test.com", token="test", retry_policy=RetryPolicy()
+    ) as model:
+        with pytest.raises(ReadTimeout):
+            Api(model).call_the_api(
+                api_call="/test", method=RequestsMethods.PATCH, json_complete={}
+            )
+
+
+@patch("time.sleep")
+def test_call_the_api_retry_policy_connect_error_non_idempotent(
+    sleep_mock, httpx_mock: HTTPXMock
+):
+    httpx_mock.add_exception(ConnectError("Test"))
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    with APIModel(
+        host="https://test.com", token="test", retry_policy=RetryPolicy()
+    ) as model:
+        assert (
+            Api(model).call_the_api(
+                api_call="/test", method=RequestsMethods.POST, json_complete={}
+            )["status"]
+            == "success"
+        )
+
+    assert model.statistics.retries == 1
+
+
+def test_async_call_the_api_retry_policy(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=429, text="", headers={"Retry-After": "0"})
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    async def _call_the_api() -> dict:
+        async with APIModel(
+            host="https://test.com", token="test", retry_policy=RetryPolicy()
+        ) as model:
+            return await AsyncApi(model).call_the_api(
+                api_call="/test", method=RequestsMethods.POST, json_complete={}
+            )
+
+    assert asyncio.run(_call_the_api())["status"] == "success"
+
+
+def test_get_the_retry_after():
+    assert Api._get_the_retry_after(Response(429)) is None
+    assert Api._get_the_retry_after(Response(429, headers={"Retry-After": "3"})) == 3
+    assert Api._get_the_retry_after(Response(429, headers={"Retry-After": "x"})) is None
+    assert (
+        Api._get_the_retry_after(
+            Response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        )
+        == 0
+    )
+
+
+@patch("time.sleep")
+def test_call_the_api_rate_limit(sleep_mock, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    with APIModel(
+        host="https://test.com",
+        token="test",
+        rate_limit=RateLimit(requests_per_second=1),
+    ) as model:
+        Api(model).call_the_api(api_call="/test")
+        Api(model).call_the_api(api_call="/test")
+
+        assert Api(model).get_the_rate_limiter() is model._rate_limiter
+
+    sleep_mock.assert_called_once()
+    assert model.statistics.throttled == 1
+    assert model.statistics.requests == 2
+
+
+def test_call_the_api_no_rate_limit():
+    assert Api(APIModel(host="https://test.com")).get_the_rate_limiter() is None
+
+
+def test_async_call_the_api_rate_limit(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text='{"status": "success"}')
+
+    async def _call_the_api() -> APIModel:
+        async with APIModel(
+            host="https://test.com",
+            token="test",
+            rate_limit=RateLimit(requests_per_second=100, burst=1),
+        ) as model:
+            await asyncio.gather(
+                *[AsyncApi(model).call_the_api(api_call="/test") for _ in range(3)]
+            )
+
+        return model
+
+    assert asyncio.run(_call_the_api()).statistics.throttled == 2
+
+
+def test_call_the_api_cache_policy(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url="https://test.com/api/folders", json=[{"uid": "test"}])
+    httpx_mock.add_response(url="https://test.com/api/folders", method="POST", json={})
+
+    with APIModel(
+        host="https://test.com", token="test", cache_policy=CachePolicy()
+    ) as model:
+        api: Api = Api(model)
+
+        assert api.call_the_api(api_call="/api/folders") == [{"uid": "test"}]
+
+        result: list = api.call_the_api(api_call="/api/folders")
+        result.append("test")
+
+        assert api.call_the_api(api_call="/api/folders") == [{"uid": "test"}]
+        assert api.call_the_api(api_call="/api/folders", org_id_header=2) == [
+            {"uid": "test"}
+        ]
+
+        api.call_the_api(
+            api_call="/api/folders", method=RequestsMethods.POST, json_complete={}
+        )
+        api.call_the_api(api_call="/api/folders")
+
+    assert model.statistics.cache_hits == 2
+    assert model.statistics.cache_misses == 3
+    assert model.statistics.requests == 4
+
+
+def test_call_the_api_no_cache_policy():
+    assert Api(APIModel(host="https://test.com")).get_the_response_cache() is None
+
+
+def test_async_call_the_api_cache_policy(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(json={"status": "success"})
+
+    async def _call_the_api() -> APIModel:
+        async with APIModel(
+            host="https://test.com", token="test", cache_policy=CachePolicy()
+        ) as model:
+            for _ in range(3):
+                await AsyncApi(model).call_the_api(api_call="/api/org")
+
+        return model
+
+    model: APIModel = asyncio.run(_call_the_api())
+
+    assert model.statistics.cache_hits == 2
+    assert model.statistics.requests == 1
+
+
+def test_call_the_api_conditional_requests(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(
+        url="https://test.com/api/dashboards/uid/test",
+        match_headers={"Authorization": "Bearer test"},
+        json={"dashboard": {"uid": "test"}},
+        headers={"ETag": '"1"'},
+    )
+
+    with APIModel(
+        host="https://test.com", token="test", conditional_requests=True
+    ) as model:
+        api: Api = Api(model)
+        response: dict = api.call_the_api(api_call="/api/dashboards/uid/test")
+
+        httpx_mock.reset(assert_all_responses_were_requested=True)
+        httpx_mock.add_response(
+            url="https://test.com/api/dashboards/uid/test",
+            match_headers={"If-None-Match": '"1"'},
+            status_code=304,
+        )
+
+        assert api.call_the_api(api_call="/api/dashboards/uid/test") == response
+
+    assert model.statistics.not_modified == 1
+    assert model.statistics.bytes_saved == len('{"dashboard": {"uid": "test"}}')
+
+
+def test_call_the_api_conditional_requests_no_validators(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(json={"status": "success"})
+
+    with APIModel(
+        host="https://test.com", token="test", conditional_requests=True
+    ) as model:
+        for _ in range(2):
+            Api(model).call_the_api(api_call="/api/folders")
+
+    assert all(
+        "If-None-Match" not in request.headers for request in httpx_mock.get_requests()
+    )
+    assert model.statistics.not_modified == 0
+
+
+def test_async_call_the_api_conditional_requests(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(json={"status": "success"}, headers={"ETag": '"1"'})
+
+    async def _call_the_api() -> tuple:
+        async with APIModel(
+            host="https://test.com", token="test", conditional_requests=True
+        ) as model:
+            response: dict = await AsyncApi(model).call_the_api(api_call="/api/org")
+            httpx_mock.reset(assert_all_responses_were_requested=True)
+            httpx_mock.add_response(status_code=304)
+
+            return (
+                response,
+                await AsyncApi(model).call_the_api(api_call="/api/org"),
+                model,
+            )
+
+    response, cached_response, model = asyncio.run(_call_the_api())
+
+    assert response == cached_response
+    assert model.statistics.not_modified == 1
+
+
+def test_call_the_api_coalesce_requests():
+    model: APIModel = APIModel(
+        host="https://test.com", token="test", coalesce_requests=True
+    )
+    requests: list = list()
+
+    def _send_the_request(*args) -> Response:
+        requests.append(args)
+        time.sleep(0.2)
+        return Response(200, json={"status": "success"})
+
+    with patch.object(Api, "_send_the_request", side_effect=_send_the_request):
+        results: list = Api(model).batch(
+            [lambda: Api(model).call_the_api(api_call="/api/folders")] * 4
+        )
+
+    model.close()
+
+    assert [result.result for result in results] == [{"status": "success"}] * 4
+    assert results[0].result is not results[1].result
+    assert len(requests) == 1
+    assert model.statistics.coalesced == 3
+    assert model._in_flight_requests == dict()
+
+
+def test_call_the_api_coalesce_requests_error():
+    model: APIModel = APIModel(
+        host="https://test.com", token="test", coalesce_requests=True
+    )
+
+    def _send_the_request(*args) -> Response:
+        time.sleep(0.2)
+        raise ReadTimeout("Test")
+
+    with patch.object(Api, "_send_the_request", side_effect=_send_the_request):
+        results: list = Api(model).batch(
+            [lambda: Api(model).call_the_api(api_call="/api/folders")] * 2
+        )
+
+    model.close()
+
+    assert all(isinstance(result.error, ReadTimeout) for result in results)
+
+
+def test_async_call_the_api_coalesce_requests():
+    requests: list = list()
+
+    async def _send_the_async_request(*args) -> Response:
+        requests.append(args)
+        await asyncio.sleep(0.05)
+        return Response(200, json={"status": "success"})
+
+    async def _call_the_api() -> tuple:
+        async with APIModel(
+            host="https://test.com", token="test", coalesce_requests=True
+        ) as model:
+            return model, await asyncio.gather(
+                *[AsyncApi(model).call_the_api(api_call="/api/org") for _ in range(3)],
+                AsyncApi(model).call_the_api(
+                    api_call="/api/org",
+                    method=RequestsMethods.POST,
+                    json_complete={},
+                ),
+            )
+
+    with patch.object(
+        AsyncApi, "_send_the_async_request", side_effect=_send_the_async_request
+    ):
+        model, results = asyncio.run(_call_the_api())
+
+    assert results == [{"status": "success"}] * 4
+    assert len(requests) == 2
+    assert model.statistics.coalesced == 2
+
+
+def test_async_call_the_api_coalesce_requests_leader_cancelled():
+    requests: list = list()
+
+    async def _send_the_async_request(*args) -> Response:
+        requests.append(args)
+        await asyncio.sleep(0.05)
+        return Response(200, json={"status": "success"})
+
+    async def _call_the_api() -> tuple:
+        async with APIModel(
+            host="https://test.com", token="test", coalesce_requests=True
+        ) as model:
+            leader: asyncio.Task = asyncio.create_task(
+                AsyncApi(model).call_the_api(api_call="/api/org")
+            )
+            await asyncio.sleep(0.01)
+            waiters: asyncio.Future = asyncio.gather(
+                *[AsyncApi(model).call_the_api(api_call="/api/org") for _ in range(2)]
+            )
+            await asyncio.sleep(0.01)
+            leader.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+
+            return model, await waiters
+
+    with patch.object(
+        AsyncApi, "_send_the_async_request", side_effect=_send_the_async_request
+    ):
+        model, results = asyncio.run(_call_the_api())
+
+    assert results == [{"status": "success"}] * 2
+    assert len(requests) == 2
+    assert model.statistics.coalesced == 2
+
+
+def test_get_the_default_headers():
+    model: APIModel = APIModel(host="https://test.com", token="test")
+    api: Api = Api(model)
+    headers: dict = api.get_the_default_headers()
+
+    assert headers == {
+        "Authorization": "Bearer test",
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+    }
+    assert Api(model).get_the_default_headers() is headers
+
+    model.username = "test"
+    model.password = "test"
+
+    assert api.get_the_default_headers()["Authorization"] == "Basic dGVzdDp0ZXN0"
+
+
+def test_create_the_headers():
+    api: Api = Api(APIModel(host="https://test.com", token="test"))
+
+    assert api._create_the_headers() is None
+    assert api._create_the_headers(org_id_header=1, disable_provenance_header=True) == {
+        "X-Grafana-Org-Id": "1",
+        "X-Disable-Provenance": "True",
+    }
+
+
+def test_call_the_api_default_headers(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(json={"status": "success"})
+
+    with APIModel(host="https://test.com", token="test") as model:
+        api: Api = Api(model)
+        api.call_the_api(api_call="/api/org", org_id_header=2)
+
+        model.token = "changed"
+        api.call_the_api(api_call="/api/org")
+
+    first_request, second_request = httpx_mock.get_requests()
+
+    assert first_request.headers["Authorization"] == "Bearer test"
+    assert first_request.headers["X-Grafana-Org-Id"] == "2"
+    assert first_request.headers["Accept"] == "application/json"
+    assert second_request.headers["Authorization"] == "Bearer changed"
+    assert "X-Grafana-Org-Id" not in second_request.headers
+
+
+def test_stream_the_api(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(content=b"test" * 1000)
+
+    with APIModel(host="https://test.com", token="test") as model:
+        chunks: list = list(Api(model).stream_the_api("/metrics", chunk_size=1000))
+
+    assert b"".join(chunks) == b"test" * 1000
+    assert len(chunks) == 4
+    assert httpx_mock.get_request().headers["Authorization"] == "Bearer test"
+
+
+def test_stream_the_api_json_array(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(json=[{"uid": f"test-{i}"} for i in range(100)])
+
+    with APIModel(host="https://test.com", token="test") as model:
+        hits: list = list(
+            Api(model).stream_the_api(
+                "/api/search?limit=5000", json_array=True, org_id_header=2, chunk_size=7
+            )
+        )
+
+    assert hits == [{"uid": f"test-{i}"} for i in range(100)]
+    assert httpx_mock.get_request().headers["X-Grafana-Org-Id"] == "2"
+    assert model.statistics.requests == 1
+
+
+def test_stream_the_api_error(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=404, json={"message": "Not found"})
+
+    with APIModel(host="https://test.com", token="test") as model:
+        with pytest.raises(Exception):
+            list(Api(model).stream_the_api("/api/search", json_array=True))
+
+
+def test_stream_the_api_invalid_api_key(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=401, json={"message": "invalid API key"})
+
+    with APIModel(host="https://test.com", token="test") as model:
+        with pytest.raises(ConnectError):
+            list(Api(model).stream_the_api("/api/search"))
+
+
+def test_async_stream_the_api(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(json=[{"uid": "test"}, {"uid": "test-2"}])
+    httpx_mock.add_response(content=b"test")
+
+    async def _stream_the_api() -> tuple:
+        async with APIModel(host="https://test.com", token="test") as model:
+            api: AsyncApi = AsyncApi(model)
+
+            return (
+                [
+                    hit
+                    async for hit in api.stream_the_api(
+                        "/api/search", json_array=True, chunk_size=5
+                    )
+                ],
+                [chunk async for chunk in api.stream_the_api("/metrics")],
+            )
+
+    assert asyncio.run(_stream_the_api()) == (
+        [{"uid": "test"}, {"uid": "test-2"}],
+        [b"test"],
+    )
+
+
+def test_async_stream_the_api_error(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(status_code=500, text="Internal Server Error")
+
+    async def _stream_the_api():
+        async with APIModel(host="https://test.com", token="test") as model:
+            async for _ in AsyncApi(model).stream_the_api("/api/search"):
+                pass
+
+    with pytest.raises(Exception):
+        asyncio.run(_stream_the_api())
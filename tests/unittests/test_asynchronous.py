@@ -0,0 +1,249 @@
+import asyncio
+import inspect
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from pytest_httpx import HTTPXMock
+
+from grafana_api.model import APIModel, RequestsMethods, TeamObject
+from grafana_api.dashboard import Dashboard
+from grafana_api.asynchronous import (
+    AsyncDashboard,
+    AsyncDatasource,
+    AsyncFolder,
+    AsyncLegacyAlerting,
+    AsyncOtherHTTP,
+    AsyncSearch,
+    AsyncTeam,
+    AsyncUser,
+)
+
+
+class AsyncDomainTestCase(TestCase):
+    def test_async_domain_methods(self):
+        self.assertTrue(
+            asyncio.iscoroutinefunction(AsyncDashboard.get_dashboard_by_uid)
+        )
+        self.assertEqual(
+            Dashboard.get_dashboard_by_uid.__doc__,
+            AsyncDashboard.get_dashboard_by_uid.__doc__,
+        )
+        self.assertFalse(hasattr(AsyncDashboard, "_check_the_api_call_response"))
+        self.assertTrue(hasattr(AsyncLegacyAlerting, "get_alerts"))
+        self.assertTrue(inspect.isasyncgenfunction(AsyncOtherHTTP.stream_metrics))
+
+    @patch("grafana_api.folder.Folder.get_all_folder_ids_and_names")
+    def test_async_domain_call(self, get_all_folder_ids_and_names_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: AsyncFolder = AsyncFolder(grafana_api_model=model)
+
+        get_all_folder_ids_and_names_mock.return_value = list(
+            [{"title": None, "id": 12}]
+        )
+
+        self.assertEqual(
+            list([{"title": None, "id": 12}]),
+            asyncio.run(folder.get_all_folder_ids_and_names()),
+        )
+        model.close()
+
+    @patch("grafana_api.folder.Folder.get_folder_id_by_dashboard_path")
+    def test_async_domain_call_error(self, get_folder_id_by_dashboard_path_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: AsyncFolder = AsyncFolder(grafana_api_model=model)
+
+        get_folder_id_by_dashboard_path_mock.side_effect = ValueError
+
+        with self.assertRaises(ValueError):
+            asyncio.run(folder.get_folder_id_by_dashboard_path(""))
+        model.close()
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_async_domain_native_call(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        in_flight: list = [0, 0]
+
+        async def _call_the_api(api_call: str) -> any:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+
+            return dict({"dashboard": {"uid": api_call.rsplit("/", 1)[1]}})
+
+        call_the_api_mock.side_effect = _call_the_api
+
+        async def _get_dashboards() -> list:
+            dashboard: AsyncDashboard = AsyncDashboard(grafana_api_model=model)
+            return await asyncio.gather(
+                *[dashboard.get_dashboard_by_uid(str(i)) for i in range(100)]
+            )
+
+        dashboards: list = asyncio.run(_get_dashboards())
+
+        self.assertEqual("99", dashboards[99]["dashboard"]["uid"])
+        self.assertEqual(100, in_flight[1])
+        model.close()
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_async_domain_native_call_error(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: AsyncFolder = AsyncFolder(grafana_api_model=model)
+        datasource: AsyncDatasource = AsyncDatasource(grafana_api_model=model)
+        search: AsyncSearch = AsyncSearch(grafana_api_model=model)
+
+        call_the_api_mock.return_value = list()
+
+        with self.assertRaises(ValueError):
+            asyncio.run(folder.get_folder_by_uid(""))
+
+        with self.assertRaises(Exception):
+            asyncio.run(folder.get_folders())
+
+        with self.assertRaises(Exception):
+            asyncio.run(search.search("query=test"))
+
+        call_the_api_mock.return_value = dict({"id": 1})
+
+        self.assertEqual(1, asyncio.run(datasource.get_datasource_id_by_name("test")))
+        model.close()
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_async_domain_native_user_and_team_lookups(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock(), max_workers=2)
+        in_flight: list = [0, 0]
+
+        async def _call_the_api(api_call: str) -> any:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+
+            return dict({"id": int(api_call.rsplit("/", 1)[1])})
+
+        call_the_api_mock.side_effect = _call_the_api
+
+        async def _get_users_and_teams() -> list:
+            user: AsyncUser = AsyncUser(grafana_api_model=model)
+            team: AsyncTeam = AsyncTeam(grafana_api_model=model)
+            return await asyncio.gather(
+                *[user.get_user_by_id(i) for i in range(1, 26)],
+                *[team.get_team_by_id(i) for i in range(1, 26)],
+            )
+
+        results: list = asyncio.run(_get_users_and_teams())
+
+        self.assertEqual(dict({"id": 25}), results[49])
+        self.assertEqual(50, in_flight[1])
+        model.close()
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_async_domain_native_mutations(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: AsyncDatasource = AsyncDatasource(grafana_api_model=model)
+        team: AsyncTeam = AsyncTeam(grafana_api_model=model)
+        user: AsyncUser = AsyncUser(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"message": "Datasource added"})
+        asyncio.run(datasource.create_datasource({"name": "Test"}))
+
+        call_the_api_mock.assert_called_with(
+            "/api/datasources", RequestsMethods.POST, {"name": "Test"}
+        )
+        self.assertEqual(1, model._datasource_index_version)
+
+        call_the_api_mock.return_value = dict({"message": "Data source deleted"})
+        asyncio.run(datasource.delete_datasource_by_name("Test"))
+
+        call_the_api_mock.assert_called_with(
+            "/api/datasources/name/Test", RequestsMethods.DELETE, None
+        )
+        self.assertEqual(2, model._datasource_index_version)
+
+        call_the_api_mock.return_value = dict({"message": "Team created", "teamId": 3})
+        self.assertEqual(3, asyncio.run(team.add_team(TeamObject("test", "test", 1))))
+
+        call_the_api_mock.return_value = dict({"message": "error"})
+
+        with self.assertRaises(Exception):
+            asyncio.run(team.delete_team_by_id(3))
+
+        with self.assertRaises(Exception):
+            asyncio.run(datasource.update_datasource(1, {"name": "Test"}))
+
+        self.assertEqual(3, model._datasource_index_version)
+
+        with self.assertRaises(ValueError):
+            asyncio.run(user.update_user(0, None))
+
+        self.assertEqual(5, call_the_api_mock.call_count)
+        model.close()
+
+    @patch("grafana_api.api.AsyncApi.call_the_api")
+    def test_async_domain_native_dashboard_mutations(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), token=MagicMock(), lookup_cache_ttl=60
+        )
+        dashboard: AsyncDashboard = AsyncDashboard(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = [
+            list([{"title": "Test", "id": 2, "uid": "folder"}]),
+            dict({"status": "success", "uid": "test", "id": 5}),
+            list([{"title": "Dashboard", "uid": "test", "id": 5}]),
+            dict({"message": "Dashboard Dashboard deleted"}),
+        ]
+
+        asyncio.run(
+            dashboard.create_or_update_dashboard("Test", {"title": "Dashboard"}, "Test")
+        )
+        asyncio.run(dashboard.delete_dashboard_by_name_and_path("Dashboard", "Test"))
+
+        self.assertEqual(
+            "/api/dashboards/db", call_the_api_mock.call_args_list[1].args[0]
+        )
+        self.assertEqual(2, call_the_api_mock.call_args_list[1].args[2]["folderId"])
+        self.assertEqual(
+            "/api/search?folderIds=2&query=Dashboard",
+            call_the_api_mock.call_args_list[2].args[0],
+        )
+        self.assertEqual(
+            ("/api/dashboards/uid/test", RequestsMethods.DELETE, None),
+            call_the_api_mock.call_args_list[3].args,
+        )
+        self.assertEqual(
+            dict({"id": 2, "uid": "folder"}),
+            model._lookup_caches["folders"].peek("Test"),
+        )
+        model.close()
+
+
+def test_async_domain_shared_async_http_client(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(json={"dashboard": {"uid": "test"}})
+
+    async def _get_dashboards() -> list:
+        async with APIModel(
+            host="https://test.com", token="test", http2_support=True
+        ) as model:
+            dashboard: AsyncDashboard = AsyncDashboard(grafana_api_model=model)
+            result: list = await asyncio.gather(
+                *[dashboard.get_dashboard_by_uid("test") for _ in range(10)]
+            )
+
+            assert len(model._async_http_clients) == 1
+            assert model._http_client is None
+            return result
+
+    dashboards: list = asyncio.run(_get_dashboards())
+
+    assert len(dashboards) == 10
+    assert dashboards[0]["dashboard"]["uid"] == "test"
+
+
+def test_async_domain_generator(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text="# HELP test\ntest 1\ntest 2\n")
+
+    async def _stream_metrics() -> list:
+        async with APIModel(host="https://test.com", token="test") as model:
+            return [line async for line in AsyncOtherHTTP(model).stream_metrics()]
+
+    assert asyncio.run(_stream_metrics()) == ["# HELP test", "test 1", "test 2"]
@@ -0,0 +1,285 @@
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from httpx import Response
+
+from grafana_api.model import APIEndpoints, CachePolicy
+from grafana_api.cache import ResponseCache, ValidatorCache, LookupCache
+
+
+class ResponseCacheTestCase(TestCase):
+    def test_get_the_key(self):
+        self.assertEqual(
+            ("2", "GET", "/api/folders"),
+            ResponseCache.get_the_key("GET", "/api/folders", {"X-Grafana-Org-Id": "2"}),
+        )
+        self.assertEqual(
+            (None, "GET", "/api/folders"),
+            ResponseCache.get_the_key("GET", "/api/folders"),
+        )
+
+    def test_get_the_ttl(self):
+        response_cache: ResponseCache = ResponseCache(
+            CachePolicy(
+                ttl=30,
+                endpoint_ttls={
+                    APIEndpoints.SEARCH: 5,
+                    "/api/search/sorting": 0,
+                },
+            )
+        )
+
+        self.assertEqual(5, response_cache.get_the_ttl("/api/search?query=test"))
+        self.assertEqual(0, response_cache.get_the_ttl("/api/search/sorting"))
+        self.assertEqual(30, response_cache.get_the_ttl("/api/folders"))
+
+    @patch("time.monotonic")
+    def test_get_expired(self, monotonic_mock):
+        monotonic_mock.return_value = 100.0
+        response_cache: ResponseCache = ResponseCache(CachePolicy(ttl=10))
+        key: tuple = response_cache.get_the_key("GET", "/api/folders")
+        response: Response = Response(200, json=[])
+
+        response_cache.update(key, response)
+
+        self.assertEqual(response, response_cache.get(key))
+
+        monotonic_mock.return_value = 110.0
+
+        self.assertIsNone(response_cache.get(key))
+        self.assertEqual(0, len(response_cache))
+
+    def test_set_lru_eviction(self):
+        response_cache: ResponseCache = ResponseCache(CachePolicy(max_size=2))
+
+        for api_call in ("/api/folders", "/api/datasources"):
+            response_cache.set(
+                response_cache.get_the_key("GET", api_call), Response(200), 10
+            )
+
+        response_cache.get(response_cache.get_the_key("GET", "/api/folders"))
+        response_cache.set(
+            response_cache.get_the_key("GET", "/api/teams"), Response(200), 10
+        )
+
+        self.assertIsNone(
+            response_cache.get(response_cache.get_the_key("GET", "/api/datasources"))
+        )
+        self.assertIsNotNone(
+            response_cache.get(response_cache.get_the_key("GET", "/api/folders"))
+        )
+        self.assertEqual(2, len(response_cache))
+
+    def test_update_error_response(self):
+        response_cache: ResponseCache = ResponseCache(CachePolicy())
+
+        response_cache.update(
+            response_cache.get_the_key("GET", "/api/folders"), Response(404)
+        )
+
+        self.assertEqual(0, len(response_cache))
+
+    def test_update_invalidate(self):
+        response_cache: ResponseCache = ResponseCache(CachePolicy())
+
+        for api_call in (
+            "/api/folders",
+            "/api/folders/test",
+            "/api/search?folderIds=0",
+            "/api/datasources",
+        ):
+            response_cache.update(
+                response_cache.get_the_key("GET", api_call), Response(200)
+            )
+
+        response_cache.update(
+            response_cache.get_the_key("PUT", "/api/folders/test"), Response(200)
+        )
+
+        self.assertEqual(1, len(response_cache))
+        self.assertIsNotNone(
+            response_cache.get(response_cache.get_the_key("GET", "/api/datasources"))
+        )
+
+    def test_update_invalidate_organisation_switch(self):
+        for api_call in ("/api/user/using/2", "/api/user/using"):
+            response_cache: ResponseCache = ResponseCache(CachePolicy())
+
+            for key in (
+                response_cache.get_the_key("GET", "/api/folders"),
+                response_cache.get_the_key("GET", "/api/datasources"),
+                response_cache.get_the_key(
+                    "GET", "/api/teams", {"X-Grafana-Org-Id": "1"}
+                ),
+            ):
+                response_cache.update(key, Response(200))
+
+            response_cache.update(
+                response_cache.get_the_key("POST", api_call), Response(200)
+            )
+
+            self.assertEqual(0, len(response_cache))
+
+    def test_update_invalidate_user(self):
+        response_cache: ResponseCache = ResponseCache(CachePolicy())
+
+        for api_call in ("/api/user", "/api/datasources"):
+            response_cache.update(
+                response_cache.get_the_key("GET", api_call), Response(200)
+            )
+
+        response_cache.update(
+            response_cache.get_the_key("PUT", "/api/user"), Response(200)
+        )
+
+        self.assertEqual(1, len(response_cache))
+        self.assertIsNotNone(
+            response_cache.get(response_cache.get_the_key("GET", "/api/datasources"))
+        )
+
+    def test_clear(self):
+        response_cache: ResponseCache = ResponseCache(CachePolicy())
+        response_cache.update(
+            response_cache.get_the_key("GET", "/api/folders"), Response(200)
+        )
+
+        response_cache.clear()
+
+        self.assertEqual(0, len(response_cache))
+
+
+class ValidatorCacheTestCase(TestCase):
+    def test_get_the_conditional_headers(self):
+        validator_cache: ValidatorCache = ValidatorCache()
+        key: tuple = ResponseCache.get_the_key("GET", "/api/dashboards/uid/test")
+
+        self.assertEqual(dict(), validator_cache.get_the_conditional_headers(key))
+
+        validator_cache.update(
+            key,
+            Response(
+                200,
+                json={},
+                headers={
+                    "ETag": '"test"',
+                    "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT",
+                },
+            ),
+        )
+
+        self.assertEqual(
+            {
+                "If-None-Match": '"test"',
+                "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+            },
+            validator_cache.get_the_conditional_headers(key),
+        )
+
+    def test_update_not_modified(self):
+        validator_cache: ValidatorCache = ValidatorCache()
+        key: tuple = ResponseCache.get_the_key("GET", "/api/dashboards/uid/test")
+        response: Response = Response(200, json={}, headers={"ETag": '"test"'})
+
+        self.assertEqual(response, validator_cache.update(key, response))
+        self.assertEqual(response, validator_cache.update(key, Response(304)))
+
+    def test_update_no_validators(self):
+        validator_cache: ValidatorCache = ValidatorCache()
+        key: tuple = ResponseCache.get_the_key("GET", "/api/folders")
+
+        validator_cache.update(key, Response(200, json={}))
+
+        self.assertEqual(0, len(validator_cache))
+        self.assertEqual(304, validator_cache.update(key, Response(304)).status_code)
+
+    def test_update_lru_eviction(self):
+        validator_cache: ValidatorCache = ValidatorCache(max_size=1)
+
+        for api_call in ("/api/folders", "/api/datasources"):
+            validator_cache.update(
+                ResponseCache.get_the_key("GET", api_call),
+                Response(200, headers={"ETag": '"test"'}),
+            )
+
+        self.assertEqual(1, len(validator_cache))
+        self.assertIsNone(
+            validator_cache.get(ResponseCache.get_the_key("GET", "/api/folders"))
+        )
+
+
+class LookupCacheTestCase(TestCase):
+    def test_get(self):
+        lookup_cache: LookupCache = LookupCache(60)
+        tables: list = [dict({"a": 1}), dict({"a": 2})]
+
+        self.assertEqual(dict({"a": 1}), lookup_cache.get(lambda: tables.pop(0)))
+        self.assertEqual(dict({"a": 1}), lookup_cache.get(lambda: tables.pop(0)))
+
+        lookup_cache.invalidate()
+
+        self.assertEqual(dict({"a": 2}), lookup_cache.get(lambda: tables.pop(0)))
+
+    @patch("grafana_api.cache.time.monotonic")
+    def test_get_expired(self, monotonic_mock):
+        lookup_cache: LookupCache = LookupCache(60)
+        tables: list = [dict({"a": 1}), dict({"a": 2})]
+
+        monotonic_mock.return_value = 0
+        lookup_cache.get(lambda: tables.pop(0))
+        monotonic_mock.return_value = 61
+
+        self.assertEqual(dict({"a": 2}), lookup_cache.get(lambda: tables.pop(0)))
+
+    def test_lookup(self):
+        lookup_cache: LookupCache = LookupCache(60)
+        tables: list = [dict({"a": 1}), dict({"a": 1, "b": 2}), dict()]
+
+        self.assertEqual(1, lookup_cache.lookup(lambda: tables.pop(0), "a"))
+        self.assertEqual(2, lookup_cache.lookup(lambda: tables.pop(0), "b"))
+        self.assertIsNone(lookup_cache.lookup(lambda: tables.pop(0), "c"))
+        self.assertEqual(0, len(tables))
+
+    def test_lookup_missing_on_load(self):
+        lookup_cache: LookupCache = LookupCache(60)
+        tables: list = [dict(), dict({"a": 1})]
+
+        self.assertIsNone(lookup_cache.lookup(lambda: tables.pop(0), "a"))
+        self.assertEqual(1, len(tables))
+
+    def test_set_and_discard(self):
+        lookup_cache: LookupCache = LookupCache(60)
+
+        lookup_cache.set("a", 1)
+        lookup_cache.discard(lambda key, value: True)
+        lookup_cache.get(lambda: dict({"a": 1, "b": 2}))
+        lookup_cache.set("c", 3)
+        lookup_cache.discard(lambda key, value: value == 1)
+
+        self.assertEqual(dict({"b": 2, "c": 3}), lookup_cache.get(lambda: dict()))
+
+    def test_find_and_peek(self):
+        lookup_cache: LookupCache = LookupCache(60)
+        tables: list = [dict({"a": 1}), dict({"a": 1, "b": 2})]
+
+        self.assertIsNone(lookup_cache.peek("a"))
+
+        lookup_cache.get(lambda: tables.pop(0))
+
+        self.assertEqual(
+            2, lookup_cache.find(lambda: tables.pop(0), lambda table: table.get("b"))
+        )
+        self.assertEqual(1, lookup_cache.peek("a"))
+        self.assertIsNone(lookup_cache.peek("c"))
+
+    def test_put_and_peek_expired(self):
+        lookup_cache: LookupCache = LookupCache(0.01)
+
+        lookup_cache.put(dict({"a": 1}))
+
+        self.assertEqual(1, lookup_cache.peek("a"))
+        self.assertEqual(dict({"a": 1}), lookup_cache.get(lambda: dict()))
+
+        time.sleep(0.02)
+
+        self.assertIsNone(lookup_cache.peek("a"))
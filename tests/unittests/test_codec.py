@@ -0,0 +1,140 @@
+import json
+from unittest import TestCase
+from unittest.mock import patch
+
+from grafana_api.codec import (
+    JSONCodec,
+    OrjsonCodec,
+    UjsonCodec,
+    JSONArrayDecoder,
+    get_default_codec,
+)
+
+
+class JSONCodecTestCase(TestCase):
+    def test_dumps(self):
+        self.assertEqual(
+            b'{"test":["test",1]}', JSONCodec().dumps({"test": ["test", 1]})
+        )
+
+    def test_dumps_not_serializable(self):
+        with self.assertRaises(TypeError):
+            JSONCodec().dumps({"test": object()})
+
+    def test_loads(self):
+        self.assertEqual({"test": "test"}, JSONCodec().loads(b'{"test": "test"}'))
+        self.assertEqual({"test": "test"}, JSONCodec().loads('{"test": "test"}'))
+
+    def test_loads_invalid_json(self):
+        with self.assertRaises(ValueError):
+            JSONCodec().loads("test")
+
+
+class OrjsonCodecTestCase(TestCase):
+    def setUp(self):
+        try:
+            self.codec: OrjsonCodec = OrjsonCodec()
+        except ImportError:
+            self.skipTest("The orjson library is not installed.")
+
+    def test_dumps(self):
+        self.assertEqual(
+            b'{"test":["test",1],"1":true}',
+            self.codec.dumps({"test": ["test", 1], 1: True}),
+        )
+
+    def test_loads(self):
+        self.assertEqual({"test": "test"}, self.codec.loads(b'{"test": "test"}'))
+
+    def test_loads_invalid_json(self):
+        with self.assertRaises(ValueError):
+            self.codec.loads("test")
+
+
+class UjsonCodecTestCase(TestCase):
+    def setUp(self):
+        try:
+            self.codec: UjsonCodec = UjsonCodec()
+        except ImportError:
+            self.skipTest("The ujson library is not installed.")
+
+    def test_dumps(self):
+        self.assertEqual(
+            b'{"test":["test",1]}', self.codec.dumps({"test": ["test", 1]})
+        )
+
+    def test_loads(self):
+        self.assertEqual({"test": "test"}, self.codec.loads(b'{"test": "test"}'))
+
+
+class GetDefaultCodecTestCase(TestCase):
+    @patch("grafana_api.codec.UjsonCodec.__init__")
+    @patch("grafana_api.codec.OrjsonCodec.__init__")
+    def test_get_default_codec_fallback(self, orjson_init_mock, ujson_init_mock):
+        orjson_init_mock.side_effect = ImportError
+        ujson_init_mock.side_effect = ImportError
+
+        self.assertEqual(JSONCodec, type(get_default_codec()))
+
+    @patch("grafana_api.codec.OrjsonCodec.__init__")
+    def test_get_default_codec_orjson(self, orjson_init_mock):
+        orjson_init_mock.return_value = None
+
+        self.assertEqual(OrjsonCodec, type(get_default_codec()))
+
+
+class JSONArrayDecoderTestCase(TestCase):
+    document: bytes = json.dumps(
+        [
+            {"title": "Dashboard ü€", "tags": ["test", {"id": None}]},
+            12345,
+            -1.5e3,
+            True,
+            None,
+            "test,]",
+        ],
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+    def _decode(self, document: bytes, chunk_size: int) -> list:
+        json_array_decoder: JSONArrayDecoder = JSONArrayDecoder()
+        elements: list = list()
+
+        for i in range(0, len(document), chunk_size):
+            elements.extend(json_array_decoder.feed(document[i : i + chunk_size]))
+
+        elements.extend(json_array_decoder.feed(b"", final=True))
+
+        return elements
+
+    def test_feed(self):
+        for chunk_size in (1, 2, 3, 7, len(self.document)):
+            self.assertEqual(
+                json.loads(self.document), self._decode(self.document, chunk_size)
+            )
+
+    def test_feed_incremental(self):
+        json_array_decoder: JSONArrayDecoder = JSONArrayDecoder()
+
+        self.assertEqual([{"id": 1}], json_array_decoder.feed(b'[{"id": 1}, {"id"'))
+        self.assertEqual([{"id": 2}], json_array_decoder.feed(b": 2}, 12"))
+        self.assertEqual([123], json_array_decoder.feed(b"3]"))
+        self.assertEqual([], json_array_decoder.feed(b" ", final=True))
+        self.assertEqual(3, json_array_decoder.elements)
+
+    def test_feed_empty_array(self):
+        self.assertEqual([], self._decode(b" [ ] ", 1))
+
+    def test_feed_no_valid_json_array(self):
+        for document in (
+            b'{"test": 1}',
+            b"[1, 2",
+            b"[1 2]",
+            b"[1, ]",
+            b"[, 1]",
+            b"[] 1",
+            b'[{"test": }]',
+        ):
+            for chunk_size in (1, len(document)):
+                with self.assertRaises(ValueError):
+                    self._decode(document, chunk_size)
@@ -1,7 +1,13 @@
+import json
+import os
+import tarfile
+import tempfile
+import zipfile
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
-from grafana_api.model import APIModel
+from grafana_api.model import APIModel, APIEndpoints
+from grafana_api.api import Api
 from grafana_api.dashboard import Dashboard
 
 
@@ -243,6 +249,535 @@ class DashboardTestCase(TestCase):
                 dashboard_name="", dashboard_path="test"
             )
 
+    @patch("grafana_api.api.Api.call_the_api")
+    @patch("grafana_api.folder.Folder.get_folder_id_by_dashboard_path")
+    def test_get_dashboard_uid_and_id_by_name_and_folder_lookup_cache(
+        self, folder_id_by_dashboard_path_mock, call_the_api_mock
+    ):
+        model: APIModel = APIModel(
+            host=MagicMock(), token=MagicMock(), lookup_cache_ttl=60
+        )
+        dashboard: Dashboard = Dashboard(grafana_api_model=model)
+
+        folder_id_by_dashboard_path_mock.return_value = 1
+        call_the_api_mock.return_value = list(
+            [
+                {"title": "f", "uid": "f", "id": 1, "type": "dash-folder"},
+                {
+                    "title": "test",
+                    "uid": "a",
+                    "id": 10,
+                    "folderId": 1,
+                    "type": "dash-db",
+                },
+                {"title": "test", "uid": "b", "id": 11, "type": "dash-db"},
+                {"title": "test", "uid": "d", "type": "dash-db"},
+                {
+                    "title": "other",
+                    "uid": "c",
+                    "id": 12,
+                    "folderId": 1,
+                    "type": "dash-db",
+                },
+            ]
+        )
+
+        self.assertEqual(
+            dict({"uid": "a", "id": 10}),
+            dashboard.get_dashboard_uid_and_id_by_name_and_folder(
+                dashboard_name="test", dashboard_path="test"
+            ),
+        )
+
+        folder_id_by_dashboard_path_mock.return_value = 0
+
+        self.assertEqual(
+            dict({"uid": "b", "id": 11}),
+            dashboard.get_dashboard_uid_and_id_by_name_and_folder(
+                dashboard_name="test", dashboard_path="General"
+            ),
+        )
+        self.assertEqual(
+            ["/api/search?limit=1000&page=1"],
+            [
+                call.args[0]
+                for call in call_the_api_mock.call_args_list
+                if call.args[0].endswith("page=1")
+            ],
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    @patch("grafana_api.folder.Folder.get_folder_id_by_dashboard_path")
+    def test_dashboard_lookup_cache_mutations(
+        self, folder_id_by_dashboard_path_mock, call_the_api_mock
+    ):
+        model: APIModel = APIModel(
+            host=MagicMock(), token=MagicMock(), lookup_cache_ttl=60
+        )
+        dashboard: Dashboard = Dashboard(grafana_api_model=model)
+
+        folder_id_by_dashboard_path_mock.return_value = 1
+        call_the_api_mock.return_value = list(
+            [
+                {"title": "f", "uid": "f", "id": 1, "type": "dash-folder"},
+                {
+                    "title": "test",
+                    "uid": "a",
+                    "id": 10,
+                    "folderId": 1,
+                    "type": "dash-db",
+                },
+                {
+                    "title": "other",
+                    "uid": "c",
+                    "id": 12,
+                    "folderId": 1,
+                    "type": "dash-db",
+                },
+            ]
+        )
+        dashboard.get_dashboard_uid_and_id_by_name_and_folder("test", "test")
+
+        call_the_api_mock.return_value = dict(
+            {"status": "success", "uid": "a", "id": 10}
+        )
+        dashboard.create_or_update_dashboard(
+            "test", dict({"title": "renamed"}), "test", overwrite=True
+        )
+        call_the_api_mock.return_value = dict({"message": "Dashboard other deleted"})
+        dashboard.delete_dashboard_by_name_and_path("other", "test")
+
+        self.assertEqual(
+            dict({"uid": "a", "id": 10}),
+            dashboard.get_dashboard_uid_and_id_by_name_and_folder("renamed", "test"),
+        )
+        search_index = (
+            Api(model).get_the_lookup_cache("dashboards").peek("search_index")
+        )
+        self.assertEqual("f", search_index.get("a").folder_uid)
+        self.assertIsNone(search_index.get("c"))
+        self.assertEqual(
+            1,
+            len(
+                [
+                    call
+                    for call in call_the_api_mock.call_args_list
+                    if call.args[0].endswith("page=1")
+                ]
+            ),
+        )
+
+        call_the_api_mock.return_value = list()
+
+        self.assertIsNone(
+            dashboard.get_dashboard_uid_and_id_by_name_and_folder("test", "test")
+        )
+        self.assertEqual(
+            2,
+            len(
+                [
+                    call
+                    for call in call_the_api_mock.call_args_list
+                    if call.args[0].endswith("page=1")
+                ]
+            ),
+        )
+
+    @staticmethod
+    def _get_the_export_response(api_call: str) -> any:
+        if api_call.startswith("/api/search"):
+            return list(
+                [
+                    {"title": "a", "uid": "a", "id": 1, "folderUid": "f"},
+                    {"title": "b", "uid": "b", "id": 2, "folderTitle": None},
+                ]
+            )
+
+        uid: str = api_call.rsplit("/", 1)[1]
+
+        return dict({"dashboard": {"uid": uid, "version": 3}, "meta": {}})
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_export_all_directory(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        dashboard: Dashboard = Dashboard(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = self._get_the_export_response
+
+        with tempfile.TemporaryDirectory() as directory:
+            manifest: list = dashboard.export_all(directory, concurrency=1)
+
+            with open(os.path.join(directory, "f", "a.json")) as file:
+                self.assertEqual(dict({"uid": "a", "version": 3}), json.load(file))
+            with open(os.path.join(directory, "manifest.json")) as file:
+                self.assertEqual(manifest, json.load(file))
+
+        self.assertEqual(
+            dict(
+                {
+                    "uid": "b",
+                    "title": "b",
+                    "version": 3,
+                    "folder_uid": None,
+                    "folder_title": None,
+                    "path": "general/b.json",
+                }
+            ),
+            manifest[1],
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_export_all_archives(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        dashboard: Dashboard = Dashboard(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = self._get_the_export_response
+
+        with tempfile.TemporaryDirectory() as directory:
+            dashboard.export_all(os.path.join(directory, "export.tar.gz"))
+            dashboard.export_all(os.path.join(directory, "export.zip"))
+
+            with tarfile.open(os.path.join(directory, "export.tar.gz")) as archive:
+                self.assertEqual(
+                    ["f/a.json", "general/b.json", "manifest.json"],
+                    archive.getnames(),
+                )
+            with zipfile.ZipFile(os.path.join(directory, "export.zip")) as archive:
+                self.assertEqual(
+                    dict({"uid": "b", "version": 3}),
+                    json.loads(archive.read("general/b.json")),
+                )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_export_all_failed_dashboard(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        dashboard: Dashboard = Dashboard(grafana_api_model=model)
+
+        def _get_the_response(api_call: str) -> any:
+            if api_call.endswith("/a"):
+                return dict({"message": "Dashboard not found"})
+
+            return self._get_the_export_response(api_call)
+
+        call_the_api_mock.side_effect = _get_the_response
+
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(Exception):
+                dashboard.export_all(os.path.join(directory, "export.tar"))
+
+            with tarfile.open(os.path.join(directory, "export.tar")) as archive:
+                self.assertEqual(
+                    ["general/b.json", "manifest.json"], archive.getnames()
+                )
+
+    def test_export_all_no_target(self):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        dashboard: Dashboard = Dashboard(grafana_api_model=model)
+
+        with self.assertRaises(ValueError):
+            dashboard.export_all("")
+
+    @staticmethod
+    def _get_the_import_response(
+        api_call: str, method: any = None, json_complete: dict = None, **kwargs
+    ) -> dict:
+        if json_complete is not None:
+            return dict({"status": "success", "uid": json_complete["dashboard"]["uid"]})
+        if api_call.endswith("/a"):
+            return dict({"status": 404, "data": ""})
+        if api_call.endswith("/b"):
+            return dict(
+                {
+                    "dashboard": {"uid": "b", "title": "b", "id": 2, "version": 7},
+                    "meta": {"folderUid": "f"},
+                    "status": 200,
+                }
+            )
+
+        return dict(
+            {"dashboard": {"uid": "c", "title": "old"}, "meta": {}, "status": 200}
+        )
+
+    def _write_the_import_source(self, directory: str):
+        os.makedirs(os.path.join(directory, "f"))
+        os.makedirs(os.path.join(directory, "general"))
+
+        for path, dashboard_json in [
+            ("a.json", {"uid": "a", "title": "a"}),
+            ("f/b.json", {"uid": "b", "title": "b", "id": 5, "version": 1}),
+            ("general/c.json", {"uid": "c", "title": "c"}),
+            ("manifest.json", []),
+        ]:
+            with open(os.path.join(directory, path), "w") as file:
+                json.dump(dashboard_json, file)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_import_dashboards(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        dashboard: Dashboard = Dashboard(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = self._get_the_import_response
+
+        with tempfile.TemporaryDirectory() as directory:
+            self._write_the_import_source(directory)
+
+            self.assertEqual(
+                dict({"created": 1, "updated": 1, "unchanged": 1}),
+                dashboard.import_dashboards(directory, concurrency=2),
+            )
+
+        uploads: list = [
+            call.args[2]
+            for call in call_the_api_mock.call_args_list
+            if len(call.args) > 2
+        ]
+
+        self.assertEqual(
+            ["a", "c"], sorted(upload["dashboard"]["uid"] for upload in uploads)
+        )
+        self.assertTrue(all("folderUid" not in upload for upload in uploads))
+        self.assertTrue(all(upload["overwrite"] for upload in uploads))
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_import_dashboards_archive_lookup_cache(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), token=MagicMock(), lookup_cache_ttl=60
+        )
+        dashboard: Dashboard = Dashboard(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = self._get_the_import_response
+
+        with tempfile.TemporaryDirectory() as directory:
+            self._write_the_import_source(os.path.join(directory, "source"))
+
+            with zipfile.ZipFile(os.path.join(directory, "source.zip"), "w") as archive:
+                for path in ["a.json", "f/b.json", "general/c.json"]:
+                    archive.write(os.path.join(directory, "source", path), path)
+
+            dashboard.import_dashboards(os.path.join(directory, "source.zip"))
+            call_the_api_mock.reset_mock()
+
+            self.assertEqual(
+                dict({"created": 0, "updated": 0, "unchanged": 3}),
+                dashboard.import_dashboards(os.path.join(directory, "source.zip")),
+            )
+            call_the_api_mock.assert_not_called()
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_import_dashboards_after_restore(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), token=MagicMock(), lookup_cache_ttl=60
+        )
+        dashboard: Dashboard = Dashboard(grafana_api_model=model)
+
+        with tempfile.TemporaryDirectory() as directory:
+            self._write_the_import_source(directory)
+
+            for restore, fetched_uids in [
+                (
+                    lambda: dashboard.restore_dashboard_version_by_uid(
+                        "b", dict({"version": 1})
+                    ),
+                    ["b"],
+                ),
+                (
+                    lambda: dashboard.restore_dashboard_version(
+                        2, dict({"version": 1})
+                    ),
+                    ["a", "b", "c"],
+                ),
+            ]:
+                call_the_api_mock.side_effect = self._get_the_import_response
+                dashboard.import_dashboards(directory)
+
+                call_the_api_mock.side_effect = None
+                call_the_api_mock.return_value = dict({"status": "success"})
+                restore()
+
+                call_the_api_mock.reset_mock()
+                call_the_api_mock.side_effect = self._get_the_import_response
+                dashboard.import_dashboards(directory)
+
+                self.assertEqual(
+                    [
+                        f"{APIEndpoints.DASHBOARDS.value}/uid/{uid}"
+                        for uid in fetched_uids
+                    ],
+                    sorted(
+                        call.args[0]
+                        for call in call_the_api_mock.call_args_list
+                        if len(call.args) == 1
+                    ),
+                )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_import_dashboards_tar(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        dashboard: Dashboard = Dashboard(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = self._get_the_import_response
+
+        with tempfile.TemporaryDirectory() as directory:
+            self._write_the_import_source(os.path.join(directory, "source"))
+
+            with tarfile.open(os.path.join(directory, "source.tgz"), "w:gz") as archive:
+                archive.add(os.path.join(directory, "source"), "")
+
+            self.assertEqual(
+                dict({"created": 1, "updated": 1, "unchanged": 1}),
+                dashboard.import_dashboards(os.path.join(directory, "source.tgz")),
+            )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_import_dashboards_failed_dashboard(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        dashboard: Dashboard = Dashboard(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = self._get_the_import_response
+
+        with tempfile.TemporaryDirectory() as directory:
+            self._write_the_import_source(directory)
+
+            with open(os.path.join(directory, "d.json"), "w") as file:
+                json.dump({"title": "no uid"}, file)
+
+            with self.assertRaises(Exception):
+                dashboard.import_dashboards(directory)
+
+        self.assertEqual(
+            2,
+            len(
+                [
+                    call
+                    for call in call_the_api_mock.call_args_list
+                    if len(call.args) > 2
+                ]
+            ),
+        )
+
+    def test_import_dashboards_no_source(self):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        dashboard: Dashboard = Dashboard(grafana_api_model=model)
+
+        with self.assertRaises(ValueError):
+            dashboard.import_dashboards("")
+
+    def test_get_dashboard_hash(self):
+        self.assertEqual(
+            Dashboard.get_dashboard_hash({"uid": "a", "b": [1, 2], "version": 1}),
+            Dashboard.get_dashboard_hash({"b": [1, 2], "uid": "a", "id": 3}),
+        )
+        self.assertNotEqual(
+            Dashboard.get_dashboard_hash({"uid": "a"}),
+            Dashboard.get_dashboard_hash({"uid": "a"}, "f"),
+        )
+        self.assertNotEqual(
+            Dashboard.get_dashboard_hash({"b": [1, 2]}),
+            Dashboard.get_dashboard_hash({"b": [2, 1]}),
+        )
+
+    @staticmethod
+    def _get_the_version_response(api_call: str) -> any:
+        uid: str = api_call.split("/uid/", 1)[1].split("/", 1)[0]
+
+        if "?" in api_call:
+            start: int = int(api_call.rsplit("start=", 1)[1])
+            versions: list = [
+                {"version": version, "uid": uid} for version in range(5, 0, -1)
+            ][start : start + 2]
+
+            return versions if uid == "a" else dict({"versions": versions})
+
+        version: int = int(api_call.rsplit("/", 1)[1])
+
+        return dict(
+            {
+                "uid": uid,
+                "version": version,
+                "data": {"title": uid, "version": version, "panels": version // 2},
+            }
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_iter_dashboard_versions(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        dashboard: Dashboard = Dashboard(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = self._get_the_version_response
+
+        versions: list = list(
+            dashboard.iter_dashboard_versions(["a", "b"], page_size=2, concurrency=3)
+        )
+
+        self.assertEqual(
+            [("a", 5), ("a", 3), ("a", 1), ("b", 5), ("b", 3), ("b", 1)],
+            [(version["data"]["title"], version["version"]) for version in versions],
+        )
+        self.assertIn(
+            "/api/dashboards/uid/a/versions?limit=2&start=4",
+            [call.args[0] for call in call_the_api_mock.call_args_list],
+        )
+        self.assertEqual(
+            10,
+            len(
+                list(
+                    dashboard.iter_dashboard_versions(
+                        ["a", "b"], page_size=2, deduplicate=False
+                    )
+                )
+            ),
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_iter_dashboard_versions_target(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        dashboard: Dashboard = Dashboard(grafana_api_model=model)
+
+        call_the_api_mock.side_effect = self._get_the_version_response
+
+        with tempfile.TemporaryDirectory() as directory:
+            list(
+                dashboard.iter_dashboard_versions(["a"], page_size=2, target=directory)
+            )
+
+            self.assertEqual(
+                ["1.json", "3.json", "5.json"],
+                sorted(os.listdir(os.path.join(directory, "a"))),
+            )
+
+            with open(os.path.join(directory, "a", "3.json")) as file:
+                self.assertEqual(3, json.load(file)["data"]["version"])
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_iter_dashboard_versions_invalid_output(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        dashboard: Dashboard = Dashboard(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"message": "error"})
+
+        with self.assertRaises(Exception):
+            list(dashboard.iter_dashboard_versions(["a"]))
+
+        call_the_api_mock.side_effect = lambda api_call: (
+            [{"version": 1}] if "?" in api_call else dict({"message": "error"})
+        )
+
+        with self.assertRaises(Exception):
+            list(dashboard.iter_dashboard_versions(["a"]))
+
+        with self.assertRaises(ValueError):
+            list(dashboard.iter_dashboard_versions([]))
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_calculate_local_dashboard_diff(self, call_the_api_mock):
+        self.assertEqual(
+            [{"op": "replace", "path": "/title", "value": "b"}],
+            Dashboard.calculate_local_dashboard_diff(
+                {"title": "a", "version": 1}, {"title": "b", "version": 2}
+            ),
+        )
+        call_the_api_mock.assert_not_called()
+
     @patch("grafana_api.api.Api.call_the_api")
     def test_get_dashboard_by_uid(self, call_the_api_mock):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
@@ -0,0 +1,187 @@
+import copy
+import random
+from unittest import TestCase
+
+from grafana_api.dashboard_diff import diff_dashboards, patch_dashboard
+
+
+class DashboardDiffTestCase(TestCase):
+    @staticmethod
+    def _create_the_dashboard(panels: int) -> dict:
+        return dict(
+            {
+                "id": 1,
+                "uid": "test",
+                "title": "Test",
+                "version": 3,
+                "iteration": 123,
+                "tags": ["a", "b"],
+                "panels": [
+                    {
+                        "id": i,
+                        "type": "timeseries",
+                        "title": f"Panel {i}",
+                        "gridPos": {"h": 8, "w": 12, "x": 0, "y": i * 8},
+                        "targets": [{"refId": "A", "expr": f"metric_{i}"}],
+                    }
+                    for i in range(panels)
+                ],
+            }
+        )
+
+    def test_diff_dashboards_volatile_fields(self):
+        base: dict = self._create_the_dashboard(3)
+        new: dict = dict(base, id=2, version=4, iteration=456)
+
+        self.assertEqual([], diff_dashboards(base, new))
+        self.assertEqual(
+            [
+                {"op": "replace", "path": "/id", "value": 2},
+                {"op": "replace", "path": "/version", "value": 4},
+                {"op": "replace", "path": "/iteration", "value": 456},
+            ],
+            diff_dashboards(base, new, ignored_fields=()),
+        )
+
+    def test_diff_dashboards_panels(self):
+        base: dict = self._create_the_dashboard(3)
+        new: dict = copy.deepcopy(base)
+        new["panels"] = [new["panels"][2], new["panels"][0]]
+        new["panels"][0]["title"] = "Changed"
+        new["panels"].append({"id": 7, "type": "stat"})
+
+        self.assertEqual(
+            [
+                {"op": "remove", "path": "/panels/1"},
+                {"op": "move", "from": "/panels/1", "path": "/panels/0"},
+                {"op": "replace", "path": "/panels/0/title", "value": "Changed"},
+                {"op": "add", "path": "/panels/2", "value": {"id": 7, "type": "stat"}},
+            ],
+            diff_dashboards(base, new),
+        )
+        self.assertEqual(new, patch_dashboard(base, diff_dashboards(base, new)))
+
+    def test_diff_dashboards_panels_grid_pos(self):
+        base: dict = {"panels": [{"gridPos": {"x": 0, "y": 0}, "title": "a"}]}
+        new: dict = {
+            "panels": [
+                {"gridPos": {"x": 0, "y": 1}, "title": "b"},
+                {"gridPos": {"x": 0, "y": 0}, "title": "c"},
+            ]
+        }
+
+        self.assertEqual(
+            [
+                {
+                    "op": "add",
+                    "path": "/panels/0",
+                    "value": {"gridPos": {"x": 0, "y": 1}, "title": "b"},
+                },
+                {"op": "replace", "path": "/panels/1/title", "value": "c"},
+            ],
+            diff_dashboards(base, new),
+        )
+
+    def test_diff_dashboards_escaped_keys_and_types(self):
+        base: dict = {"a/b": 1, "c~d": [1, 2, 3], "e": 1, "f": {"g": 1}}
+        new: dict = {"a/b": 2, "c~d": [1], "e": True, "h": None}
+
+        self.assertEqual(
+            [
+                {"op": "replace", "path": "/a~1b", "value": 2},
+                {"op": "remove", "path": "/c~0d/2"},
+                {"op": "remove", "path": "/c~0d/1"},
+                {"op": "replace", "path": "/e", "value": True},
+                {"op": "remove", "path": "/f"},
+                {"op": "add", "path": "/h", "value": None},
+            ],
+            diff_dashboards(base, new),
+        )
+        self.assertEqual(new, patch_dashboard(base, diff_dashboards(base, new)))
+
+    def test_diff_dashboards_nested_type_changes(self):
+        for base, new in [
+            ({"a": {"b": True}}, {"a": {"b": 1}}),
+            ({"a": [1, 2]}, {"a": [1.0, 2]}),
+            ({"a": {"b": [False]}}, {"a": {"b": [0]}}),
+        ]:
+            with self.subTest(base=base, new=new):
+                patch: list = diff_dashboards(base, new, ignored_fields=())
+                result: dict = patch_dashboard(base, patch)
+
+                self.assertEqual(1, len(patch))
+                self.assertEqual(repr(new), repr(result))
+
+        self.assertEqual(
+            list(), diff_dashboards({"a": [1, {"b": 1.5}]}, {"a": [1, {"b": 1.5}]})
+        )
+
+    def test_diff_dashboards_random_round_trip(self):
+        generator: random.Random = random.Random(1)
+
+        for _ in range(200):
+            base: dict = self._create_the_dashboard(generator.randint(0, 8))
+            new: dict = copy.deepcopy(base)
+            generator.shuffle(new["panels"])
+
+            for panel in list(new["panels"]):
+                action: int = generator.randint(0, 4)
+
+                if action == 0:
+                    new["panels"].remove(panel)
+                elif action == 1:
+                    panel["targets"].append({"refId": "B"})
+                elif action == 2:
+                    panel.pop("title")
+
+            new["panels"].insert(
+                generator.randint(0, len(new["panels"])), {"id": 100, "type": "row"}
+            )
+            new["tags"] = new["tags"][: generator.randint(0, 3)] + ["c"]
+
+            patch: list = diff_dashboards(base, new, ignored_fields=())
+
+            self.assertEqual(new, patch_dashboard(base, patch))
+
+    def test_diff_dashboards_no_dict(self):
+        with self.assertRaises(ValueError):
+            diff_dashboards([], {})
+
+    def test_patch_dashboard(self):
+        dashboard: dict = {"a": [1, 2], "b": {"c": 1}}
+
+        self.assertEqual(
+            {"a": [1, 3, 2, 4], "d": {"c": 1}, "e": {"c": 1}},
+            patch_dashboard(
+                dashboard,
+                [
+                    {"op": "add", "path": "/a/1", "value": 3},
+                    {"op": "add", "path": "/a/-", "value": 4},
+                    {"op": "test", "path": "/b/c", "value": 1},
+                    {"op": "copy", "from": "/b", "path": "/e"},
+                    {"op": "move", "from": "/b", "path": "/d"},
+                ],
+            ),
+        )
+        self.assertEqual({"a": [1, 2], "b": {"c": 1}}, dashboard)
+        self.assertEqual(
+            [1],
+            patch_dashboard(dashboard, [{"op": "replace", "path": "", "value": [1]}]),
+        )
+
+    def test_patch_dashboard_invalid_operations(self):
+        dashboard: dict = {"a": [1, 2], "b": 1}
+
+        for operation in [
+            {"op": "test", "path": "/b", "value": 2},
+            {"op": "remove", "path": "/c"},
+            {"op": "remove", "path": "/a/5"},
+            {"op": "replace", "path": "/a/x", "value": 1},
+            {"op": "add", "path": "/a/5", "value": 1},
+            {"op": "add", "path": "/b/c", "value": 1},
+            {"op": "add", "path": "/c/d", "value": 1},
+            {"op": "add", "path": "c", "value": 1},
+            {"op": "invalid", "path": "/b"},
+        ]:
+            with self.assertRaises(ValueError):
+                patch_dashboard(dashboard, [operation])
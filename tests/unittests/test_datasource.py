@@ -1,8 +1,19 @@
+import time
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
-from grafana_api.model import APIModel, DatasourceQuery, DatasourceCache
-from grafana_api.datasource import Datasource, DatasourceQueryResourceCaching
+from grafana_api.model import (
+    APIModel,
+    APIEndpoints,
+    RequestsMethods,
+    DatasourceQuery,
+    DatasourceCache,
+)
+from grafana_api.datasource import (
+    Datasource,
+    DatasourceQueryResourceCaching,
+    DatasourceRegistry,
+)
 
 
 class DatasourceTestCase(TestCase):
@@ -638,3 +649,192 @@ class DatasourceQueryResourceCachingTestCase(TestCase):
 
         with self.assertRaises(Exception):
             datasource.update_datasource_cache("test", datasource_cache)
+
+
+class DatasourceRegistryTestCase(TestCase):
+    datasources: list = list(
+        [
+            {"id": 1, "uid": "prometheus", "name": "Prometheus"},
+            {"id": 2, "uid": "loki", "name": "Loki"},
+        ]
+    )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_lookups(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), token=MagicMock(), lookup_cache_ttl=60
+        )
+        datasource_registry: DatasourceRegistry = DatasourceRegistry(model)
+
+        call_the_api_mock.return_value = self.datasources
+
+        self.assertEqual(self.datasources[0], datasource_registry.get_by_id(1))
+        self.assertEqual(self.datasources[1], datasource_registry.get_by_uid("loki"))
+        self.assertEqual(
+            self.datasources[0], datasource_registry.get_by_name("Prometheus")
+        )
+        self.assertEqual(2, datasource_registry.get_id_by_name("Loki"))
+        self.assertEqual(
+            "prometheus", datasource_registry.get_uid_by_name("Prometheus")
+        )
+        self.assertEqual(2, len(datasource_registry))
+        self.assertEqual(self.datasources, list(datasource_registry))
+        self.assertEqual(1, call_the_api_mock.call_count)
+
+        datasource_registry.get_by_id(1)["name"] = "Changed"
+
+        self.assertEqual("Prometheus", datasource_registry.get_by_id(1)["name"])
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_lookups_missing_datasource(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), token=MagicMock(), lookup_cache_ttl=60
+        )
+        datasource_registry: DatasourceRegistry = DatasourceRegistry(model)
+
+        call_the_api_mock.return_value = list()
+
+        self.assertIsNone(datasource_registry.get_by_name("Prometheus"))
+        self.assertIsNone(datasource_registry.get_id_by_name("Prometheus"))
+        self.assertIsNone(datasource_registry.get_uid_by_name("Prometheus"))
+        self.assertEqual(0, len(datasource_registry))
+
+        call_the_api_mock.return_value = self.datasources
+
+        self.assertEqual(1, datasource_registry.get_id_by_name("Prometheus"))
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_ttl(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), token=MagicMock(), lookup_cache_ttl=0.01
+        )
+        datasource_registry: DatasourceRegistry = DatasourceRegistry(model)
+
+        call_the_api_mock.return_value = self.datasources
+
+        datasource_registry.get_by_id(1)
+        time.sleep(0.02)
+        datasource_registry.get_by_id(1)
+
+        self.assertEqual(2, call_the_api_mock.call_count)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_refresh(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), token=MagicMock(), lookup_cache_ttl=60
+        )
+        datasource_registry: DatasourceRegistry = DatasourceRegistry(model)
+
+        call_the_api_mock.return_value = self.datasources
+
+        self.assertEqual(datasource_registry, datasource_registry.refresh())
+        datasource_registry.refresh()
+        datasource_registry.get_by_uid("loki")
+
+        self.assertEqual(2, call_the_api_mock.call_count)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_invalidation_by_mutations(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), token=MagicMock(), lookup_cache_ttl=60
+        )
+        datasource: Datasource = Datasource(grafana_api_model=model)
+        datasource_registry: DatasourceRegistry = DatasourceRegistry(model)
+
+        for mutation, message in [
+            (
+                lambda: datasource.create_datasource({"name": "Test"}),
+                "Datasource added",
+            ),
+            (
+                lambda: datasource.update_datasource(1, {"name": "Test"}),
+                "Datasource updated",
+            ),
+            (lambda: datasource.delete_datasource_by_id(1), "Data source deleted"),
+            (
+                lambda: datasource.delete_datasource_by_uid("prometheus"),
+                "Data source deleted",
+            ),
+            (
+                lambda: datasource.delete_datasource_by_name("Prometheus"),
+                "Data source deleted",
+            ),
+        ]:
+            call_the_api_mock.return_value = self.datasources
+            datasource_registry.get_by_id(1)
+            call_the_api_mock.reset_mock()
+
+            call_the_api_mock.return_value = dict({"message": message})
+            mutation()
+
+            call_the_api_mock.return_value = self.datasources
+            datasource_registry.get_by_id(1)
+
+            self.assertEqual(2, call_the_api_mock.call_count)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_lookups_error_response(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), token=MagicMock(), lookup_cache_ttl=60
+        )
+        datasource_registry: DatasourceRegistry = DatasourceRegistry(model)
+
+        call_the_api_mock.return_value = dict({"message": "error"})
+
+        with self.assertRaises(Exception):
+            datasource_registry.get_by_id(1)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_lookups_no_lookup_cache(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource_registry: DatasourceRegistry = DatasourceRegistry(model)
+
+        call_the_api_mock.return_value = self.datasources
+
+        self.assertEqual(self.datasources[0], datasource_registry.get_by_id(1))
+        self.assertEqual(self.datasources[1], datasource_registry.get_by_uid("loki"))
+        self.assertEqual(
+            self.datasources[0], datasource_registry.get_by_name("Prometheus")
+        )
+        self.assertEqual(2, datasource_registry.get_id_by_name("Loki"))
+        self.assertEqual(
+            "prometheus", datasource_registry.get_uid_by_name("Prometheus")
+        )
+        self.assertEqual(2, len(datasource_registry))
+        self.assertEqual(self.datasources, list(datasource_registry))
+        call_the_api_mock.assert_called_once_with(
+            APIEndpoints.DATASOURCES.value, RequestsMethods.GET
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_invalidation_by_mutations_no_lookup_cache(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        datasource: Datasource = Datasource(grafana_api_model=model)
+        datasource_registry: DatasourceRegistry = DatasourceRegistry(model)
+
+        call_the_api_mock.return_value = self.datasources
+        datasource_registry.get_by_id(1)
+
+        call_the_api_mock.return_value = dict({"message": "Datasource added"})
+        datasource.create_datasource({"name": "Test"})
+
+        call_the_api_mock.return_value = self.datasources
+        datasource_registry.get_by_id(1)
+        datasource_registry.get_by_id(2)
+
+        self.assertEqual(3, call_the_api_mock.call_count)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_invalidate(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), token=MagicMock(), lookup_cache_ttl=60
+        )
+        datasource_registry: DatasourceRegistry = DatasourceRegistry(model)
+
+        call_the_api_mock.return_value = self.datasources
+
+        datasource_registry.get_by_id(1)
+        DatasourceRegistry(model).invalidate()
+        datasource_registry.get_by_id(1)
+
+        self.assertEqual(2, call_the_api_mock.call_count)
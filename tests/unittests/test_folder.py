@@ -1,8 +1,8 @@
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
-from grafana_api.model import APIModel
-from grafana_api.folder import Folder
+from grafana_api.model import APIModel, FolderNode
+from grafana_api.folder import Folder, FolderTree
 
 
 class FolderTestCase(TestCase):
@@ -273,16 +273,64 @@ class FolderTestCase(TestCase):
         with self.assertRaises(Exception):
             folder.update_folder_permissions("test", dict({"test": "test"}))
 
-    @patch("grafana_api.folder.Folder.get_all_folder_ids_and_names")
-    def test_get_folder_id_by_dashboard_path(self, all_folder_ids_and_names_mock):
+    @patch("grafana_api.folder.Folder.get_folder_index")
+    def test_get_folder_id_by_dashboard_path(self, folder_index_mock):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
         folder: Folder = Folder(grafana_api_model=model)
 
-        all_folder_ids_and_names_mock.return_value = list([{"title": "test", "id": 12}])
+        folder_index_mock.return_value = dict({"test": {"id": 12, "uid": "abc"}})
         self.assertEqual(
             12, folder.get_folder_id_by_dashboard_path(dashboard_path="test")
         )
 
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_folder_id_by_dashboard_path_lookup_cache(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), token=MagicMock(), lookup_cache_ttl=60
+        )
+        folder: Folder = Folder(grafana_api_model=model)
+
+        call_the_api_mock.return_value = list(
+            [{"title": "test", "id": 12, "uid": "abc"}]
+        )
+
+        for _ in range(3):
+            self.assertEqual(
+                12, folder.get_folder_id_by_dashboard_path(dashboard_path="test")
+            )
+        self.assertEqual(
+            "abc", folder.get_folder_uid_by_dashboard_path(dashboard_path="test")
+        )
+        self.assertEqual(1, call_the_api_mock.call_count)
+
+        call_the_api_mock.return_value = dict({"id": 12})
+        folder.update_folder("test", "abc", overwrite=True)
+        call_the_api_mock.return_value = list(
+            [{"title": "test", "id": 13, "uid": "abc"}]
+        )
+
+        self.assertEqual(
+            13, folder.get_folder_id_by_dashboard_path(dashboard_path="test")
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_folder_id_by_dashboard_path_lookup_cache_miss(self, call_the_api_mock):
+        model: APIModel = APIModel(
+            host=MagicMock(), token=MagicMock(), lookup_cache_ttl=60
+        )
+        folder: Folder = Folder(grafana_api_model=model)
+
+        call_the_api_mock.return_value = list([{"title": "test", "id": 12}])
+        folder.get_folder_id_by_dashboard_path(dashboard_path="test")
+        call_the_api_mock.return_value = list(
+            [{"title": "test", "id": 12}, {"title": "new", "id": 14}]
+        )
+
+        self.assertEqual(
+            14, folder.get_folder_id_by_dashboard_path(dashboard_path="new")
+        )
+        self.assertEqual(2, call_the_api_mock.call_count)
+
     def test_get_folder_id_by_dashboard_path_general_path(self):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
         folder: Folder = Folder(grafana_api_model=model)
@@ -298,19 +346,62 @@ class FolderTestCase(TestCase):
         with self.assertRaises(ValueError):
             folder.get_folder_id_by_dashboard_path(dashboard_path="")
 
-    @patch("grafana_api.folder.Folder.get_all_folder_ids_and_names")
-    def test_get_folder_id_by_dashboard_path_no_title_match(
-        self, all_folder_ids_and_names_mock
-    ):
+    @patch("grafana_api.folder.Folder.get_folder_index")
+    def test_get_folder_id_by_dashboard_path_no_title_match(self, folder_index_mock):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
         folder: Folder = Folder(grafana_api_model=model)
 
-        all_folder_ids_and_names_mock.return_value = list(
-            [{"title": None, "id": "xty13y"}]
-        )
+        folder_index_mock.return_value = dict({None: {"id": "xty13y"}})
         with self.assertRaises(Exception):
             folder.get_folder_id_by_dashboard_path(dashboard_path="test")
 
+    @patch("grafana_api.folder.Folder.get_folder_index")
+    def test_get_folder_uid_by_dashboard_path(self, folder_index_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: Folder = Folder(grafana_api_model=model)
+
+        folder_index_mock.return_value = dict({"test": {"id": 12, "uid": "abc"}})
+
+        self.assertEqual(
+            "abc", folder.get_folder_uid_by_dashboard_path(dashboard_path="test")
+        )
+        self.assertIsNone(
+            folder.get_folder_uid_by_dashboard_path(dashboard_path="General")
+        )
+
+        with self.assertRaises(Exception):
+            folder.get_folder_uid_by_dashboard_path(dashboard_path="other")
+
+        with self.assertRaises(ValueError):
+            folder.get_folder_uid_by_dashboard_path(dashboard_path="")
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_folder_index(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: Folder = Folder(grafana_api_model=model)
+
+        call_the_api_mock.return_value = list(
+            [{"title": "test", "id": 12, "uid": "abc", "type": "dash-folder"}]
+        )
+
+        self.assertEqual(
+            dict({"test": {"id": 12, "uid": "abc"}}), folder.get_folder_index()
+        )
+        self.assertIn(
+            "folderIds=0&type=dash-folder&limit=1000&page=1",
+            call_the_api_mock.call_args.args[0],
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_get_folder_index_invalid_output(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder: Folder = Folder(grafana_api_model=model)
+
+        call_the_api_mock.return_value = dict({"message": "error"})
+
+        with self.assertRaises(Exception):
+            folder.get_folder_index()
+
     @patch("grafana_api.api.Api.call_the_api")
     def test_get_all_folder_ids_and_names(self, call_the_api_mock):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
@@ -323,3 +414,114 @@ class FolderTestCase(TestCase):
         self.assertEqual(
             list([{"title": "test", "id": 12}]), folder.get_all_folder_ids_and_names()
         )
+
+
+class FolderTreeTestCase(TestCase):
+    folders: dict = {
+        None: [{"uid": "team", "id": 1, "title": "team"}],
+        "team": [
+            {"uid": "prod", "id": 2, "title": "prod"},
+            {"uid": "dev", "id": 3, "title": "dev"},
+        ],
+        "prod": [{"uid": "db", "id": 4, "title": "db"}],
+    }
+
+    def _get_the_folders(self, api_call: str) -> list:
+        parent_uid: str = None
+
+        if "parentUid=" in api_call:
+            parent_uid = api_call.split("parentUid=", 1)[1].split("&", 1)[0]
+
+        return self.folders.get(parent_uid, list())
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_lookups(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder_tree: FolderTree = FolderTree(model)
+
+        call_the_api_mock.side_effect = self._get_the_folders
+
+        self.assertEqual(4, len(folder_tree))
+        self.assertIn("db", folder_tree)
+        self.assertEqual("db", folder_tree.resolve("team/prod/db"))
+        self.assertEqual("prod", folder_tree.resolve("/team/prod/"))
+        self.assertIsNone(folder_tree.resolve("team/test"))
+        self.assertEqual("team/prod/db", folder_tree.get_path("db"))
+        self.assertIsNone(folder_tree.get_path("test"))
+        self.assertEqual("prod", folder_tree.get("db").parent_uid)
+        self.assertEqual(
+            ["prod", "team"], [node.uid for node in folder_tree.get_ancestors("db")]
+        )
+        self.assertEqual(
+            ["prod", "db", "dev"],
+            [node.uid for node in folder_tree.get_descendants("team")],
+        )
+        self.assertEqual(
+            ["prod", "dev"], [node.uid for node in folder_tree.get_children("team")]
+        )
+        self.assertTrue(folder_tree.is_ancestor("team", "db"))
+        self.assertFalse(folder_tree.is_ancestor("dev", "db"))
+        self.assertEqual(5, call_the_api_mock.call_count)
+
+        with self.assertRaises(ValueError):
+            folder_tree.resolve("/")
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_update_and_remove(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder_tree: FolderTree = FolderTree(model)
+
+        call_the_api_mock.side_effect = self._get_the_folders
+        folder_tree.refresh()
+
+        folder_tree.update(FolderNode(uid="prod", id=2, title="live", parent_uid="dev"))
+
+        self.assertEqual("db", folder_tree.resolve("team/dev/live/db"))
+        self.assertIsNone(folder_tree.resolve("team/prod"))
+
+        folder_tree.remove("prod")
+        folder_tree.remove("test")
+
+        self.assertEqual(
+            ["team", "dev"], [node.uid for node in folder_tree.get_descendants()]
+        )
+        self.assertIsNone(folder_tree.get("db"))
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_refresh_subtree(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder_tree: FolderTree = FolderTree(model)
+
+        call_the_api_mock.side_effect = self._get_the_folders
+        folder_tree.refresh()
+        self.folders = dict(
+            self.folders, prod=[{"uid": "cache", "id": 5, "title": "cache"}]
+        )
+        call_the_api_mock.reset_mock()
+        folder_tree.refresh("prod")
+
+        self.assertEqual("cache", folder_tree.resolve("team/prod/cache"))
+        self.assertIsNone(folder_tree.get("db"))
+        self.assertEqual(2, call_the_api_mock.call_count)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_refresh_no_nested_folders(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder_tree: FolderTree = FolderTree(model)
+
+        call_the_api_mock.return_value = self.folders["team"]
+
+        self.assertEqual(
+            ["prod", "dev"], [node.uid for node in folder_tree.get_descendants()]
+        )
+        self.assertEqual(3, call_the_api_mock.call_count)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_refresh_invalid_output(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        folder_tree: FolderTree = FolderTree(model)
+
+        call_the_api_mock.return_value = dict({"message": "error"})
+
+        with self.assertRaises(Exception):
+            folder_tree.resolve("team")
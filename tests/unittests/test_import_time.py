@@ -0,0 +1,100 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+import grafana_api
+
+
+class ImportTimeTestCase(TestCase):
+    root_directory: str = os.path.dirname(os.path.dirname(grafana_api.__file__))
+
+    def _import(self, statement: str) -> dict:
+        """The method includes a functionality to execute an import statement inside a fresh interpreter with the importtime option
+
+        Args:
+            statement (str): Specify the import statement
+
+        Returns:
+            modules (dict): Returns the imported modules and the corresponding cumulative import time in microseconds
+        """
+
+        result: subprocess.CompletedProcess = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            cwd=self.root_directory,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        modules: dict = dict()
+
+        for line in result.stderr.splitlines():
+            if line.startswith("import time:") and "|" in line:
+                _, cumulative, module = line.split("|")
+
+                if cumulative.strip().isdigit():
+                    modules[module.strip()] = int(cumulative)
+
+        return modules
+
+    def test_import_package(self):
+        modules: dict = self._import("import grafana_api")
+
+        self.assertNotIn("grafana_api.model", modules)
+        self.assertNotIn("httpx", modules)
+        self.assertNotIn("asyncio", modules)
+        self.assertLess(modules["grafana_api"], 50_000)
+
+    def test_import_model(self):
+        modules: dict = self._import("import grafana_api.model")
+
+        self.assertNotIn("httpx", modules)
+        self.assertNotIn("asyncio", modules)
+        self.assertNotIn("ssl", modules)
+        self.assertLess(modules["grafana_api.model"], 200_000)
+
+    def test_import_domain_class(self):
+        modules: dict = self._import("from grafana_api import Dashboard")
+
+        self.assertIn("grafana_api.api", modules)
+        self.assertNotIn("httpx", modules)
+        self.assertNotIn("ssl", modules)
+        self.assertNotIn("tarfile", modules)
+        self.assertNotIn("grafana_api.search", modules)
+        self.assertNotIn("grafana_api.dashboard_diff", modules)
+        self.assertNotIn("asyncio", modules)
+        self.assertNotIn("grafana_api.asynchronous", modules)
+        self.assertNotIn("grafana_api.datasource", modules)
+
+    def test_import_all_domain_classes(self):
+        domain_classes: list = sorted(
+            [
+                name
+                for name, module_name in grafana_api._LAZY_ATTRIBUTES.items()
+                if name[0].isupper()
+                and module_name not in ("model", "api", "codec", "asynchronous")
+            ]
+            + list(grafana_api._LAZY_ALIASES)
+        )
+
+        for domain_class in domain_classes:
+            with self.subTest(domain_class=domain_class):
+                modules: dict = self._import(f"from grafana_api import {domain_class}")
+
+                self.assertNotIn("httpx", modules)
+                self.assertNotIn("ssl", modules)
+                self.assertNotIn("asyncio", modules)
+
+
+class LazyAttributesTestCase(TestCase):
+    def test_lazy_attributes(self):
+        from grafana_api.dashboard import Dashboard
+        from grafana_api.legacy_alerting import Alerting
+
+        self.assertIs(Dashboard, grafana_api.Dashboard)
+        self.assertIs(Alerting, grafana_api.LegacyAlerting)
+        self.assertIn("AsyncDashboard", dir(grafana_api))
+
+    def test_lazy_attributes_no_valid_attribute(self):
+        with self.assertRaises(AttributeError):
+            grafana_api.Test
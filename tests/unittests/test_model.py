@@ -1,7 +1,9 @@
 from unittest import TestCase
+from unittest.mock import MagicMock
 
 from grafana_api.model import (
     APIModel,
+    APIStatistics,
     RequestsMethods,
     APIEndpoints,
     DatasourceQuery,
@@ -37,6 +39,57 @@ class APIModelTestCase(TestCase):
         self.assertEqual("test", model.username)
         self.assertEqual("test", model.password)
 
+    def test_api_model_close(self):
+        model = APIModel(host="test", token="test")
+        http_client = MagicMock()
+        model._http_client = http_client
+
+        model.close()
+
+        http_client.close.assert_called_once()
+        self.assertIsNone(model._http_client)
+
+    def test_api_model_context_manager(self):
+        http_client = MagicMock()
+
+        with APIModel(host="test", token="test") as model:
+            model._http_client = http_client
+
+        http_client.close.assert_called_once()
+        self.assertIsNone(model._http_client)
+
+    def test_api_model_get_the_ssl_context(self):
+        model: APIModel = APIModel(host="test", token="test")
+
+        self.assertIsNone(model.ssl_context)
+        self.assertIs(
+            model.get_the_ssl_context(),
+            APIModel(host="test", token="test").get_the_ssl_context(),
+        )
+        self.assertIsNot(
+            model.get_the_ssl_context(),
+            APIModel(
+                host="test", token="test", http2_support=True
+            ).get_the_ssl_context(),
+        )
+
+    def test_api_model_get_the_ssl_context_custom(self):
+        ssl_context: MagicMock = MagicMock()
+        model: APIModel = APIModel(host="test", token="test", ssl_context=ssl_context)
+
+        self.assertIs(ssl_context, model.get_the_ssl_context())
+
+
+class APIStatisticsTestCase(TestCase):
+    def test_api_statistics_increment(self):
+        statistics = APIStatistics()
+
+        statistics.increment("retries")
+        statistics.increment("requests", 3)
+
+        self.assertEqual(1, statistics.retries)
+        self.assertEqual(3, statistics.requests)
+
 
 class DatasourceQueryTestCase(TestCase):
     def test_datasource_query_init(self):
@@ -83,6 +83,36 @@ class OtherHTTPTestCase(TestCase):
 
         self.assertEqual("test", other_http.get_metrics())
 
+    @patch("httpx.Client")
+    def test_stream_metrics(self, httpx_client_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        other_http: OtherHTTP = OtherHTTP(grafana_api_model=model)
+
+        response: MagicMock = (
+            httpx_client_mock.return_value.stream.return_value.__enter__.return_value
+        )
+        response.is_error = False
+        response.iter_lines.return_value = iter(["# HELP test", "test 1"])
+
+        self.assertEqual(
+            ["# HELP test", "test 1"], list(other_http.stream_metrics("test", "test"))
+        )
+        httpx_client_mock.return_value.close.assert_called_once()
+
+    @patch("httpx.Client")
+    def test_stream_metrics_no_valid_result(self, httpx_client_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        other_http: OtherHTTP = OtherHTTP(grafana_api_model=model)
+
+        response: MagicMock = (
+            httpx_client_mock.return_value.stream.return_value.__enter__.return_value
+        )
+        response.is_error = True
+
+        with self.assertRaises(Exception):
+            list(other_http.stream_metrics())
+        httpx_client_mock.return_value.close.assert_called_once()
+
     @patch("httpx.Client")
     def test_get_metrics_basic_auth(self, httpx_client_mock):
         model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
@@ -0,0 +1,148 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from grafana_api.model import APIModel, PermissionDiff, RequestsMethods
+from grafana_api.permission_reconciler import PermissionReconciler
+
+
+class PermissionReconcilerTestCase(TestCase):
+    permissions: dict = {
+        "/api/dashboards/uid/same/permissions": [
+            {"role": "Viewer", "permission": 1},
+            {"teamId": 2, "userId": 0, "permission": 2},
+        ],
+        "/api/dashboards/uid/changed/permissions": [
+            {"role": "Viewer", "permission": 1, "inherited": True},
+            {"role": "Editor", "permission": 2},
+            {"userId": 11, "permission": 4},
+        ],
+        "/api/folders/folder/permissions": [],
+    }
+
+    def _call_the_api(
+        self,
+        api_call: str,
+        method: RequestsMethods = RequestsMethods.GET,
+        json_complete: dict = None,
+    ) -> any:
+        if method == RequestsMethods.POST:
+            if api_call.startswith("/api/folders"):
+                return dict({"message": "Folder permissions updated"})
+
+            return dict({"message": "Dashboard permissions updated"})
+
+        return self.permissions.get(api_call, dict({"message": "Not found"}))
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_reconcile(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        permission_reconciler: PermissionReconciler = PermissionReconciler(model)
+
+        call_the_api_mock.side_effect = self._call_the_api
+
+        permission_diffs: list = permission_reconciler.reconcile(
+            dashboards=dict(
+                {
+                    "same": [
+                        {"teamId": 2, "permission": 2},
+                        {"role": "Viewer", "permission": 1},
+                    ],
+                    "changed": [
+                        {"role": "Editor", "permission": 1},
+                        {"teamId": 3, "permission": 1},
+                    ],
+                }
+            ),
+            folders=dict({"folder": [{"role": "Viewer", "permission": 1}]}),
+        )
+
+        self.assertEqual(
+            [
+                PermissionDiff("same", "dashboard"),
+                PermissionDiff(
+                    "changed",
+                    "dashboard",
+                    added=[{"teamId": 3, "permission": 1}],
+                    removed=[{"userId": 11, "permission": 4}],
+                    changed=[{"role": "Editor", "permission": 1}],
+                    updated=True,
+                ),
+                PermissionDiff(
+                    "folder",
+                    "folder",
+                    added=[{"role": "Viewer", "permission": 1}],
+                    updated=True,
+                ),
+            ],
+            permission_diffs,
+        )
+        self.assertEqual(
+            [
+                (
+                    "/api/dashboards/uid/changed/permissions",
+                    {
+                        "items": [
+                            {"role": "Editor", "permission": 1},
+                            {"teamId": 3, "permission": 1},
+                        ]
+                    },
+                ),
+                (
+                    "/api/folders/folder/permissions",
+                    {"items": [{"role": "Viewer", "permission": 1}]},
+                ),
+            ],
+            [
+                (call.args[0], call.args[2])
+                for call in call_the_api_mock.call_args_list
+                if len(call.args) > 1 and call.args[1] == RequestsMethods.POST
+            ],
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_reconcile_dry_run(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        permission_reconciler: PermissionReconciler = PermissionReconciler(model)
+
+        call_the_api_mock.side_effect = self._call_the_api
+
+        permission_diffs: list = permission_reconciler.reconcile(
+            folders=dict({"folder": [{"role": "Viewer", "permission": 1}]}),
+            dry_run=True,
+        )
+
+        self.assertTrue(permission_diffs[0].changes)
+        self.assertFalse(permission_diffs[0].updated)
+        self.assertEqual(1, call_the_api_mock.call_count)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_reconcile_error_response(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        permission_reconciler: PermissionReconciler = PermissionReconciler(model)
+
+        call_the_api_mock.side_effect = self._call_the_api
+
+        with self.assertRaises(Exception):
+            permission_reconciler.reconcile(
+                dashboards=dict(
+                    {
+                        "unknown": [{"role": "Viewer", "permission": 1}],
+                        "same": [{"role": "Viewer", "permission": 1}],
+                    }
+                )
+            )
+
+        self.assertEqual(3, call_the_api_mock.call_count)
+
+    def test_reconcile_no_resources(self):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        permission_reconciler: PermissionReconciler = PermissionReconciler(model)
+
+        with self.assertRaises(ValueError):
+            permission_reconciler.reconcile()
+
+    def test_calculate_permission_diff_no_principal(self):
+        with self.assertRaises(ValueError):
+            PermissionReconciler.calculate_permission_diff(
+                "uid", "dashboard", list(), [{"permission": 1}]
+            )
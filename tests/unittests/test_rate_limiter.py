@@ -0,0 +1,202 @@
+import asyncio
+import threading
+import time
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from grafana_api.model import APIEndpoints, RateLimit
+from grafana_api.rate_limiter import RateLimiter, TokenBucket
+
+
+class TokenBucketTestCase(TestCase):
+    @patch("time.monotonic")
+    def test_reserve(self, monotonic_mock):
+        monotonic_mock.return_value = 100.0
+        token_bucket: TokenBucket = TokenBucket(requests_per_second=2, burst=2)
+
+        self.assertEqual(0.0, token_bucket.reserve())
+        self.assertEqual(0.0, token_bucket.reserve())
+        self.assertEqual(0.5, token_bucket.reserve())
+        self.assertEqual(1.0, token_bucket.reserve())
+
+    @patch("time.monotonic")
+    def test_reserve_refill(self, monotonic_mock):
+        monotonic_mock.return_value = 100.0
+        token_bucket: TokenBucket = TokenBucket(requests_per_second=2, burst=1)
+
+        self.assertEqual(0.0, token_bucket.reserve())
+
+        monotonic_mock.return_value = 110.0
+
+        self.assertEqual(0.0, token_bucket.reserve())
+        self.assertEqual(0.5, token_bucket.reserve())
+
+
+class RateLimiterTestCase(TestCase):
+    def test_get_the_limiters(self):
+        rate_limiter: RateLimiter = RateLimiter(
+            RateLimit(
+                requests_per_second=10,
+                endpoint_limits={
+                    "/api": RateLimit(requests_per_second=5),
+                    APIEndpoints.DASHBOARDS: RateLimit(requests_per_second=1),
+                },
+            )
+        )
+
+        limiters: list = rate_limiter.get_the_limiters("/api/dashboards/uid/test")
+
+        self.assertEqual(2, len(limiters))
+        self.assertEqual(1, limiters[1].rate_limit.requests_per_second)
+        self.assertEqual(
+            5,
+            rate_limiter.get_the_limiters("/api/search")[
+                1
+            ].rate_limit.requests_per_second,
+        )
+        self.assertEqual([rate_limiter], rate_limiter.get_the_limiters("/metrics"))
+
+    @patch("time.sleep")
+    def test_limit(self, sleep_mock):
+        rate_limiter: RateLimiter = RateLimiter(
+            RateLimit(
+                requests_per_second=1000,
+                endpoint_limits={APIEndpoints.SEARCH: RateLimit(requests_per_second=1)},
+            )
+        )
+
+        with rate_limiter.limit("/api/search") as wait:
+            self.assertEqual(0.0, wait)
+
+        with rate_limiter.limit("/api/search") as wait:
+            self.assertGreater(wait, 0.9)
+
+        sleep_mock.assert_called_once_with(wait)
+
+    def test_limit_max_in_flight(self):
+        rate_limiter: RateLimiter = RateLimiter(RateLimit(max_in_flight=2))
+        in_flight: list = [0, 0]
+        lock: threading.Lock = threading.Lock()
+
+        def _call():
+            with rate_limiter.limit("/api/search"):
+                with lock:
+                    in_flight[0] += 1
+                    in_flight[1] = max(in_flight)
+                time.sleep(0.01)
+                with lock:
+                    in_flight[0] -= 1
+
+        threads: list = [threading.Thread(target=_call) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(2, in_flight[1])
+
+    def test_async_limit_max_in_flight(self):
+        rate_limiter: RateLimiter = RateLimiter(
+            RateLimit(
+                requests_per_second=1000,
+                burst=1000,
+                endpoint_limits={APIEndpoints.SEARCH: RateLimit(max_in_flight=1)},
+            )
+        )
+        in_flight: list = [0, 0]
+
+        async def _call():
+            async with rate_limiter.async_limit("/api/search"):
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+                await asyncio.sleep(0.01)
+                in_flight[0] -= 1
+
+        async def _gather():
+            await asyncio.gather(*[_call() for _ in range(4)])
+
+        asyncio.run(_gather())
+
+        self.assertEqual(1, in_flight[1])
+
+    def test_limit_max_in_flight_shared_by_threads_and_event_loops(self):
+        rate_limiter: RateLimiter = RateLimiter(RateLimit(max_in_flight=1))
+        in_flight: list = [0, 0]
+        lock: threading.Lock = threading.Lock()
+
+        def _enter():
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+
+        def _exit():
+            with lock:
+                in_flight[0] -= 1
+
+        def _call():
+            with rate_limiter.limit("/api/search"):
+                _enter()
+                time.sleep(0.01)
+                _exit()
+
+        async def _async_call():
+            async with rate_limiter.async_limit("/api/search"):
+                _enter()
+                await asyncio.sleep(0.01)
+                _exit()
+
+        async def _gather():
+            await asyncio.gather(*[_async_call() for _ in range(4)])
+
+        threads: list = [threading.Thread(target=_call) for _ in range(4)] + [
+            threading.Thread(target=asyncio.run, args=(_gather(),)) for _ in range(2)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, in_flight[1])
+        self.assertEqual(0, rate_limiter._in_flight._in_flight)
+
+    def test_async_limit_max_in_flight_cancelled(self):
+        rate_limiter: RateLimiter = RateLimiter(RateLimit(max_in_flight=1))
+
+        async def _call():
+            async with rate_limiter.async_limit("/api/search"):
+                await asyncio.sleep(0.01)
+
+        async def _cancel():
+            first: asyncio.Task = asyncio.create_task(_call())
+            second: asyncio.Task = asyncio.create_task(_call())
+            await asyncio.sleep(0)
+            second.cancel()
+            await asyncio.gather(first, second, return_exceptions=True)
+            await _call()
+
+        asyncio.run(_cancel())
+
+        self.assertEqual(0, rate_limiter._in_flight._in_flight)
+        self.assertEqual(0, len(rate_limiter._in_flight._waiters))
+
+
+class RateLimitTestCase(TestCase):
+    def test_rate_limit_no_valid_values(self):
+        for values in (
+            dict({"requests_per_second": 0}),
+            dict({"requests_per_second": -1}),
+            dict({"burst": 0}),
+            dict({"max_in_flight": 0}),
+        ):
+            with self.subTest(values=values):
+                with self.assertRaises(ValueError):
+                    RateLimit(**values)
+
+        self.assertEqual(
+            0.5, RateLimit(requests_per_second=0.5, burst=1).requests_per_second
+        )
@@ -1,8 +1,8 @@
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
-from grafana_api.model import APIModel
-from grafana_api.search import Search
+from grafana_api.model import APIModel, SearchHit
+from grafana_api.search import Search, SearchIndex
 
 
 class SearchTestCase(TestCase):
@@ -34,3 +34,200 @@ class SearchTestCase(TestCase):
 
         with self.assertRaises(Exception):
             search.search(search_query=MagicMock())
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_iter_search(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        search: Search = Search(grafana_api_model=model)
+        pages: dict = {
+            1: [{"id": 1, "uid": "a", "title": "A", "type": "dash-db"}] * 2,
+            2: [{"id": 2, "uid": "b", "title": "B", "folderUid": "f"}] * 2,
+            3: [{"id": 3, "uid": "c", "title": "C", "isStarred": True}],
+        }
+
+        call_the_api_mock.side_effect = lambda api_call: pages.get(
+            int(api_call.rsplit("page=", 1)[1]), list()
+        )
+
+        hits: list = list(
+            search.iter_search(
+                query="test",
+                type="dash-db",
+                tags=["x", "y"],
+                folder_uids=["f"],
+                page_size=2,
+            )
+        )
+
+        self.assertEqual(["a", "a", "b", "b", "c"], [hit.uid for hit in hits])
+        self.assertIsInstance(hits[0], SearchHit)
+        self.assertEqual("f", hits[2].folder_uid)
+        self.assertTrue(hits[4].is_starred)
+        self.assertIn(
+            "/api/search?query=test&type=dash-db&tag=x&tag=y&folderUIDs=f&limit=2&page=1",
+            [call.args[0] for call in call_the_api_mock.call_args_list],
+        )
+        self.assertLessEqual(call_the_api_mock.call_count, 5)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_iter_search_lazy(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        search: Search = Search(grafana_api_model=model)
+
+        call_the_api_mock.return_value = [{"id": 1, "uid": "a", "title": "A"}]
+
+        hits = search.iter_search(page_size=1, prefetch=1)
+
+        self.assertEqual("a", next(hits).uid)
+        self.assertEqual("a", next(hits).uid)
+        hits.close()
+
+        self.assertLessEqual(call_the_api_mock.call_count, 4)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_iter_search_no_valid_page_size(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        search: Search = Search(grafana_api_model=model)
+
+        for page_size in (-1, 0, 5001, 10000):
+            with self.assertRaises(ValueError):
+                list(search.iter_search(page_size=page_size))
+
+        call_the_api_mock.assert_not_called()
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_iter_search_max_page_size(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        search: Search = Search(grafana_api_model=model)
+
+        call_the_api_mock.return_value = list([{"uid": "a", "id": 1, "title": "a"}])
+
+        self.assertEqual(1, len(list(search.iter_search(page_size=5000))))
+        self.assertIn("limit=5000", call_the_api_mock.call_args.args[0])
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_iter_search_invalid_output(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        search: Search = Search(grafana_api_model=model)
+
+        call_the_api_mock.return_value = {"message": "error"}
+
+        with self.assertRaises(Exception):
+            list(search.iter_search())
+
+
+class SearchIndexTestCase(TestCase):
+    hits: list = [
+        {"id": 1, "uid": "f", "title": "Folder", "type": "dash-folder"},
+        {
+            "id": 2,
+            "uid": "a",
+            "title": "Test",
+            "type": "dash-db",
+            "tags": ["x", "y"],
+            "folderUid": "f",
+        },
+        {"id": 3, "uid": "b", "title": "Test", "type": "dash-db", "tags": ["x"]},
+    ]
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_lookups(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        search_index: SearchIndex = SearchIndex(model, prefetch=0)
+
+        call_the_api_mock.return_value = self.hits
+
+        self.assertEqual(3, len(search_index))
+        self.assertIn("a", search_index)
+        self.assertEqual("Folder", search_index.get("f").title)
+        self.assertEqual("b", search_index.get_by_id(3).uid)
+        self.assertIsNone(search_index.get_by_id(4))
+        self.assertEqual(
+            ["a", "b"], [hit.uid for hit in search_index.find_by_title("Test")]
+        )
+        self.assertEqual(
+            ["a"],
+            [hit.uid for hit in search_index.find_by_title("Test", folder_uid="f")],
+        )
+        self.assertEqual([], search_index.find_by_title("Folder", type="dash-db"))
+        self.assertEqual(
+            ["a"], [hit.uid for hit in search_index.find_by_tags(["y", "x"])]
+        )
+        self.assertEqual([], search_index.find_by_tags([]))
+        self.assertEqual(["f", "b"], [hit.uid for hit in search_index.find_in_folder()])
+        self.assertEqual(["f", "a", "b"], [hit.uid for hit in search_index])
+        self.assertEqual(1, call_the_api_mock.call_count)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_update_and_remove(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        search_index: SearchIndex = SearchIndex(model, prefetch=0)
+
+        call_the_api_mock.return_value = self.hits
+        search_index.refresh()
+
+        search_index.update(
+            SearchHit(id=2, uid="a", title="New", type="dash-db", tags=["z"])
+        )
+        search_index.remove("b")
+        search_index.remove("c")
+
+        self.assertEqual([], search_index.find_by_title("Test"))
+        self.assertEqual(["a"], [hit.uid for hit in search_index.find_by_tags(["z"])])
+        self.assertEqual([], search_index.find_by_tags(["x"]))
+        self.assertEqual([], search_index.find_in_folder("f"))
+        self.assertEqual(1, call_the_api_mock.call_count)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_refresh_invalid_hits(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        search_index: SearchIndex = SearchIndex(model, prefetch=0)
+
+        call_the_api_mock.return_value = self.hits + [
+            {"id": 4, "title": "Test", "type": "dash-db"},
+            {"uid": "c", "title": "Test", "type": "dash-db"},
+            {"id": 5, "uid": "d", "type": "dash-db"},
+        ]
+
+        self.assertEqual(3, len(search_index))
+        self.assertEqual(
+            ["a", "b"], [hit.uid for hit in search_index.find_by_title("Test")]
+        )
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_refresh_folder(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        search_index: SearchIndex = SearchIndex(model, prefetch=0)
+
+        call_the_api_mock.return_value = self.hits
+        search_index.refresh()
+        call_the_api_mock.return_value = [
+            {"id": 4, "uid": "c", "title": "Other", "folderUid": "f"}
+        ]
+        search_index.refresh(folder_uids=["f"])
+
+        self.assertIn("folderUIDs=f", call_the_api_mock.call_args.args[0])
+        self.assertEqual(["c"], [hit.uid for hit in search_index.find_in_folder("f")])
+        self.assertEqual(["f", "b", "c"], [hit.uid for hit in search_index])
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_clear(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        search_index: SearchIndex = SearchIndex(model, prefetch=0)
+
+        call_the_api_mock.return_value = self.hits
+        search_index.refresh()
+        search_index.clear()
+
+        self.assertEqual(3, len(search_index))
+        self.assertEqual(2, call_the_api_mock.call_count)
+
+    @patch("grafana_api.api.Api.call_the_api")
+    def test_refresh_invalid_output(self, call_the_api_mock):
+        model: APIModel = APIModel(host=MagicMock(), token=MagicMock())
+        search_index: SearchIndex = SearchIndex(model, prefetch=0)
+
+        call_the_api_mock.side_effect = Exception
+
+        with self.assertRaises(Exception):
+            search_index.get("a")